@@ -0,0 +1,329 @@
+"""
+Benchmarks: load
+----------------
+
+Gerador de carga da API: executa uma mistura realista de operações
+(abertura de conta, login, depósito, saque, transferência e extrato)
+com vários clientes concorrentes e reporta, por operação, a vazão
+(ops/s) e as latências p50/p95/p99.
+
+Uso (a partir de ``backend/``):
+    # Aplicação no próprio processo (create_app), banco temporário
+    python -m benchmarks.load --duration 20 --concurrency 32
+
+    # Servidor já em execução (ex.: uvicorn em localhost)
+    python -m benchmarks.load --url http://127.0.0.1:8000 --api-key chave
+
+    # Outra mistura de operações; gravar como baseline
+    python -m benchmarks.load --mix deposit=50,statement=50 --save-baseline
+
+Preparação: antes da medição são abertas ``--accounts`` contas, com
+login, saldo inicial e (com uma chave de sistema) limites de saque altos,
+para que os saques não esbarrem no limite diário. No modo em processo a
+chave é gerada automaticamente e o banco é temporário (ou em memória,
+com REPOSITORY_BACKEND=memory); BCRYPT_ROUNDS e as demais configurações
+valem como na aplicação.
+
+Respostas 4xx/5xx contam como erros da operação e não entram nas
+latências.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from .report import Metrics, finish, percentile
+
+BASELINE = Path(__file__).parent / "baselines" / "load.json"
+
+DEFAULT_MIX = "open=2,login=8,deposit=25,withdraw=20,transfer=20,statement=25"
+PASSWORD = "benchmark-senha"
+
+
+@dataclass
+class BenchAccount:
+    account_id: str
+    cpf: str
+    token: str
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Results:
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    statuses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class CpfGenerator:
+    """CPFs válidos e inéditos, a partir de uma base aleatória."""
+
+    def __init__(self):
+        self._next = random.randrange(100_000_000, 900_000_000)
+
+    def __call__(self) -> str:
+        self._next += 1
+        digits = [int(d) for d in f"{self._next:09d}"]
+        for weights in (range(10, 1, -1), range(11, 1, -1)):
+            digits.append(sum(d * w for d, w in zip(digits, weights)) * 10 % 11 % 10)
+        return "".join(map(str, digits))
+
+
+class LoadGenerator:
+    """
+    Executa a mistura de operações contra a API por meio de um
+    ``httpx.AsyncClient`` (ASGI em processo ou HTTP real).
+    """
+
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, int], api_key: Optional[str]):
+        self.client = client
+        self.ops = list(mix)
+        self.weights = list(mix.values())
+        self.api_key = api_key
+        self.cpfs = CpfGenerator()
+        self.accounts: List[BenchAccount] = []
+
+    async def open_account(self) -> BenchAccount:
+        cpf = self.cpfs()
+        r = await self.client.post(
+            "/accounts/",
+            json={"name": "Benchmark", "email": "bench@example.com", "cpf": cpf, "password": PASSWORD},
+        )
+        r.raise_for_status()
+        account_id = r.json()["account_id"]
+
+        r = await self.client.post("/auth/login", json={"cpf": cpf, "password": PASSWORD})
+        r.raise_for_status()
+        return BenchAccount(account_id, cpf, r.json()["token"])
+
+    async def prepare(self, count: int, initial_balance: str) -> None:
+        for _ in range(count):
+            account = await self.open_account()
+            if self.api_key:
+                r = await self.client.put(
+                    f"/accounts/{account.account_id}/limits",
+                    json={"daily_amount": "1000000000.00", "daily_count": 1_000_000_000},
+                    headers={"X-API-Key": self.api_key},
+                )
+                r.raise_for_status()
+            r = await self.client.post(
+                f"/transactions/{account.account_id}/deposit",
+                json={"amount": initial_balance},
+                headers=account.headers,
+            )
+            r.raise_for_status()
+            self.accounts.append(account)
+
+    async def run_operation(self, op: str) -> httpx.Response:
+        account = random.choice(self.accounts)
+        amount = f"{random.randint(1, 10_000) / 100:.2f}"
+
+        if op == "open":
+            cpf = self.cpfs()
+            return await self.client.post(
+                "/accounts/",
+                json={"name": "Benchmark", "email": "bench@example.com", "cpf": cpf, "password": PASSWORD},
+            )
+        if op == "login":
+            return await self.client.post("/auth/login", json={"cpf": account.cpf, "password": PASSWORD})
+        if op == "deposit":
+            return await self.client.post(
+                f"/transactions/{account.account_id}/deposit", json={"amount": amount}, headers=account.headers
+            )
+        if op == "withdraw":
+            return await self.client.post(
+                f"/transactions/{account.account_id}/withdraw", json={"amount": amount}, headers=account.headers
+            )
+        if op == "transfer":
+            target = random.choice(self.accounts)
+            while target is account and len(self.accounts) > 1:
+                target = random.choice(self.accounts)
+            return await self.client.post(
+                f"/transactions/{account.account_id}/transfer",
+                json={"target_account_id": target.account_id, "amount": amount},
+                headers=account.headers,
+            )
+        if op == "statement":
+            return await self.client.get(
+                f"/transactions/{account.account_id}/statement", params={"limit": 50}, headers=account.headers
+            )
+        raise ValueError(f"Operação desconhecida: {op}")
+
+    async def worker(self, deadline: float, results: Optional[Results]) -> None:
+        while time.perf_counter() < deadline:
+            op = random.choices(self.ops, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await self.run_operation(op)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - started
+
+            if results is None:
+                continue
+            if status.startswith("2"):
+                results.latencies[op].append(elapsed)
+            else:
+                results.errors[op] += 1
+                results.statuses[f"{op} {status}"] += 1
+
+    async def run(self, concurrency: int, duration: float, warmup: float) -> Results:
+        if warmup > 0:
+            deadline = time.perf_counter() + warmup
+            await asyncio.gather(*(self.worker(deadline, None) for _ in range(concurrency)))
+
+        results = Results()
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(self.worker(deadline, results) for _ in range(concurrency)))
+        return results
+
+
+def summarize(results: Results, duration: float) -> Metrics:
+    metrics: Metrics = {}
+    everything: List[float] = []
+    total_errors = 0
+
+    for op in sorted(set(results.latencies) | set(results.errors)):
+        latencies = sorted(results.latencies[op])
+        everything.extend(latencies)
+        total_errors += results.errors[op]
+        metrics.update(_latency_metrics(op, latencies, duration))
+        metrics[f"{op}.errors"] = results.errors[op]
+
+    metrics.update(_latency_metrics("total", sorted(everything), duration))
+    metrics["total.errors"] = total_errors
+    return metrics
+
+
+def _latency_metrics(name: str, latencies: List[float], duration: float) -> Metrics:
+    return {
+        f"{name}.ops_per_s": round(len(latencies) / duration, 1),
+        f"{name}.p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        f"{name}.p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        f"{name}.p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        mix[op.strip()] = int(weight)
+    return {op: weight for op, weight in mix.items() if weight > 0}
+
+
+async def _run_in_process(args, mix: Dict[str, int]) -> Results:
+    """
+    Executa a aplicação no próprio processo (ASGI, sem rede), com o
+    lifespan ativo como no servidor.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="bank-load-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp_dir}/load.db"
+    try:
+        # Importada só aqui: o engine é criado a partir de DATABASE_URL
+        from src.api.main import create_app
+        from src.config.settings import settings
+        from src.infrastructure.database.orm import init_db
+
+        api_key = args.api_key or settings.batch_api_keys.split(",")[0].strip()
+        if not api_key:
+            api_key = settings.batch_api_keys = "benchmark"
+        if settings.repository_backend == "sqlite":
+            init_db()
+
+        app = create_app()
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60) as client:
+                return await _drive(client, args, mix, api_key)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+async def _run_remote(args, mix: Dict[str, int]) -> Results:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limits) as client:
+        return await _drive(client, args, mix, args.api_key)
+
+
+async def _drive(client: httpx.AsyncClient, args, mix: Dict[str, int], api_key: Optional[str]) -> Results:
+    generator = LoadGenerator(client, mix, api_key)
+    print(f"Preparando {args.accounts} contas...", file=sys.stderr)
+    await generator.prepare(args.accounts, args.initial_balance)
+    print(
+        f"Carga: {args.concurrency} clientes, {args.duration:.0f}s (+{args.warmup:.0f}s de aquecimento)",
+        file=sys.stderr,
+    )
+    return await generator.run(args.concurrency, args.duration, args.warmup)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Gerador de carga da API bancária.")
+    parser.add_argument("--url", help="URL de um servidor em execução (padrão: aplicação no próprio processo)")
+    parser.add_argument("--api-key", help="chave de sistema (BATCH_API_KEYS), para elevar os limites de saque")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"pesos das operações (padrão: {DEFAULT_MIX})")
+    parser.add_argument("--accounts", type=int, default=50, help="contas preparadas (padrão: 50)")
+    parser.add_argument("--initial-balance", default="1000000.00", help="saldo inicial de cada conta")
+    parser.add_argument("--concurrency", type=int, default=16, help="clientes simultâneos (padrão: 16)")
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos medidos (padrão: 10)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="segundos de aquecimento (padrão: 2)")
+    parser.add_argument("--seed", type=int, help="semente do sorteio das operações")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="arquivo de baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como baseline")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="piora tolerada (padrão: 0.20)")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    mix = parse_mix(args.mix)
+
+    runner = _run_remote if args.url else _run_in_process
+    results = asyncio.run(runner(args, mix))
+
+    for key, count in sorted(results.statuses.items()):
+        print(f"erros {key}: {count}", file=sys.stderr)
+
+    # Configuração da aplicação medida (só conhecida no modo em processo)
+    app_context = {}
+    if not args.url:
+        from src.config.settings import settings
+
+        app_context = {
+            "repository_backend": settings.repository_backend,
+            "async_database": settings.async_database,
+            "bcrypt_rounds": settings.bcrypt_rounds,
+        }
+
+    metrics = summarize(results, args.duration)
+    return finish(
+        metrics,
+        args.baseline,
+        args.save_baseline,
+        args.tolerance,
+        kind="load",
+        target=args.url or "in-process",
+        mix=args.mix,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        accounts=args.accounts,
+        **app_context,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
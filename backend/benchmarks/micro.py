@@ -0,0 +1,189 @@
+"""
+Benchmarks: micro
+-----------------
+
+Micro-benchmarks dos caminhos quentes do domínio e da reidratação de
+contas pelo repositório.
+
+Uso (a partir de ``backend/``):
+    python -m benchmarks.micro                  # compara com o baseline
+    python -m benchmarks.micro --save-baseline  # grava um novo baseline
+    python -m benchmarks.micro -k money         # apenas alguns benchmarks
+
+Cada benchmark é medido com ``timeit``: o número de iterações é
+calibrado para ~0,2 s por rodada e o resultado é o melhor tempo por
+operação (ns/op) entre as rodadas, o menos afetado por ruído.
+
+Os benchmarks de repositório usam um banco SQLite temporário, nunca o
+configurado em DATABASE_URL.
+"""
+
+import argparse
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+# Banco temporário: definido antes de importar a aplicação (o engine é
+# criado na importação de infrastructure.database.orm)
+_TMP_DIR = tempfile.mkdtemp(prefix="bank-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/bench.db"
+atexit.register(shutil.rmtree, _TMP_DIR, True)
+
+from sqlmodel import Session  # noqa: E402
+
+from src.domain.aggregates.account import Account  # noqa: E402
+from src.domain.entities.customer import Customer  # noqa: E402
+from src.domain.services.account_rules import WithdrawalLimits  # noqa: E402
+from src.domain.value_objects import cpf as cpf_module  # noqa: E402
+from src.domain.value_objects.cpf import CPF  # noqa: E402
+from src.domain.value_objects.money import Money  # noqa: E402
+from src.infrastructure.database.models.account_model import AccountModel  # noqa: E402
+from src.infrastructure.database.orm import engine, init_db  # noqa: E402
+from src.infrastructure.repositories.account_repo_memory import InMemoryAccountRepository  # noqa: E402
+from src.infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite  # noqa: E402
+from src.infrastructure.repositories.memory_store import InMemoryStore  # noqa: E402
+from src.shared.utils.cpf_batch import validate_cpfs  # noqa: E402
+
+from .report import finish  # noqa: E402
+
+BASELINE = Path(__file__).parent / "baselines" / "micro.json"
+
+# Benchmark: nome -> (função sem argumentos, operações por chamada)
+Benchmark = Tuple[Callable[[], object], int]
+
+
+def _cpf(n: int) -> str:
+    """CPF válido a partir de um número de 9 dígitos."""
+    digits = [int(d) for d in f"{n:09d}"]
+    for weights in (range(10, 1, -1), range(11, 1, -1)):
+        digits.append(sum(d * w for d, w in zip(digits, weights)) * 10 % 11 % 10)
+    return "".join(map(str, digits))
+
+
+def _customer(n: int = 0) -> Customer:
+    return Customer(name="Cliente", email="cliente@example.com", cpf=CPF(_cpf(100_000_000 + n)))
+
+
+def _account() -> Account:
+    # Limites altos: os saques repetidos não esbarram no limite diário
+    account = Account.open(_customer())
+    account.withdrawal_limits = WithdrawalLimits(Money(10**12), 10**12)
+    account.balance = Money(10**12)
+    return account
+
+
+def money_benchmarks() -> Dict[str, Benchmark]:
+    a, b = Money("1234.56"), Money("0.01")
+    values = [Money(i) for i in range(100)]
+    return {
+        "money.parse_str": (lambda: Money("1234.56"), 1),
+        "money.add": (lambda: a + b, 1),
+        "money.sub": (lambda: a - b, 1),
+        "money.compare": (lambda: a <= b, 1),
+        "money.total_100": (lambda: Money.total(values), 1),
+    }
+
+
+def cpf_benchmarks() -> Dict[str, Benchmark]:
+    digits, formatted = _cpf(529_982_247), "529.982.247-25"
+    batch = [_cpf(100_000_000 + i) for i in range(10_000)]
+    uncached = cpf_module._is_valid.__wrapped__
+    return {
+        "cpf.validate_cached": (lambda: CPF(digits), 1),
+        "cpf.validate_formatted": (lambda: CPF(formatted), 1),
+        "cpf.check_digits_uncached": (lambda: uncached(digits), 1),
+        "cpf.validate_batch_10k": (lambda: validate_cpfs(batch), len(batch)),
+    }
+
+
+def account_benchmarks() -> Dict[str, Benchmark]:
+    account, amount, now = _account(), Money("10.00"), datetime.utcnow()
+    other = _account()
+
+    def deposit():
+        account.deposit(amount, now)
+        # Descarta lançamentos e eventos: a lista não cresce entre iterações
+        account.new_transactions.clear()
+        account.events.clear()
+
+    def withdraw():
+        account.withdraw(amount, now)
+        account.new_transactions.clear()
+        account.events.clear()
+
+    def transfer():
+        account.transfer_to(other, amount, now)
+        account.new_transactions.clear()
+        account.events.clear()
+        other.new_transactions.clear()
+
+    return {
+        "account.deposit": (deposit, 1),
+        "account.withdraw": (withdraw, 1),
+        "account.transfer_to": (transfer, 1),
+        "account.open": (lambda: Account.open(_customer()), 1),
+    }
+
+
+def repository_benchmarks() -> Dict[str, Benchmark]:
+    init_db()
+    sqlite_repo = AccountRepositorySQLite()
+    memory_repo = InMemoryAccountRepository(InMemoryStore())
+
+    ids = {}
+    for name, repo in (("sqlite", sqlite_repo), ("memory", memory_repo)):
+        account = Account.open(_customer(len(ids)))
+        repo.save(account)
+        ids[name] = account.account_id
+
+    # Linha já carregada: mede apenas a conversão para o aggregate
+    with Session(engine) as session:
+        row = session.get(AccountModel, ids["sqlite"])
+        session.expunge(row)
+
+    return {
+        "repo.sqlite_get_by_id": (lambda: sqlite_repo.get_by_id(ids["sqlite"]), 1),
+        "repo.sqlite_to_domain": (lambda: AccountRepositorySQLite.to_domain(row), 1),
+        "repo.memory_get_by_id": (lambda: memory_repo.get_by_id(ids["memory"]), 1),
+    }
+
+
+GROUPS = (money_benchmarks, cpf_benchmarks, account_benchmarks, repository_benchmarks)
+
+
+def measure(fn: Callable[[], object], ops: int, repeat: int) -> float:
+    """Melhor tempo por operação, em nanossegundos."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    # autorange busca ~0,2 s por rodada
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / (number * ops) * 1e9
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks do domínio e dos repositórios.")
+    parser.add_argument("-k", dest="pattern", help="executa apenas benchmarks cujo nome contém o texto")
+    parser.add_argument("--repeat", type=int, default=5, help="rodadas por benchmark (padrão: 5)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="arquivo de baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="piora tolerada (padrão: 0.15)")
+    args = parser.parse_args(argv)
+
+    metrics = {}
+    for group in GROUPS:
+        for name, (fn, ops) in group().items():
+            if args.pattern and args.pattern not in name:
+                continue
+            metrics[f"{name}.ns_per_op"] = round(measure(fn, ops, args.repeat), 1)
+
+    return finish(metrics, args.baseline, args.save_baseline, args.tolerance, kind="micro")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmarks: report
+------------------
+
+Funções compartilhadas pelos benchmarks: percentis, impressão dos
+resultados e comparação com um baseline gravado em JSON.
+
+Cada execução produz um dicionário plano ``{métrica: valor}``. Métricas
+terminadas em ``_per_s`` são "quanto maior, melhor" (vazão); as demais
+(tempos e latências) são "quanto menor, melhor". Uma métrica é
+considerada regressão quando piora mais do que a tolerância em relação
+ao baseline.
+
+Contagens de erros (métricas terminadas em ``errors``) são comparadas em
+valor absoluto: com baseline zero, qualquer erro já é uma regressão.
+"""
+
+import json
+import math
+import os
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+Metrics = Dict[str, float]
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Percentil ``p`` (0-100) pelo método nearest-rank; valores já ordenados."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith("_per_s")
+
+
+def is_error_count(metric: str) -> bool:
+    return metric.endswith("errors")
+
+
+def print_metrics(metrics: Metrics, baseline: Optional[Metrics] = None) -> None:
+    """Tabela das métricas, com a variação em relação ao baseline (se houver)."""
+    width = max((len(name) for name in metrics), default=10)
+    for name, value in metrics.items():
+        line = f"{name:<{width}}  {value:>14,.3f}"
+        if baseline and baseline.get(name):
+            delta = (value - baseline[name]) / baseline[name] * 100
+            line += f"  {baseline[name]:>14,.3f}  {delta:+7.1f}%"
+        print(line)
+
+
+def load_baseline(path: Path) -> Optional[Metrics]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))["metrics"]
+
+
+def save_baseline(path: Path, metrics: Metrics, **context) -> None:
+    """
+    Grava as métricas como novo baseline, junto com a descrição do
+    ambiente (números de máquinas diferentes não são comparáveis).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        **context,
+        "metrics": metrics,
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def regressions(metrics: Metrics, baseline: Metrics, tolerance: float) -> List[str]:
+    """
+    Métricas que pioraram mais do que ``tolerance`` (fração, ex.: 0.10)
+    em relação ao baseline. Métricas ausentes em um dos lados são ignoradas.
+    """
+    found = []
+    for name, value in metrics.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if is_error_count(name):
+            # Sem divisão pelo baseline, que é zero em uma execução saudável
+            if value > reference * (1 + tolerance):
+                found.append(f"{name}: {reference:,.0f} -> {value:,.0f}")
+            continue
+        if not reference:
+            continue
+        change = (value - reference) / reference
+        worse = -change if higher_is_better(name) else change
+        if worse > tolerance:
+            found.append(f"{name}: {reference:,.3f} -> {value:,.3f} ({change * 100:+.1f}%)")
+    return found
+
+
+def finish(metrics: Metrics, baseline_path: Path, save: bool, tolerance: float, **context) -> int:
+    """
+    Etapa final comum aos benchmarks: imprime, grava o baseline (se
+    pedido) ou compara com ele. Retorna o código de saída do processo
+    (1 em caso de regressão), para uso em CI.
+    """
+    baseline = None if save else load_baseline(baseline_path)
+    print_metrics(metrics, baseline)
+
+    if save:
+        save_baseline(baseline_path, metrics, **context)
+        print(f"\nBaseline gravado em {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print(f"\nSem baseline em {baseline_path} (use --save-baseline para criar)")
+        return 0
+
+    found = regressions(metrics, baseline, tolerance)
+    if found:
+        print(f"\nRegressões acima de {tolerance:.0%}:")
+        for line in found:
+            print(f"  {line}")
+        return 1
+
+    print(f"\nSem regressões acima de {tolerance:.0%} em relação ao baseline")
+    return 0
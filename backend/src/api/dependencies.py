@@ -0,0 +1,91 @@
+"""
+Dependências e utilitários compartilhados pelos routers da API.
+"""
+
+import hmac
+import inspect
+from typing import Any, Callable, Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+from starlette.concurrency import run_in_threadpool
+
+from ..application.ports.token_service import InvalidTokenError, TokenClaims
+from ..config.container import container
+from ..config.settings import settings
+from .profiling import track_thread
+
+
+async def run_use_case(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executa um método de caso de uso a partir de uma rota ``async def``.
+
+    - Casos de uso assíncronos são aguardados diretamente no event loop
+    - Casos de uso síncronos (I/O bloqueante) rodam no threadpool, para
+      não bloquear o event loop enquanto aguardam o banco
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(track_thread(method), *args, **kwargs)
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def require_account_owner(
+    account_id: str,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> TokenClaims:
+    """
+    Exige um token de sessão válido (``Authorization: Bearer <token>``)
+    emitido para a conta do path.
+
+    A verificação é apenas uma checagem de assinatura e expiração, feita
+    no próprio event loop: não consulta o banco nem calcula hash de senha.
+
+    - 401: token ausente, inválido ou expirado
+    - 403: token válido, mas de outra conta
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token de autenticação ausente.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        claims = container.token_service().verify(credentials.credentials)
+    except InvalidTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if claims.subject != account_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso negado a esta conta.",
+        )
+
+    return claims
+
+
+_api_key = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+async def require_batch_client(api_key: Optional[str] = Depends(_api_key)) -> None:
+    """
+    Exige a chave (``X-API-Key``) de um sistema autorizado a operar sobre
+    várias contas (ex.: folha de pagamento, auditoria de saldos). Sem
+    chaves configuradas em ``BATCH_API_KEYS``, essas rotas ficam
+    desativadas.
+    """
+    keys = [k.strip() for k in settings.batch_api_keys.split(",") if k.strip()]
+    if api_key is None or not any(
+        hmac.compare_digest(api_key.encode("utf-8"), k.encode("utf-8")) for k in keys
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Chave de API inválida para operações de sistema.",
+        )
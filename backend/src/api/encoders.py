@@ -0,0 +1,75 @@
+"""
+Serialização rápida (JSON)
+--------------------------
+
+Respostas de alto volume codificadas diretamente em bytes com orjson,
+sem modelos pydantic por item nem o jsonable_encoder do FastAPI:
+
+- Extrato (página e NDJSON): a partir das tuplas do ledger (LedgerRow),
+  com o valor em centavos vindo do banco
+- Saldo de depósito, saque e transferência: a partir de Money.cents
+
+Valores monetários são formatados de forma exata a partir dos centavos
+(inteiros), sem passar por float nem Decimal: no extrato como string
+("1234.50"), no saldo como número JSON (1234.50), mantendo os formatos
+já publicados pela API.
+
+Com API_DEBUG, o extrato codificado é validado contra StatementResponse,
+para detectar divergências entre este caminho e o schema documentado.
+"""
+
+from typing import Iterable, List
+
+import orjson
+from fastapi.responses import Response
+
+from ..application.ports.transaction_repository import LedgerRow, StatementRows
+from ..config.settings import settings
+from .schemas.transaction_schema import StatementResponse
+
+
+class RawJSONResponse(Response):
+    """Resposta JSON cujo conteúdo já chega codificado (bytes)."""
+
+    media_type = "application/json"
+
+
+def money_string(cents: int) -> str:
+    """Centavos em reais com duas casas: 123450 -> "1234.50"."""
+    if cents < 0:
+        return "-" + money_string(-cents)
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def encode_balance(message: str, cents: int) -> bytes:
+    """``{"message": ..., "balance": {"amount": <número exato>}}``"""
+    return b'{"message":%s,"balance":{"amount":%s}}' % (
+        orjson.dumps(message),
+        money_string(cents).encode("ascii"),
+    )
+
+
+def _row_dicts(rows: Iterable[LedgerRow]) -> List[dict]:
+    return [
+        {
+            "transaction_id": transaction_id,
+            "type": type_,
+            "amount": money_string(cents),
+            "occurred_at": occurred_at,
+            "target_account_id": target_account_id,
+        }
+        for transaction_id, type_, cents, occurred_at, target_account_id in rows
+    ]
+
+
+def encode_statement(page: StatementRows) -> bytes:
+    """Página do extrato no formato de StatementResponse."""
+    body = orjson.dumps({"transactions": _row_dicts(page.rows), "next_cursor": page.next_cursor})
+    if settings.api_debug:
+        StatementResponse.model_validate_json(body)
+    return body
+
+
+def encode_ndjson(rows: List[LedgerRow]) -> bytes:
+    """Um lote de lançamentos como linhas NDJSON (um objeto por linha)."""
+    return b"".join(orjson.dumps(item) + b"\n" for item in _row_dicts(rows))
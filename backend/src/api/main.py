@@ -1,20 +1,72 @@
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from ..application.ports.password_hasher import PasswordHasherBusy
+from ..application.ports.transaction_repository import InvalidCursor
+from ..config.container import container
+from ..config.logger import setup_logging
+from ..config.settings import settings
+from . import profiling
 from .routers.account_router import router as account_router
 from .routers.auth_router import router as auth_router
+from .routers.batch_router import router as batch_router
+from .routers.metrics_router import router as metrics_router
 from .routers.transaction_router import router as transaction_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # Duração dos commits no banco (listeners da Session)
+    if settings.metrics_enabled:
+        container.instrumentation().install_commit_timing()
+    # Entrega dos eventos do outbox (notificações) em segundo plano
+    if settings.outbox_dispatcher_enabled:
+        container.outbox_dispatcher().start()
+    # Snapshots do ledger em segundo plano
+    if settings.snapshot_compactor_enabled:
+        container.snapshot_compactor().start()
+    yield
+    container.snapshot_compactor().stop()
+    container.outbox_dispatcher().stop()
+    # Confirma as gravações ainda enfileiradas no group commit
+    container.group_commit_writer().shutdown()
+    # Encerra o pool de processos do hash de senhas
+    container.hasher().shutdown()
+    if settings.metrics_enabled:
+        container.instrumentation().uninstall_commit_timing()
+
+async def hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    # Contrapressão: o cliente deve tentar novamente em instantes
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    # Cursor recebido do cliente: erro de entrada, não do servidor
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 def create_app():
     app = FastAPI(
         title="Banking System API",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    app.add_exception_handler(PasswordHasherBusy, hasher_busy_handler)
+    app.add_exception_handler(InvalidCursor, invalid_cursor_handler)
+
+    # Perfil estatístico de requisições escolhidas (ver api.profiling)
+    if settings.profiling_enabled:
+        profiling.install(app)
+
     # Routers
     app.include_router(account_router, prefix="/accounts", tags=["Accounts"])
     app.include_router(auth_router, prefix="/auth", tags=["Auth"])
     app.include_router(transaction_router, prefix="/transactions", tags=["Transactions"])
+    app.include_router(batch_router, prefix="/transactions", tags=["Transactions"])
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, tags=["Observability"])
 
     return app
 
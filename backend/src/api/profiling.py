@@ -0,0 +1,202 @@
+"""
+Profiling de requisições sob demanda
+------------------------------------
+
+Middleware ASGI que grava o perfil estatístico (tempo de parede) de
+requisições escolhidas, para investigar rotas lentas em produção.
+
+Uma requisição é perfilada quando:
+- Traz o cabeçalho ``X-Profile-Token`` com um token válido, assinado com
+  ``PROFILING_SECRET`` (ver ``sign_profile_token`` e
+  ``python -m src.cli.profile_token``); ou
+- É sorteada pela taxa ``PROFILING_SAMPLE_RATE`` (ex.: 0.001)
+
+Para cada requisição perfilada são gravados em ``PROFILING_OUTPUT_DIR``:
+- ``<id>.collapsed``: pilhas no formato collapsed (flamegraph.pl,
+  speedscope, etc.)
+- ``<id>.svg``: flamegraph pronto para abrir no navegador
+
+e a resposta traz o cabeçalho ``X-Profile-Id`` com o ``<id>``. As pilhas
+incluem o tempo no SQLAlchemy, na validação (pydantic/FastAPI), no hash
+de senhas e nas esperas (``[aguardando]``), inclusive dos casos de uso
+síncronos executados no threadpool (``track_thread``).
+
+Com PROFILING_ENABLED desligado o middleware não é instalado.
+"""
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import hmac
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..config.settings import settings
+from ..shared.utils.flamegraph import collapsed_lines, render_svg
+from ..shared.utils.stack_sampler import StackSampler
+
+HEADER = "x-profile-token"
+
+# Amostrador da requisição em andamento (propagado ao threadpool junto
+# com o contexto)
+_current: contextvars.ContextVar[Optional[StackSampler]] = contextvars.ContextVar(
+    "profiling_sampler", default=None
+)
+
+
+def sign_profile_token(secret: str, expires_at: int) -> str:
+    """Token ``<exp>.<hmac-sha256 hex>``, válido até ``expires_at`` (epoch)."""
+    signature = hmac.new(secret.encode("utf-8"), str(expires_at).encode("ascii"), hashlib.sha256)
+    return f"{expires_at}.{signature.hexdigest()}"
+
+
+def verify_profile_token(secret: str, token: str, now: Optional[float] = None) -> bool:
+    if not secret:
+        return False
+    expires_at, _, _ = token.partition(".")
+    if not expires_at.isdigit() or int(expires_at) < (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(sign_profile_token(secret, int(expires_at)), token)
+
+
+def track_thread(func: Callable) -> Callable:
+    """
+    Envolve ``func`` para que, executada em outra thread (ex.: threadpool),
+    seja incluída no perfil da requisição atual. Sem perfil ativo devolve
+    ``func`` sem alterações.
+    """
+    sampler = _current.get()
+    if sampler is None:
+        return func
+
+    @functools.wraps(func)
+    def tracked(*args, **kwargs):
+        thread_id = threading.get_ident()
+        sampler.add_thread(thread_id, sys._getframe())
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sampler.remove_thread(thread_id)
+
+    return tracked
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI "puro": a aplicação roda na mesma task do middleware,
+    o que permite distinguir os frames da requisição dos demais.
+    """
+
+    def __init__(
+        self,
+        app,
+        output_dir: str,
+        secret: str = "",
+        sample_rate: float = 0.0,
+        interval: float = 0.002,
+        max_concurrent: int = 4,
+    ):
+        """
+        Parâmetros:
+            output_dir: diretório dos arquivos gerados
+            secret: segredo dos tokens de X-Profile-Token (vazio desativa)
+            sample_rate: fração das requisições perfiladas por sorteio
+            interval: intervalo entre amostras, em segundos
+            max_concurrent: perfis simultâneos (os demais pedidos são ignorados)
+        """
+        self.app = app
+        self.output_dir = Path(output_dir)
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    def _wants_profile(self, scope) -> bool:
+        if self.secret:
+            for name, value in scope.get("headers", ()):
+                if name == HEADER.encode("latin-1"):
+                    return verify_profile_token(self.secret, value.decode("latin-1"))
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._slots.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._slots.release()
+
+    async def _profile(self, scope, receive, send):
+        profile_id = _profile_id(scope)
+
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-profile-id", profile_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(
+            interval=self.interval,
+            loop_thread_id=threading.get_ident(),
+            task=asyncio.current_task(),
+        )
+        token = _current.set(sampler)
+        started = time.perf_counter()
+        try:
+            await self._call_app(sampler, scope, receive, send_with_header)
+        finally:
+            sampler.stop()
+            _current.reset(token)
+            elapsed = time.perf_counter() - started
+            title = f"{scope['method']} {scope['path']} ({elapsed * 1000:.1f} ms)"
+            # Escrita fora do event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write, profile_id, dict(sampler.samples), title
+            )
+
+    async def _call_app(self, sampler: StackSampler, scope, receive, send):
+        # Frame raiz: só o que executa abaixo dele pertence à requisição
+        sampler.root_frame = sys._getframe()
+        sampler.start()
+        await self.app(scope, receive, send)
+
+    def _write(self, profile_id: str, samples, title: str) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / f"{profile_id}.collapsed").write_text(
+            "\n".join(collapsed_lines(samples)) + "\n", encoding="utf-8"
+        )
+        (self.output_dir / f"{profile_id}.svg").write_text(render_svg(samples, title), encoding="utf-8")
+
+
+def _profile_id(scope) -> str:
+    # Ex.: 20260101T120000-POST-transactions-_-transfer-1a2b3c4d
+    path = re.sub(r"[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}", "_", scope["path"])
+    slug = re.sub(r"[^A-Za-z0-9_]+", "-", path).strip("-") or "root"
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    return f"{stamp}-{scope['method']}-{slug[:60]}-{uuid.uuid4().hex[:8]}"
+
+
+def install(app) -> None:
+    """Instala o middleware com a configuração de Settings."""
+    app.add_middleware(
+        ProfilingMiddleware,
+        output_dir=settings.profiling_output_dir,
+        secret=settings.profiling_secret,
+        sample_rate=settings.profiling_sample_rate,
+        interval=settings.profiling_interval_ms / 1000,
+        max_concurrent=settings.profiling_max_concurrent,
+    )
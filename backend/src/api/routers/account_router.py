@@ -1,16 +1,49 @@
 
 
 from fastapi import APIRouter, Depends
-from ..schemas.account_schema import AccountCreateRequest, AccountResponse
+from ..dependencies import require_batch_client, run_use_case
+from ..schemas.account_schema import (
+    AccountCreateRequest,
+    AccountResponse,
+    BalanceAuditResponse,
+    WithdrawalLimitsRequest,
+    WithdrawalLimitsResponse,
+)
+from ...application.use_cases.audit_balance import AuditBalanceUseCase
+from ...application.use_cases.change_withdrawal_limits import ChangeWithdrawalLimitsUseCase
 from ...application.use_cases.open_account import OpenAccountUseCase
-from ...config.container import get_open_account_uc
+from ...config.container import get_audit_uc, get_limits_uc, get_open_account_uc
 
 router = APIRouter()
 
 @router.post("/", response_model=AccountResponse, status_code=201)
-def open_account(
+async def open_account(
     payload: AccountCreateRequest, 
     uc: OpenAccountUseCase = Depends(get_open_account_uc)
 ):
-    result = uc.execute(payload.to_dto())
+    result = await run_use_case(uc.execute, payload.to_dto())
     return AccountResponse.from_domain(result)
+
+# Conferência do saldo pelo ledger: operação de sistema, não do cliente
+@router.get(
+    "/{account_id}/audit",
+    response_model=BalanceAuditResponse,
+    dependencies=[Depends(require_batch_client)],
+)
+async def audit_balance(account_id: str, uc: AuditBalanceUseCase = Depends(get_audit_uc)):
+    audit = await run_use_case(uc.execute, account_id)
+    return BalanceAuditResponse.from_audit(audit)
+
+# Limites de saque do cliente: definidos pelo banco, não pelo próprio cliente
+@router.put(
+    "/{account_id}/limits",
+    response_model=WithdrawalLimitsResponse,
+    dependencies=[Depends(require_batch_client)],
+)
+async def change_withdrawal_limits(
+    account_id: str,
+    payload: WithdrawalLimitsRequest,
+    uc: ChangeWithdrawalLimitsUseCase = Depends(get_limits_uc),
+):
+    account = await run_use_case(uc.execute, payload.to_command(account_id))
+    return WithdrawalLimitsResponse.from_domain(account)
@@ -1,18 +1,19 @@
 
-from unittest import result
 from fastapi import APIRouter, Depends
-from ...application.use_cases.login import LoginUseCase
+from ..dependencies import run_use_case
+from ...application.use_cases.login import LoginCommand, LoginUseCase
 from ...config.container import get_login_uc
 from ..schemas.auth_schema import LoginRequest, LoginResponse
 
 router = APIRouter()
 
 @router.post("/login", response_model=LoginResponse)
-def login(
+async def login(
     payload: LoginRequest,
     uc: LoginUseCase = Depends(get_login_uc)
 ):
-    result = uc.execute(payload.cpf, payload.password)
+    command = LoginCommand(cpf=payload.cpf, password=payload.password)
+    result = await run_use_case(uc.execute, command)
 
     return LoginResponse(
         token=result.token,
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from ..dependencies import require_batch_client, run_use_case
+from ...application.use_cases.process_batch import ProcessBatchUseCase
+from ...config.container import get_batch_uc
+from ..schemas.batch_schema import BatchRequest, BatchResponse
+
+# Operações de vários clientes: exige a chave de um sistema autorizado
+router = APIRouter(dependencies=[Depends(require_batch_client)])
+
+@router.post("/batch", response_model=BatchResponse)
+async def process_batch(payload: BatchRequest, uc: ProcessBatchUseCase = Depends(get_batch_uc)):
+    results = await run_use_case(uc.execute, payload.to_command())
+    return BatchResponse.from_results(results)
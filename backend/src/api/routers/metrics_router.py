@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from ...config.container import container
+
+# Formato texto do Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(content=container.metrics_registry().render(), media_type=CONTENT_TYPE)
@@ -1,4 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from ..dependencies import require_account_owner, run_use_case
+from ..encoders import RawJSONResponse, encode_balance, encode_ndjson, encode_statement
 from ...application.use_cases.make_deposit import MakeDepositUseCase, DepositCommand
 from ...application.use_cases.make_withdrawal import MakeWithdrawalUseCase, WithdrawalCommand
 from ...application.use_cases.make_transfer import MakeTransferUseCase, TransferCommand
@@ -6,27 +11,55 @@ from ...application.use_cases.get_statement import GetStatementUseCase
 from ...config.container import get_deposit_uc, get_withdrawal_uc, get_transfer_uc, get_statement_uc
 from ..schemas.transaction_schema import DepositRequest, WithdrawRequest, TransferRequest, StatementResponse
 
-router = APIRouter()
+# Todas as rotas operam sobre /{account_id}: exigem token da própria conta
+router = APIRouter(dependencies=[Depends(require_account_owner)])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 @router.post("/{account_id}/deposit")
-def deposit(account_id: str, payload: DepositRequest, uc: MakeDepositUseCase = Depends(get_deposit_uc)):
+async def deposit(account_id: str, payload: DepositRequest, uc: MakeDepositUseCase = Depends(get_deposit_uc)):
     command = DepositCommand(account_id=account_id, amount=str(payload.amount))
-    account = uc.execute(command)
-    return {"message": "Depósito realizado com sucesso", "balance": account.balance}
+    account = await run_use_case(uc.execute, command)
+    return RawJSONResponse(encode_balance("Depósito realizado com sucesso", account.balance.cents))
 
 @router.post("/{account_id}/withdraw")
-def withdraw(account_id: str, payload: WithdrawRequest, uc: MakeWithdrawalUseCase = Depends(get_withdrawal_uc)):
+async def withdraw(account_id: str, payload: WithdrawRequest, uc: MakeWithdrawalUseCase = Depends(get_withdrawal_uc)):
     command = WithdrawalCommand(account_id=account_id, amount=str(payload.amount))
-    account = uc.execute(command)
-    return {"message": "Saque realizado com sucesso", "balance": account.balance}
+    account = await run_use_case(uc.execute, command)
+    return RawJSONResponse(encode_balance("Saque realizado com sucesso", account.balance.cents))
 
 @router.post("/{account_id}/transfer")
-def transfer(account_id: str, payload: TransferRequest, uc: MakeTransferUseCase = Depends(get_transfer_uc)):
+async def transfer(account_id: str, payload: TransferRequest, uc: MakeTransferUseCase = Depends(get_transfer_uc)):
     command = TransferCommand(source_account_id=account_id, target_account_id=payload.target_account_id, amount=str(payload.amount))
-    account = uc.execute(command)
-    return {"message": "Transferência realizada com sucesso", "balance": account.balance}
+    account = await run_use_case(uc.execute, command)
+    return RawJSONResponse(encode_balance("Transferência realizada com sucesso", account.balance.cents))
 
 @router.get("/{account_id}/statement", response_model=StatementResponse)
-def get_statement(account_id: str, uc: GetStatementUseCase = Depends(get_statement_uc)):
-    statement = uc.execute(account_id)
-    return StatementResponse(transactions=statement)
+async def get_statement(
+    account_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    uc: GetStatementUseCase = Depends(get_statement_uc),
+):
+    # Com "Accept: application/x-ndjson" o extrato completo é transmitido
+    # em stream, uma transação por linha, com memória constante.
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        batches = await run_use_case(uc.stream_rows, account_id)
+        return StreamingResponse(_ndjson_chunks(batches), media_type=NDJSON_MEDIA_TYPE)
+
+    # Tuplas do ledger codificadas direto em bytes (ver api.encoders); o
+    # response_model continua documentando o formato
+    page = await run_use_case(uc.rows, account_id, limit=limit, cursor=cursor)
+    return RawJSONResponse(encode_statement(page))
+
+def _ndjson_chunks(batches):
+    """
+    Converte o stream de lotes de lançamentos em blocos NDJSON (um por
+    lote). Aceita tanto o iterator síncrono (consumido pelo
+    StreamingResponse no threadpool) quanto o gerador assíncrono do
+    caminho async.
+    """
+    if hasattr(batches, "__aiter__"):
+        return (encode_ndjson(rows) async for rows in batches)
+    return (encode_ndjson(rows) for rows in batches)
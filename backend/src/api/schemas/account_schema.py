@@ -12,9 +12,14 @@ transformam dados entre:
 - Entidades/aggregates para resposta HTTP
 """
 
+from decimal import Decimal
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from ...application.dto.open_account_dto import OpenAccountDTO
-from ...domain.entities.account import Account
+from ...application.use_cases.audit_balance import BalanceAudit
+from ...application.use_cases.change_withdrawal_limits import ChangeWithdrawalLimitsCommand
+from ...domain.aggregates.account import Account
 
 class AccountCreateRequest(BaseModel):
     """
@@ -50,6 +55,7 @@ class AccountResponse(BaseModel):
     """
 
     account_id: str
+    account_number: Optional[str] = None  # com dígito verificador (ex.: "00001234-3")
     name: str
     cpf: str
 
@@ -61,15 +67,56 @@ class AccountResponse(BaseModel):
         """
         return AccountResponse(
             account_id=account.account_id,
+            account_number=str(account.account_number) if account.account_number else None,
             name=account.customer.name,
             cpf=str(account.customer.cpf)
         )
 
-class LoginRequest(BaseModel):
-    cpf: str
-    password: str
+class BalanceAuditResponse(BaseModel):
+    """
+    Resultado da conferência entre o saldo gravado da conta e o saldo
+    derivado do ledger.
+    """
 
-class LoginResponse(BaseModel):
-    token: str
     account_id: str
-    name: str
+    balance: Decimal
+    ledger_balance: Decimal
+    ledger_count: int
+    consistent: bool
+
+    @staticmethod
+    def from_audit(audit: BalanceAudit):
+        return BalanceAuditResponse(
+            account_id=audit.account_id,
+            balance=audit.balance.amount,
+            ledger_balance=audit.ledger_balance.amount,
+            ledger_count=audit.ledger_count,
+            consistent=audit.consistent,
+        )
+
+class WithdrawalLimitsRequest(BaseModel):
+    """
+    Limites diários de saque próprios do cliente.
+    """
+    daily_amount: Decimal = Field(..., ge=0, example="10000.00")
+    daily_count: int = Field(..., ge=0, example=10)
+
+    def to_command(self, account_id: str) -> ChangeWithdrawalLimitsCommand:
+        return ChangeWithdrawalLimitsCommand(
+            account_id=account_id,
+            daily_amount=str(self.daily_amount),
+            daily_count=self.daily_count,
+        )
+
+class WithdrawalLimitsResponse(BaseModel):
+    account_id: str
+    daily_amount: Decimal
+    daily_count: int
+
+    @staticmethod
+    def from_domain(account: Account):
+        return WithdrawalLimitsResponse(
+            account_id=account.account_id,
+            daily_amount=account.withdrawal_limits.daily_amount.amount,
+            daily_count=account.withdrawal_limits.daily_count,
+        )
@@ -0,0 +1,16 @@
+"""
+Schemas da API: LoginRequest & LoginResponse
+--------------------------------------------
+Validam a entrada e a saída do endpoint de autenticação.
+"""
+
+from pydantic import BaseModel
+
+class LoginRequest(BaseModel):
+    cpf: str
+    password: str
+
+class LoginResponse(BaseModel):
+    token: str
+    account_id: str
+    name: str
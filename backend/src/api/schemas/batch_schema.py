@@ -0,0 +1,56 @@
+"""
+Schemas da API: BatchRequest & BatchResponse
+--------------------------------------------
+Validam a entrada e a saída do endpoint de operações em lote
+(depósitos e saques de vários clientes em uma única requisição).
+"""
+
+from decimal import Decimal
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from ...application.use_cases.process_batch import BatchCommand, BatchItemResult, BatchOperation
+
+MAX_BATCH_OPERATIONS = 1000
+
+class BatchOperationRequest(BaseModel):
+    account_id: str
+    type: Literal["deposit", "withdrawal"]
+    amount: Decimal = Field(..., gt=0)
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperationRequest] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+    def to_command(self) -> BatchCommand:
+        return BatchCommand(
+            operations=[
+                BatchOperation(account_id=op.account_id, type=op.type, amount=str(op.amount))
+                for op in self.operations
+            ]
+        )
+
+class BatchItemResponse(BaseModel):
+    account_id: str
+    success: bool
+    balance: Optional[Decimal] = None
+    error: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BatchItemResponse]
+
+    @staticmethod
+    def from_results(results: List[BatchItemResult]):
+        items = [
+            BatchItemResponse(
+                account_id=r.account_id,
+                success=r.success,
+                balance=r.balance.amount if r.balance is not None else None,
+                error=r.error,
+            )
+            for r in results
+        ]
+        succeeded = sum(1 for r in results if r.success)
+        return BatchResponse(succeeded=succeeded, failed=len(results) - succeeded, results=items)
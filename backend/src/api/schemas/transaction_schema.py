@@ -1,5 +1,8 @@
 from pydantic import BaseModel
 from decimal import Decimal
+from typing import Optional
+
+from ...application.ports.transaction_repository import StatementPage
 
 class DepositRequest(BaseModel):
     amount: Decimal
@@ -16,7 +19,15 @@ class TransactionResponse(BaseModel):
     type: str
     amount: Decimal
     occurred_at: str
+    target_account_id: Optional[str] = None
 
 class StatementResponse(BaseModel):
     transactions: list[TransactionResponse]
-    
\ No newline at end of file
+    next_cursor: Optional[str] = None
+
+    @staticmethod
+    def from_page(page: StatementPage):
+        return StatementResponse(
+            transactions=[TransactionResponse(**t.to_dict()) for t in page.transactions],
+            next_cursor=page.next_cursor,
+        )
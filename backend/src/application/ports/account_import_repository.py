@@ -0,0 +1,38 @@
+"""
+Porta de Repositório: IAccountImportRepository
+----------------------------------------------
+Define as operações em lote usadas na importação de contas (migração de
+clientes de outro sistema), em que milhares de contas são abertas de
+uma vez.
+
+Em vez de uma consulta e um INSERT por conta, cada lote faz:
+- uma única consulta de CPFs já cadastrados
+- um único INSERT de todas as contas (e eventos) do lote
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Set
+
+from ...domain.aggregates.account import Account
+
+
+class IAccountImportRepository(ABC):
+    """
+    Interface para a gravação de contas em lote.
+    """
+
+    @abstractmethod
+    def existing_cpfs(self, cpfs: Iterable[str]) -> Set[str]:
+        """CPFs (forma canônica) do conjunto informado que já têm conta."""
+        ...
+
+    @abstractmethod
+    def insert_many(self, accounts: List[Account]) -> None:
+        """
+        Grava contas novas em uma única transação, atribuindo a elas
+        números de conta sequenciais.
+
+        Raises:
+            ValueError: caso algum CPF já esteja cadastrado (nada é gravado)
+        """
+        ...
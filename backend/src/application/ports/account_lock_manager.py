@@ -0,0 +1,37 @@
+"""
+Porta de Serviço: IAccountLockManager
+-------------------------------------
+Define a interface de exclusão mútua por conta, em memória.
+
+Operações sobre uma mesma conta são serializadas pelo lock da conta,
+sem ida ao banco; operações sobre contas diferentes seguem em paralelo.
+Isso evita que duas requisições carreguem o mesmo saldo e uma delas
+sobrescreva (ou, com a trava otimista do repositório, perca) o trabalho
+da outra.
+
+O lock vale apenas dentro do processo: entre processos diferentes a
+consistência continua garantida pelo controle otimista de versão.
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, ContextManager, Iterable
+
+
+class IAccountLockManager(ABC):
+    """
+    Interface para bloquear uma ou mais contas durante uma operação.
+
+    Várias contas são sempre bloqueadas na mesma ordem, de modo que
+    operações concorrentes sobre o mesmo conjunto de contas (ex.: uma
+    transferência A -> B e outra B -> A) não entram em deadlock.
+    """
+
+    @abstractmethod
+    def locked(self, account_ids: Iterable[str]) -> ContextManager[None]:
+        """Bloqueia as contas (caminho síncrono, entre threads)."""
+        ...
+
+    @abstractmethod
+    def locked_async(self, account_ids: Iterable[str]) -> AsyncContextManager[None]:
+        """Bloqueia as contas (caminho async, entre tarefas do event loop)."""
+        ...
@@ -1,7 +1,8 @@
 
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
-from ...domain.entities.account import Account
+from ...domain.aggregates.account import Account
 
 class IAccountRepository(ABC):
     @abstractmethod
@@ -12,3 +13,43 @@ class IAccountRepository(ABC):
 
     @abstractmethod
     def get_by_cpf(self, cpf: str) -> Account | None: ... 
+
+    @abstractmethod
+    def save_many(self, accounts: List[Account]) -> None:
+        """
+        Grava de uma só vez várias contas já existentes: um único UPDATE
+        em lote (executemany) dos saldos e um único INSERT em lote dos
+        lançamentos novos. Mesma trava otimista de ``save``.
+        """
+        ...
+
+    @abstractmethod
+    def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        """
+        Carrega as contas informadas bloqueando-as até o fim da transação,
+        sempre na mesma ordem (account_id crescente). Contas inexistentes
+        simplesmente não aparecem no dicionário retornado.
+        """
+        ...
+
+
+class IAsyncAccountRepository(ABC):
+    """
+    Versão assíncrona de IAccountRepository, para o caminho de requisição
+    async (mesma semântica, operações aguardáveis).
+    """
+
+    @abstractmethod
+    async def save(self, account: Account) -> None: ...
+
+    @abstractmethod
+    async def get_by_id(self, account_id: str) -> Account | None: ...
+
+    @abstractmethod
+    async def get_by_cpf(self, cpf: str) -> Account | None: ...
+
+    @abstractmethod
+    async def save_many(self, accounts: List[Account]) -> None: ...
+
+    @abstractmethod
+    async def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]: ...
@@ -0,0 +1,47 @@
+"""
+Porta de Repositório: IAccountSnapshotRepository
+------------------------------------------------
+Define o acesso aos snapshots de estado das contas derivados do ledger.
+
+Um snapshot guarda o estado (saldo e contadores de saque diário) de uma
+conta até uma posição do ledger. Reconstruir o estado a partir do ledger
+custa então apenas a leitura do último snapshot mais os lançamentos
+posteriores a ele, independentemente da idade da conta.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from ...domain.services.ledger_replay import LedgerState
+
+
+class IAccountSnapshotRepository(ABC):
+    """
+    Interface para leitura e gravação de snapshots do ledger.
+    """
+
+    @abstractmethod
+    def load_state(self, account_id: str, until: Optional[datetime] = None) -> LedgerState:
+        """
+        Estado da conta derivado do ledger: último snapshot mais o replay
+        dos lançamentos posteriores (opcionalmente, apenas até ``until``).
+        """
+        ...
+
+    @abstractmethod
+    def save_snapshot(self, state: LedgerState) -> bool:
+        """
+        Grava um snapshot do estado informado. Retorna False (sem gravar)
+        se ele não avança em relação ao último snapshot da conta.
+        """
+        ...
+
+    @abstractmethod
+    def accounts_due(self, every_transactions: int, max_age: timedelta, limit: int) -> List[str]:
+        """
+        Contas que precisam de um novo snapshot: com ``every_transactions``
+        lançamentos ou mais desde o último, ou com lançamentos novos e
+        snapshot mais antigo que ``max_age``.
+        """
+        ...
@@ -0,0 +1,36 @@
+"""
+Porta: ICredentialCache
+-----------------------
+Cache de credenciais verificadas com sucesso.
+
+Evita repetir a verificação bcrypt (cara em CPU) quando o mesmo cliente
+se autentica várias vezes em pouco tempo com a mesma senha. Uma entrada
+só vale para o hash de senha com que foi registrada: se a senha do
+cliente mudar, a entrada deixa de corresponder automaticamente.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ICredentialCache(ABC):
+    """
+    Interface do cache de verificações de senha bem-sucedidas.
+    """
+
+    @abstractmethod
+    def is_verified(self, cpf: str, password_hash: str, plain: str) -> bool:
+        """
+        Indica se a senha ``plain`` já foi verificada recentemente contra
+        ``password_hash`` para este CPF.
+        """
+        ...
+
+    @abstractmethod
+    def remember(self, cpf: str, password_hash: str, plain: str) -> None:
+        """Registra uma verificação bem-sucedida."""
+        ...
+
+    @abstractmethod
+    def invalidate(self, cpf: str) -> None:
+        """Descarta qualquer verificação registrada para o CPF."""
+        ...
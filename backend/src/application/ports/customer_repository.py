@@ -20,10 +20,10 @@ class ICustomerRepository(ABC):
     """
 
     @abstractmethod
-    def create(self, name: str, email: str, cpf: CPF, password_plain: str) -> Customer:
+    def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
         """
         Cria um novo cliente no banco de dados.
-        A senha chega em texto claro (já será hasheada na camada de domínio).
+        A senha chega já hasheada (ver IPasswordHasher); nunca em texto claro.
         Retorna a entidade Customer completa (com ID gerado).
         """
         ...
@@ -35,4 +35,18 @@ class ICustomerRepository(ABC):
         Retorna a entidade Customer ou None se não existir.
         """
         ...
-        
\ No newline at end of file
+
+
+class IAsyncCustomerRepository(ABC):
+    """
+    Versão assíncrona de ICustomerRepository, para o caminho de
+    requisição async.
+    """
+
+    @abstractmethod
+    async def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
+        ...
+
+    @abstractmethod
+    async def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        ...
@@ -0,0 +1,28 @@
+"""
+Porta de Serviço: IEventSink
+----------------------------
+Destino dos eventos de domínio entregues pelo outbox (notificações,
+integrações, filas externas).
+
+A entrega é "pelo menos uma vez": após uma falha o lote é reenviado,
+então o sink deve tolerar mensagens repetidas (ex.: usando event_id).
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from .outbox_repository import OutboxMessage
+
+
+class IEventSink(ABC):
+    """
+    Interface de um consumidor de eventos de domínio.
+    """
+
+    @abstractmethod
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        """
+        Entrega um lote de mensagens, em ordem. Uma exceção indica que o
+        lote deve ser tentado novamente.
+        """
+        ...
@@ -0,0 +1,70 @@
+"""
+Porta de Repositório: IOutboxRepository
+---------------------------------------
+Define o acesso às mensagens do outbox transacional.
+
+As mensagens são gravadas pelos repositórios de aggregates, na mesma
+transação da mudança de estado; esta porta é usada apenas por quem as
+entrega (dispatcher), para consumi-las em lotes.
+
+Vários dispatchers (um por processo da API) podem consumir o mesmo
+outbox: cada lote é reivindicado com uma concessão (lease) por tempo
+limitado, e os demais dispatchers não o recebem enquanto ela vale. Se o
+dono da concessão cair antes de concluir a entrega, o lote volta a ser
+entregue após o vencimento.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """
+    Evento de domínio pendente de entrega, já serializado.
+    """
+
+    id: int
+    event_id: str
+    event_type: str
+    account_id: str
+    payload: dict
+    occurred_at: datetime
+
+
+class IOutboxRepository(ABC):
+    """
+    Interface de consumo do outbox.
+    """
+
+    @abstractmethod
+    def claim_pending(
+        self,
+        owner: str,
+        limit: int,
+        max_attempts: int,
+        lease_seconds: float,
+    ) -> List[OutboxMessage]:
+        """
+        Reivindica para ``owner`` até ``limit`` mensagens ainda não
+        entregues, na ordem de gravação, por ``lease_seconds`` segundos.
+
+        Ignora as que já falharam ``max_attempts`` vezes e as que estão
+        com outro dispatcher (concessão ainda válida).
+        """
+        ...
+
+    @abstractmethod
+    def mark_dispatched(self, ids: List[int]) -> None:
+        """Marca as mensagens como entregues (e libera a concessão)."""
+        ...
+
+    @abstractmethod
+    def record_failure(self, ids: List[int]) -> None:
+        """
+        Contabiliza uma tentativa de entrega que falhou e libera a
+        concessão, para nova tentativa na próxima rodada.
+        """
+        ...
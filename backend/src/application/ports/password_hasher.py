@@ -0,0 +1,54 @@
+"""
+Porta de Serviço: IPasswordHasher
+---------------------------------
+Define a interface do serviço de hash e verificação de senhas.
+
+Hash de senha (bcrypt) é propositalmente caro em CPU. Isolá-lo atrás
+desta porta permite executá-lo fora da thread da requisição (ex.: em um
+pool de processos), sem que os casos de uso conheçam esse detalhe.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Lançada quando o serviço de hash está saturado (fila de trabalhos
+    cheia) e a requisição deve ser rejeitada ou repetida mais tarde.
+    """
+    pass
+
+
+class IPasswordHasher(ABC):
+    """
+    Interface para geração e verificação de hashes de senha.
+    """
+
+    @abstractmethod
+    def hash(self, plain: str) -> str:
+        """Gera o hash de uma senha em texto claro."""
+        ...
+
+    @abstractmethod
+    def hash_many(self, plains: List[str]) -> List[str]:
+        """
+        Gera os hashes de várias senhas (ex.: importação em lote),
+        distribuindo o trabalho entre os workers. Mantém a ordem.
+        """
+        ...
+
+    @abstractmethod
+    def verify(self, plain: str, hashed: str) -> bool:
+        """Verifica se a senha em texto claro corresponde ao hash."""
+        ...
+
+    @abstractmethod
+    async def hash_async(self, plain: str) -> str:
+        """Versão aguardável de ``hash``, que não bloqueia o event loop."""
+        ...
+
+    @abstractmethod
+    async def verify_async(self, plain: str, hashed: str) -> bool:
+        """Versão aguardável de ``verify``, que não bloqueia o event loop."""
+        ...
@@ -0,0 +1,55 @@
+"""
+Porta de Serviço: ITokenService
+-------------------------------
+Define a interface de emissão e verificação de tokens de sessão.
+
+Os tokens são autossuficientes (assinados): verificar uma requisição
+autenticada é uma checagem puramente de CPU, sem consulta ao banco nem
+rodada de hash de senha.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+class InvalidTokenError(Exception):
+    """
+    Lançada quando o token está malformado, com assinatura inválida,
+    assinado por uma chave desconhecida ou expirado.
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """
+    Dados extraídos de um token válido.
+
+    Contém:
+    - subject: identificador da conta autenticada (account_id)
+    - expires_at: instante de expiração (epoch, em segundos)
+    """
+
+    subject: str
+    expires_at: int
+
+
+class ITokenService(ABC):
+    """
+    Interface para emissão e verificação de tokens de sessão.
+    """
+
+    @abstractmethod
+    def issue(self, subject: str) -> str:
+        """Emite um token para o sujeito informado (account_id)."""
+        ...
+
+    @abstractmethod
+    def verify(self, token: str) -> TokenClaims:
+        """
+        Valida o token e retorna suas claims.
+
+        Raises:
+            InvalidTokenError: caso o token não seja válido
+        """
+        ...
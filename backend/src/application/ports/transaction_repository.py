@@ -0,0 +1,145 @@
+"""
+Porta de Repositório: ITransactionRepository
+--------------------------------------------
+Define a interface do ledger de transações (extrato) das contas.
+
+O ledger é append-only: lançamentos são apenas inseridos e consultados,
+nunca alterados. A consulta do extrato é paginada por cursor (keyset),
+de modo que o custo de cada página independe do tamanho do histórico,
+ou servida como um stream (iterator) com uso de memória constante.
+
+Além das entidades de domínio, o extrato pode ser lido como tuplas
+(LedgerRow), com o valor já em centavos: é o caminho usado pela API para
+serializar extratos longos sem criar um objeto por lançamento.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+from ...domain.entities.transaction import Transaction
+
+# Lançamento como tupla: (transaction_id, type, amount_cents, occurred_at,
+# target_account_id)
+LedgerRow = Tuple[str, str, int, datetime, Optional[str]]
+
+
+class InvalidCursor(ValueError):
+    """
+    Lançada quando o cursor de paginação recebido não foi gerado pelo
+    repositório (adulterado, truncado ou de outro formato). É um erro do
+    cliente, não do servidor.
+    """
+    pass
+
+
+@dataclass
+class StatementPage:
+    """
+    Página do extrato de uma conta.
+
+    Contém:
+    - transactions: lançamentos da página, em ordem cronológica
+    - next_cursor: cursor opaco para a próxima página (None se for a última)
+    """
+
+    transactions: List[Transaction] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class StatementRows:
+    """
+    Página do extrato como tuplas (LedgerRow), com o mesmo cursor de
+    StatementPage.
+    """
+
+    rows: List[LedgerRow] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class ITransactionRepository(ABC):
+    """
+    Interface para persistência e consulta do ledger de transações.
+    """
+
+    @abstractmethod
+    def add_many(self, transactions: List[Transaction]) -> None:
+        """
+        Anexa novos lançamentos ao ledger em uma única operação.
+        """
+        ...
+
+    @abstractmethod
+    def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage:
+        """
+        Retorna uma página do extrato da conta a partir do cursor informado.
+        Sem cursor, retorna a primeira página (lançamentos mais antigos).
+        """
+        ...
+
+    @abstractmethod
+    def iter_by_account(self, account_id: str, batch_size: int = 500) -> Iterator[Transaction]:
+        """
+        Percorre todo o extrato da conta em ordem cronológica, sob demanda.
+        Os lançamentos são lidos em lotes de ``batch_size``, de modo que o
+        consumo de memória não depende do tamanho do histórico.
+        """
+        ...
+
+    @abstractmethod
+    def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows:
+        """Mesma página de ``list_by_account``, como tuplas."""
+        ...
+
+    @abstractmethod
+    def iter_row_batches(self, account_id: str, batch_size: int = 500) -> Iterator[List[LedgerRow]]:
+        """Todo o extrato como tuplas, um lote de até ``batch_size`` por vez."""
+        ...
+
+
+class IAsyncTransactionRepository(ABC):
+    """
+    Versão assíncrona de ITransactionRepository, para o caminho de
+    requisição async.
+    """
+
+    @abstractmethod
+    async def add_many(self, transactions: List[Transaction]) -> None: ...
+
+    @abstractmethod
+    async def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage: ...
+
+    @abstractmethod
+    def iter_by_account(self, account_id: str, batch_size: int = 500) -> AsyncIterator[Transaction]:
+        """Gerador assíncrono com a mesma semântica de ITransactionRepository.iter_by_account."""
+        ...
+
+    @abstractmethod
+    async def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows: ...
+
+    @abstractmethod
+    def iter_row_batches(self, account_id: str, batch_size: int = 500) -> AsyncIterator[List[LedgerRow]]:
+        """Gerador assíncrono com a mesma semântica de ITransactionRepository.iter_row_batches."""
+        ...
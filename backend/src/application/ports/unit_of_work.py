@@ -0,0 +1,70 @@
+"""
+Porta: IUnitOfWork
+------------------
+Define uma unidade de trabalho transacional: todas as leituras e escritas
+feitas através dos repositórios expostos por ela pertencem a uma única
+transação de banco, confirmada apenas por ``commit()``.
+
+Uso típico em um caso de uso:
+
+    with self.uow_factory() as uow:
+        accounts = uow.accounts.get_for_update([...])
+        ...
+        uow.accounts.save(account)
+        uow.commit()
+
+Se o bloco terminar sem ``commit()`` (ex.: por uma exceção de domínio),
+todas as alterações são descartadas.
+
+IAsyncUnitOfWork é a variante para o caminho async (``async with``).
+"""
+
+from abc import ABC, abstractmethod
+
+from .account_repository import IAccountRepository, IAsyncAccountRepository
+
+
+class IUnitOfWork(ABC):
+    """
+    Interface de uma unidade de trabalho transacional.
+    """
+
+    accounts: IAccountRepository
+
+    def __enter__(self) -> "IUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Sem commit explícito, nada do que foi feito é persistido
+        self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Confirma atomicamente todas as alterações da unidade de trabalho."""
+        ...
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Descarta as alterações ainda não confirmadas."""
+        ...
+
+
+class IAsyncUnitOfWork(ABC):
+    """
+    Interface de uma unidade de trabalho transacional assíncrona.
+    """
+
+    accounts: IAsyncAccountRepository
+
+    async def __aenter__(self) -> "IAsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        # Sem commit explícito, nada do que foi feito é persistido
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None: ...
+
+    @abstractmethod
+    async def rollback(self) -> None: ...
@@ -0,0 +1,40 @@
+
+from dataclasses import dataclass
+
+from ...domain.value_objects.money import Money
+from ..ports.account_repository import IAccountRepository
+from ..ports.account_snapshot_repository import IAccountSnapshotRepository
+
+@dataclass
+class BalanceAudit:
+    account_id: str
+    balance: Money  # saldo gravado na conta
+    ledger_balance: Money  # saldo derivado do ledger
+    ledger_count: int
+
+    @property
+    def consistent(self) -> bool:
+        return self.balance.amount == self.ledger_balance.amount
+
+class AuditBalanceUseCase:
+    """
+    Confere o saldo gravado da conta com o saldo derivado do ledger
+    (último snapshot + lançamentos posteriores).
+    """
+
+    def __init__(self, account_repo: IAccountRepository, snapshot_repo: IAccountSnapshotRepository):
+        self.account_repo = account_repo
+        self.snapshot_repo = snapshot_repo
+
+    def execute(self, account_id: str) -> BalanceAudit:
+        account = self.account_repo.get_by_id(account_id)
+        if not account:
+            raise ValueError("Conta não encontrada")
+
+        state = self.snapshot_repo.load_state(account_id)
+        return BalanceAudit(
+            account_id=account_id,
+            balance=account.balance,
+            ledger_balance=state.balance,
+            ledger_count=state.ledger_count,
+        )
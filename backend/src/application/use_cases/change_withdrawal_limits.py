@@ -0,0 +1,54 @@
+
+from dataclasses import dataclass
+from ...domain.aggregates.account import Account
+from ...domain.services.account_rules import WithdrawalLimits
+from ...domain.value_objects.money import Money
+from ..ports.account_lock_manager import IAccountLockManager
+from ..ports.account_repository import IAccountRepository, IAsyncAccountRepository
+
+@dataclass
+class ChangeWithdrawalLimitsCommand:
+    account_id: str
+    daily_amount: str  # valor máximo por dia
+    daily_count: int  # saques por dia
+
+def _limits(command: ChangeWithdrawalLimitsCommand) -> WithdrawalLimits:
+    return WithdrawalLimits(daily_amount=Money(command.daily_amount), daily_count=command.daily_count)
+
+class ChangeWithdrawalLimitsUseCase:
+    """
+    Define os limites diários de saque próprios de um cliente.
+    """
+
+    def __init__(self, account_repo: IAccountRepository, locks: IAccountLockManager):
+        self.account_repo = account_repo
+        self.locks = locks
+
+    def execute(self, command: ChangeWithdrawalLimitsCommand) -> Account:
+        limits = _limits(command)
+
+        with self.locks.locked([command.account_id]):
+            account = self.account_repo.get_by_id(command.account_id)
+            if not account:
+                raise ValueError("Conta não encontrada")
+
+            account.change_withdrawal_limits(limits)
+            self.account_repo.save(account)
+        return account
+
+class AsyncChangeWithdrawalLimitsUseCase:
+    def __init__(self, account_repo: IAsyncAccountRepository, locks: IAccountLockManager):
+        self.account_repo = account_repo
+        self.locks = locks
+
+    async def execute(self, command: ChangeWithdrawalLimitsCommand) -> Account:
+        limits = _limits(command)
+
+        async with self.locks.locked_async([command.account_id]):
+            account = await self.account_repo.get_by_id(command.account_id)
+            if not account:
+                raise ValueError("Conta não encontrada")
+
+            account.change_withdrawal_limits(limits)
+            await self.account_repo.save(account)
+        return account
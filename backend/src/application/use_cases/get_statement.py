@@ -1,13 +1,68 @@
 
-from ..ports.account_repository import IAccountRepository
+from typing import AsyncIterator, Iterator, List, Optional
+
+from ..ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ...domain.entities.transaction import Transaction
+from ..ports.transaction_repository import (
+    IAsyncTransactionRepository,
+    ITransactionRepository,
+    LedgerRow,
+    StatementPage,
+    StatementRows,
+)
 
 class GetStatementUseCase:
-    def __init__(self, account_repo: IAccountRepository):
+    def __init__(self, account_repo: IAccountRepository, transaction_repo: ITransactionRepository):
         self.account_repo = account_repo
+        self.transaction_repo = transaction_repo
+
+    def execute(self, account_id: str, limit: int = 50, cursor: Optional[str] = None) -> StatementPage:
+        self._ensure_account_exists(account_id)
+
+        # O extrato vem paginado do ledger, sem carregar o histórico no aggregate
+        return self.transaction_repo.list_by_account(account_id, limit=limit, cursor=cursor)
+
+    def stream(self, account_id: str) -> Iterator[Transaction]:
+        # Valida a conta antes de iniciar o stream (erros não podem surgir no meio da resposta)
+        self._ensure_account_exists(account_id)
+        return self.transaction_repo.iter_by_account(account_id)
 
-    def execute(self, account_id: str):
+    # Mesmas consultas como tuplas (LedgerRow), para a serialização rápida
+    def rows(self, account_id: str, limit: int = 50, cursor: Optional[str] = None) -> StatementRows:
+        self._ensure_account_exists(account_id)
+        return self.transaction_repo.list_rows_by_account(account_id, limit=limit, cursor=cursor)
+
+    def stream_rows(self, account_id: str) -> Iterator[List[LedgerRow]]:
+        self._ensure_account_exists(account_id)
+        return self.transaction_repo.iter_row_batches(account_id)
+
+    def _ensure_account_exists(self, account_id: str) -> None:
         account = self.account_repo.get_by_id(account_id)
         if not account:
             raise ValueError("Conta não encontrada")
-        
-        return account.get_statement()
+
+class AsyncGetStatementUseCase:
+    def __init__(self, account_repo: IAsyncAccountRepository, transaction_repo: IAsyncTransactionRepository):
+        self.account_repo = account_repo
+        self.transaction_repo = transaction_repo
+
+    async def execute(self, account_id: str, limit: int = 50, cursor: Optional[str] = None) -> StatementPage:
+        await self._ensure_account_exists(account_id)
+        return await self.transaction_repo.list_by_account(account_id, limit=limit, cursor=cursor)
+
+    async def stream(self, account_id: str) -> AsyncIterator[Transaction]:
+        await self._ensure_account_exists(account_id)
+        return self.transaction_repo.iter_by_account(account_id)
+
+    async def rows(self, account_id: str, limit: int = 50, cursor: Optional[str] = None) -> StatementRows:
+        await self._ensure_account_exists(account_id)
+        return await self.transaction_repo.list_rows_by_account(account_id, limit=limit, cursor=cursor)
+
+    async def stream_rows(self, account_id: str) -> AsyncIterator[List[LedgerRow]]:
+        await self._ensure_account_exists(account_id)
+        return self.transaction_repo.iter_row_batches(account_id)
+
+    async def _ensure_account_exists(self, account_id: str) -> None:
+        account = await self.account_repo.get_by_id(account_id)
+        if not account:
+            raise ValueError("Conta não encontrada")
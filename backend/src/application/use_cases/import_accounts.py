@@ -0,0 +1,172 @@
+
+from dataclasses import dataclass
+from itertools import islice
+import re
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from ...domain.aggregates.account import Account
+from ...domain.value_objects.cpf import CPF
+from ...shared.utils.cpf_batch import canonical_cpfs
+from ..dto.open_account_dto import OpenAccountDTO
+from ..ports.account_import_repository import IAccountImportRepository
+from ..ports.customer_repository import ICustomerRepository
+from ..ports.password_hasher import IPasswordHasher
+
+# Hash bcrypt (modular crypt format) vindo do sistema de origem
+_BCRYPT_HASH = re.compile(r"\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}")
+
+@dataclass
+class ImportRow:
+    line: int  # linha no arquivo de origem, para o relatório de rejeitados
+    name: str
+    email: str
+    cpf: str
+    password: str = ""
+    password_hash: str = ""  # hash bcrypt já existente no sistema de origem
+
+@dataclass
+class RejectedRow:
+    line: int
+    cpf: str
+    reason: str
+
+@dataclass
+class ImportProgress:
+    processed: int = 0
+    imported: int = 0
+    rejected: int = 0
+
+class ImportAccountsUseCase:
+    """
+    Abre contas em massa a partir de um fluxo de registros (migração de
+    clientes de outro sistema).
+
+    Os registros são consumidos em lotes de ``chunk_size``; a cada lote:
+    1. Os CPFs são validados e normalizados de uma vez (NumPy)
+    2. Registros inválidos ou repetidos dentro do lote são rejeitados
+    3. Uma única consulta descobre os CPFs que já têm conta
+    4. As senhas são hasheadas no pool de processos (hashes bcrypt
+       vindos do sistema de origem são aproveitados sem novo hash)
+    5. Contas e eventos AccountOpened são gravados com um INSERT em lote
+
+    Nenhum registro rejeitado interrompe a importação: cada um é
+    reportado a ``on_rejected`` com o motivo.
+    """
+
+    def __init__(
+        self,
+        import_repo: IAccountImportRepository,
+        customer_repo: ICustomerRepository,
+        hasher: IPasswordHasher,
+        chunk_size: int = 1000,
+    ):
+        self.import_repo = import_repo
+        self.customer_repo = customer_repo
+        self.hasher = hasher
+        self.chunk_size = chunk_size
+
+    def execute(
+        self,
+        rows: Iterable[ImportRow],
+        on_rejected: Optional[Callable[[RejectedRow], None]] = None,
+        on_progress: Optional[Callable[[ImportProgress], None]] = None,
+    ) -> ImportProgress:
+        """
+        Importa todos os registros e retorna os totais.
+
+        Parâmetros:
+            rows: registros a importar (lidos sob demanda)
+            on_rejected: chamado para cada registro rejeitado
+            on_progress: chamado ao fim de cada lote, com os totais parciais
+        """
+        progress = ImportProgress()
+
+        for chunk in _chunks(rows, self.chunk_size):
+            rejected = self._import_chunk(chunk)
+
+            progress.processed += len(chunk)
+            progress.rejected += len(rejected)
+            progress.imported += len(chunk) - len(rejected)
+
+            if on_rejected:
+                for row in rejected:
+                    on_rejected(row)
+            if on_progress:
+                on_progress(progress)
+
+        return progress
+
+    def _import_chunk(self, chunk: List[ImportRow]) -> List[RejectedRow]:
+        rejected: List[RejectedRow] = []
+        accepted: dict[str, ImportRow] = {}
+
+        cpfs, valid = canonical_cpfs([row.cpf for row in chunk])
+        for row, cpf, ok in zip(chunk, cpfs.tolist(), valid.tolist()):
+            reason = None if ok else "CPF inválido"
+            if reason is None:
+                reason = _invalid_reason(row)
+            if reason is None and cpf in accepted:
+                reason = "CPF repetido no arquivo"
+
+            if reason:
+                rejected.append(RejectedRow(row.line, row.cpf, reason))
+            else:
+                row.cpf = cpf
+                accepted[cpf] = row
+
+        # Repete uma vez em caso de conflito: um cadastro pela API pode
+        # ter usado um dos CPFs entre a consulta e o INSERT
+        for attempt in range(2):
+            existing = self.import_repo.existing_cpfs(accepted)
+            for cpf in existing:
+                row = accepted.pop(cpf)
+                rejected.append(RejectedRow(row.line, row.cpf, "Já existe uma conta com este CPF."))
+
+            if attempt == 0:
+                accounts = self._open_accounts(list(accepted.values()))
+            else:
+                accounts = [a for a in accounts if a.customer.cpf.value in accepted]
+
+            try:
+                self.import_repo.insert_many(accounts)
+                break
+            except ValueError:
+                if attempt == 1:
+                    raise
+
+        return sorted(rejected, key=lambda r: r.line)
+
+    def _open_accounts(self, rows: List[ImportRow]) -> List[Account]:
+        plain = [row for row in rows if not row.password_hash]
+        for row, hashed in zip(plain, self.hasher.hash_many([row.password for row in plain])):
+            row.password_hash = hashed
+
+        return [
+            Account.open(
+                self.customer_repo.create(
+                    name=row.name,
+                    email=row.email,
+                    cpf=CPF(row.cpf),
+                    password_hash=row.password_hash,
+                )
+            )
+            for row in rows
+        ]
+
+def _invalid_reason(row: ImportRow) -> Optional[str]:
+    if not row.name or not row.email:
+        return "Nome e e-mail são obrigatórios"
+    if row.password_hash:
+        if not _BCRYPT_HASH.fullmatch(row.password_hash):
+            return "Hash de senha não suportado (apenas bcrypt)"
+        return None
+    try:
+        OpenAccountDTO(name=row.name, email=row.email, cpf=row.cpf, password=row.password)
+    except ValueError as e:
+        return str(e)
+    return None
+
+def _chunks(rows: Iterable[ImportRow], size: int) -> Iterator[List[ImportRow]]:
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
@@ -1,44 +1,74 @@
 
 from dataclasses import dataclass
 
+from ...domain.aggregates.account import Account
 from ...domain.value_objects.cpf import CPF
-from ..ports.customer_repository import ICustomerRepository
-from ..ports.account_repository import IAccountRepository
+from ..ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ..ports.credential_cache import ICredentialCache
+from ..ports.password_hasher import IPasswordHasher
+from ..ports.token_service import ITokenService
 
 @dataclass
 class LoginCommand:
     cpf: str
     password: str
 
+@dataclass
+class LoginResult:
+    token: str
+    account_id: str
+    name: str
+
 class LoginUseCase:
-    def __init__(self, customer_repo: ICustomerRepository, account_repo: IAccountRepository):
-        self.customer_repo = customer_repo
+    def __init__(self, account_repo: IAccountRepository, hasher: IPasswordHasher, credential_cache: ICredentialCache, token_service: ITokenService):
         self.account_repo = account_repo
+        self.hasher = hasher
+        self.credential_cache = credential_cache
+        self.token_service = token_service
 
     def execute(self, command: LoginCommand):
-        cpf = CPF(command.cpf)
-        customer = self.customer_repo.get_by_cpf(cpf)
-        if not customer:
+        cpf = CPF(command.cpf).value
+
+        # Uma única consulta: a conta já traz o cliente (e o hash da senha)
+        account = self.account_repo.get_by_cpf(cpf)
+        password_hash = account.customer.password_hash if account else None
+        if not password_hash:
             raise ValueError("CPF ou senha inválidos")
-        
-        if not customer.verify_password(command.password):
+
+        # Verificação recente com o mesmo hash dispensa a rodada bcrypt
+        if not self.credential_cache.is_verified(cpf, password_hash, command.password):
+            if not self.hasher.verify(command.password, password_hash):
+                raise ValueError("CPF ou senha inválidos")
+            self.credential_cache.remember(cpf, password_hash, command.password)
+
+        return _login_result(account, self.token_service)
+
+class AsyncLoginUseCase:
+    def __init__(self, account_repo: IAsyncAccountRepository, hasher: IPasswordHasher, credential_cache: ICredentialCache, token_service: ITokenService):
+        self.account_repo = account_repo
+        self.hasher = hasher
+        self.credential_cache = credential_cache
+        self.token_service = token_service
+
+    async def execute(self, command: LoginCommand):
+        cpf = CPF(command.cpf).value
+
+        account = await self.account_repo.get_by_cpf(cpf)
+        password_hash = account.customer.password_hash if account else None
+        if not password_hash:
             raise ValueError("CPF ou senha inválidos")
-        
-        # Aqui, precisaríamos de um token JWT ou similar. Por enquanto, retornaremos o account_id.
-        # Vamos supor que o customer tem uma conta. Precisamos buscar a conta pelo CPF? 
-        # Não temos esse método no account_repo. Vamos adicionar?
-        # Ou podemos mudar: o login retorna o customer e depois o frontend busca a conta?
-        # Por simplicidade, vamos retornar o customer e o account_id.
-        # Mas note: um CPF pode ter apenas uma conta? No nosso sistema, sim.
-        # Então, vamos adicionar um método no account_repo para buscar por CPF.
-        account = self.account_repo.get_by_cpf(cpf)
-        if not account:
-            raise ValueError("Conta não encontrada para este CPF")
-        
-        # Gerar token JWT? Por enquanto, retornaremos os dados.
-        return {
-            "account_id": account.account_id,
-            "name": customer.name,
-            "cpf": str(customer.cpf)
-        }
-    
\ No newline at end of file
+
+        if not self.credential_cache.is_verified(cpf, password_hash, command.password):
+            if not await self.hasher.verify_async(command.password, password_hash):
+                raise ValueError("CPF ou senha inválidos")
+            self.credential_cache.remember(cpf, password_hash, command.password)
+
+        return _login_result(account, self.token_service)
+
+def _login_result(account: Account, token_service: ITokenService) -> LoginResult:
+    # O token carrega o account_id: requisições autenticadas não consultam o banco
+    return LoginResult(
+        token=token_service.issue(account.account_id),
+        account_id=account.account_id,
+        name=account.customer.name,
+    )
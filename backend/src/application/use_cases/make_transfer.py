@@ -1,9 +1,11 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable
 
 from ...domain.aggregates.account import Account
-from ..ports.account_repository import IAccountRepository
+from ..ports.account_lock_manager import IAccountLockManager
+from ..ports.unit_of_work import IAsyncUnitOfWork, IUnitOfWork
 from ...domain.value_objects.money import Money
 
 @dataclass
@@ -13,23 +15,54 @@ class TransferCommand:
     amount: str
 
 class MakeTransferUseCase:
-    def __init__(self, account_repo: IAccountRepository):
-        self.account_repo = account_repo
+    def __init__(self, uow_factory: Callable[[], IUnitOfWork], locks: IAccountLockManager):
+        self.uow_factory = uow_factory
+        self.locks = locks
 
     def execute(self, command: TransferCommand):
-        source = self.account_repo.get_by_id(command.source_account_id)
-        target = self.account_repo.get_by_id(command.target_account_id)
-        
-        if not source or not target:
-            raise ValueError("Conta de origem ou destino não encontrada")
-        
         amount = Money(command.amount)
-        
-        # Realizar a transferência: debitar da origem e creditar no destino
-        source.withdraw(amount, datetime.utcnow())
-        target.deposit(amount, datetime.utcnow())
-        
-        self.account_repo.save(source)
-        self.account_repo.save(target)
-        
+        account_ids = [command.source_account_id, command.target_account_id]
+
+        # Lock em memória das duas contas (serializa operações concorrentes)
+        # e leitura, débito, crédito e lançamentos em uma única transação
+        with self.locks.locked(account_ids), self.uow_factory() as uow:
+            accounts = uow.accounts.get_for_update(account_ids)
+            source = accounts.get(command.source_account_id)
+            target = accounts.get(command.target_account_id)
+
+            if not source or not target:
+                raise ValueError("Conta de origem ou destino não encontrada")
+
+            # Realizar a transferência: debitar da origem e creditar no destino
+            source.transfer_to(target, amount, datetime.utcnow())
+
+            uow.accounts.save(source)
+            uow.accounts.save(target)
+            uow.commit()
+
+        return source
+
+class AsyncMakeTransferUseCase:
+    def __init__(self, uow_factory: Callable[[], IAsyncUnitOfWork], locks: IAccountLockManager):
+        self.uow_factory = uow_factory
+        self.locks = locks
+
+    async def execute(self, command: TransferCommand):
+        amount = Money(command.amount)
+        account_ids = [command.source_account_id, command.target_account_id]
+
+        async with self.locks.locked_async(account_ids), self.uow_factory() as uow:
+            accounts = await uow.accounts.get_for_update(account_ids)
+            source = accounts.get(command.source_account_id)
+            target = accounts.get(command.target_account_id)
+
+            if not source or not target:
+                raise ValueError("Conta de origem ou destino não encontrada")
+
+            source.transfer_to(target, amount, datetime.utcnow())
+
+            await uow.accounts.save(source)
+            await uow.accounts.save(target)
+            await uow.commit()
+
         return source
@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from ...domain.aggregates.account import Account
-from ..ports.account_repository import IAccountRepository
+from ..ports.account_lock_manager import IAccountLockManager
+from ..ports.account_repository import IAccountRepository, IAsyncAccountRepository
 from ...domain.value_objects.money import Money
 
 @dataclass
@@ -12,15 +13,34 @@ class WithdrawalCommand:
     amount: str
 
 class MakeWithdrawalUseCase:
-    def __init__(self, account_repo: IAccountRepository):
+    def __init__(self, account_repo: IAccountRepository, locks: IAccountLockManager):
         self.account_repo = account_repo
+        self.locks = locks
 
     def execute(self, command: WithdrawalCommand):
-        account = self.account_repo.get_by_id(command.account_id)
-        if not account:
-            raise ValueError("Conta não encontrada")
-        
-        amount = Money(command.amount)
-        account.withdraw(amount, datetime.utcnow())
-        self.account_repo.save(account)
+        # Leitura, alteração e gravação serializadas por conta
+        with self.locks.locked([command.account_id]):
+            account = self.account_repo.get_by_id(command.account_id)
+            if not account:
+                raise ValueError("Conta não encontrada")
+
+            amount = Money(command.amount)
+            account.withdraw(amount, datetime.utcnow())
+            self.account_repo.save(account)
+        return account
+
+class AsyncMakeWithdrawalUseCase:
+    def __init__(self, account_repo: IAsyncAccountRepository, locks: IAccountLockManager):
+        self.account_repo = account_repo
+        self.locks = locks
+
+    async def execute(self, command: WithdrawalCommand):
+        async with self.locks.locked_async([command.account_id]):
+            account = await self.account_repo.get_by_id(command.account_id)
+            if not account:
+                raise ValueError("Conta não encontrada")
+
+            amount = Money(command.amount)
+            account.withdraw(amount, datetime.utcnow())
+            await self.account_repo.save(account)
         return account
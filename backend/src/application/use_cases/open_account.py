@@ -7,11 +7,13 @@ conta bancária na aplicação, pertencente à camada de Aplicação
 (Application Layer) da Clean Architecture.
 
 Responsabilidades do caso de uso:
-- Orquestrar repositórios e serviços externos (notificação)
+- Orquestrar repositórios e serviços externos
 - Validar pré-condições de regras do domínio (ex.: CPF duplicado)
+- Gerar o hash da senha através do serviço de hash (fora da thread da requisição)
 - Criar entidades e aggregates utilizando suas factory methods
 - Persistir o estado através dos repositórios
-- Emitir notificações de evento (ex.: e-mail, SMS)
+- A notificação ao cliente não é enviada aqui: o evento AccountOpened
+  é gravado no outbox junto com a conta e entregue em segundo plano
 
 Importante:
 Nenhuma regra de negócio deve ser escrita aqui.  
@@ -24,9 +26,9 @@ from ...domain.aggregates.account import Account
 from ...domain.exceptions import DuplicateCPFException
 
 from ...domain.entities.customer import Customer
-from ..ports.account_repository import IAccountRepository
-from ..ports.customer_repository import ICustomerRepository
-from ..ports.notification_service import INotificationService
+from ..ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ..ports.customer_repository import IAsyncCustomerRepository, ICustomerRepository
+from ..ports.password_hasher import IPasswordHasher
 from ..dto.open_account_dto import OpenAccountDTO
 
 
@@ -37,15 +39,14 @@ class OpenAccountUseCase:
     Ele coordena:
     - Verificação de CPF duplicado
     - Criação de Customer e Account
-    - Persistência pelo repositório
-    - Comunicação via serviço de notificação
+    - Persistência pelo repositório (conta e evento AccountOpened)
     """
 
     def __init__(
         self,
         account_repo: IAccountRepository,
         customer_repo: ICustomerRepository,
-        notifier: INotificationService
+        hasher: IPasswordHasher
     ):
         """
         Inicializa o caso de uso com suas dependências externas.
@@ -53,11 +54,11 @@ class OpenAccountUseCase:
         Parâmetros:
             account_repo: Repositório responsável por persistir Account
             customer_repo: Repositório responsável por obter/criar Customer
-            notifier: Serviço de notificação (e-mail, SMS etc.)
+            hasher: Serviço de hash de senhas
         """
         self.account_repo = account_repo
         self.customer_repo = customer_repo
-        self.notifier = notifier
+        self.hasher = hasher
 
     def execute(self, dto: OpenAccountDTO) -> Account:
         """
@@ -65,10 +66,10 @@ class OpenAccountUseCase:
 
         Etapas:
         1. Valida duplicidade de CPF
-        2. Cria um Customer através do repositório
+        2. Cria um Customer (com o hash da senha) através do repositório
         3. Cria um Account usando seu factory method
-        4. Persiste o aggregate no repositório
-        5. Envia notificação ao cliente
+        4. Persiste o aggregate no repositório (o evento AccountOpened
+           segue junto, para notificação assíncrona)
 
         Retorna:
             Account: aggregate criado e persistido
@@ -87,7 +88,7 @@ class OpenAccountUseCase:
             name=dto.name,
             email=dto.email,
             cpf=cpf,
-            password_plain=dto.password,
+            password_hash=self.hasher.hash(dto.password),
         )
 
         # Criação do aggregate Account
@@ -96,9 +97,46 @@ class OpenAccountUseCase:
         # Persistência
         self.account_repo.save(account)
 
-        # Notificação
-        self.notifier.notify(
-            f"Conta {account.account_id[:8]} criada com sucesso para {customer.name}!"
+        return account
+
+
+class AsyncOpenAccountUseCase:
+    """
+    Variante assíncrona de OpenAccountUseCase, com o mesmo fluxo,
+    sobre repositórios assíncronos.
+    """
+
+    def __init__(
+        self,
+        account_repo: IAsyncAccountRepository,
+        customer_repo: IAsyncCustomerRepository,
+        hasher: IPasswordHasher
+    ):
+        self.account_repo = account_repo
+        self.customer_repo = customer_repo
+        self.hasher = hasher
+
+    async def execute(self, dto: OpenAccountDTO) -> Account:
+        """
+        Executa o fluxo de criação de uma nova conta (ver OpenAccountUseCase).
+
+        Raises:
+            DuplicateCPFException: caso o CPF já esteja registrado
+        """
+        cpf = CPF(dto.cpf)
+
+        if await self.customer_repo.get_by_cpf(cpf):
+            raise DuplicateCPFException("Já existe uma conta com este CPF.")
+
+        customer = await self.customer_repo.create(
+            name=dto.name,
+            email=dto.email,
+            cpf=cpf,
+            password_hash=await self.hasher.hash_async(dto.password),
         )
 
+        account = Account.open(customer)
+
+        await self.account_repo.save(account)
+
         return account
@@ -0,0 +1,108 @@
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import InvalidOperation
+from typing import Callable, Dict, List, Optional
+
+from ...domain.aggregates.account import Account
+from ...domain.entities.transaction import DEPOSIT, WITHDRAWAL
+from ...domain.exceptions import DomainException
+from ...domain.value_objects.money import Money
+from ..ports.account_lock_manager import IAccountLockManager
+from ..ports.unit_of_work import IAsyncUnitOfWork, IUnitOfWork
+
+@dataclass
+class BatchOperation:
+    account_id: str
+    type: str  # deposit ou withdrawal
+    amount: str
+
+@dataclass
+class BatchCommand:
+    operations: List[BatchOperation]
+
+@dataclass
+class BatchItemResult:
+    account_id: str
+    success: bool
+    balance: Optional[Money] = None  # saldo da conta logo após a operação
+    error: Optional[str] = None
+
+class ProcessBatchUseCase:
+    """
+    Aplica um lote de depósitos e saques em uma única transação.
+
+    Todas as contas do lote são carregadas (e bloqueadas) em uma única
+    consulta; as regras de domínio são aplicadas item a item em memória,
+    e o resultado é gravado com um UPDATE e um INSERT em lote. Uma
+    operação recusada (ex.: saldo insuficiente) não impede as demais:
+    cada item tem seu próprio resultado.
+    """
+
+    def __init__(self, uow_factory: Callable[[], IUnitOfWork], locks: IAccountLockManager):
+        self.uow_factory = uow_factory
+        self.locks = locks
+
+    def execute(self, command: BatchCommand) -> List[BatchItemResult]:
+        account_ids = [op.account_id for op in command.operations]
+
+        with self.locks.locked(account_ids), self.uow_factory() as uow:
+            accounts = uow.accounts.get_for_update(account_ids)
+            results = _apply_operations(accounts, command.operations, datetime.utcnow())
+
+            uow.accounts.save_many(_changed(accounts))
+            uow.commit()
+
+        return results
+
+class AsyncProcessBatchUseCase:
+    def __init__(self, uow_factory: Callable[[], IAsyncUnitOfWork], locks: IAccountLockManager):
+        self.uow_factory = uow_factory
+        self.locks = locks
+
+    async def execute(self, command: BatchCommand) -> List[BatchItemResult]:
+        account_ids = [op.account_id for op in command.operations]
+
+        async with self.locks.locked_async(account_ids), self.uow_factory() as uow:
+            accounts = await uow.accounts.get_for_update(account_ids)
+            results = _apply_operations(accounts, command.operations, datetime.utcnow())
+
+            await uow.accounts.save_many(_changed(accounts))
+            await uow.commit()
+
+        return results
+
+def _apply_operations(
+    accounts: Dict[str, Account],
+    operations: List[BatchOperation],
+    occurred_at: datetime,
+) -> List[BatchItemResult]:
+    results = []
+    for op in operations:
+        account = accounts.get(op.account_id)
+        if not account:
+            results.append(BatchItemResult(op.account_id, False, error="Conta não encontrada"))
+            continue
+
+        try:
+            amount = Money(op.amount)
+            if amount.amount <= 0:
+                raise ValueError("O valor deve ser positivo")
+
+            if op.type == DEPOSIT:
+                account.deposit(amount, occurred_at)
+            elif op.type == WITHDRAWAL:
+                account.withdraw(amount, occurred_at)
+            else:
+                raise ValueError(f"Operação desconhecida: {op.type}")
+        except (DomainException, ValueError, InvalidOperation) as e:
+            results.append(BatchItemResult(op.account_id, False, balance=account.balance, error=str(e)))
+            continue
+
+        results.append(BatchItemResult(op.account_id, True, balance=account.balance))
+
+    return results
+
+def _changed(accounts: Dict[str, Account]) -> List[Account]:
+    # Apenas contas com lançamentos novos precisam ser gravadas
+    return [account for account in accounts.values() if account.new_transactions]
@@ -0,0 +1,137 @@
+"""
+CLI: import_accounts
+--------------------
+
+Importa contas em massa a partir de um arquivo CSV ou NDJSON (migração
+de clientes de outro sistema), usando ImportAccountsUseCase.
+
+Uso (a partir de ``backend/``):
+    python -m src.cli.import_accounts clientes.csv --rejected rejeitados.csv
+
+Campos de cada registro: ``name``, ``email``, ``cpf`` e ``password`` ou
+``password_hash`` (hash bcrypt do sistema de origem, gravado sem novo
+hash). O arquivo é lido sob demanda, em lotes; o progresso é exibido na
+saída de erro e os registros rejeitados (linha, CPF e motivo — nunca a
+senha) são gravados no arquivo indicado em ``--rejected``.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterator, TextIO
+
+from ..application.use_cases.import_accounts import ImportProgress, ImportRow, RejectedRow
+from ..config.container import container
+from ..infrastructure.database.orm import init_db
+
+_FIELDS = ("name", "email", "cpf", "password", "password_hash")
+
+
+def _to_row(line: int, record: dict) -> ImportRow:
+    values = {field: str(record.get(field) or "").strip() for field in _FIELDS}
+    return ImportRow(line=line, **values)
+
+
+def read_csv(source: TextIO, reject: Callable[[RejectedRow], None]) -> Iterator[ImportRow]:
+    reader = csv.DictReader(source)
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # DictReader só atualiza line_num após uma linha válida
+            reject(RejectedRow(reader.reader.line_num, "", f"Linha CSV inválida ({e})"))
+            continue
+
+        # Linha física do registro (o cabeçalho é a linha 1)
+        if None in record or None in record.values():
+            # Colunas deslocadas: o CPF não é informado no relatório, pois
+            # a coluna pode conter outro campo (inclusive a senha)
+            reject(RejectedRow(reader.line_num, "", "Número de colunas diferente do cabeçalho"))
+            continue
+        yield _to_row(reader.line_num, record)
+
+
+def read_ndjson(source: TextIO, reject: Callable[[RejectedRow], None]) -> Iterator[ImportRow]:
+    for line, text in enumerate(source, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+            if not isinstance(record, dict):
+                raise ValueError
+        except ValueError:
+            reject(RejectedRow(line, "", "Registro JSON inválido"))
+            continue
+        yield _to_row(line, record)
+
+
+_READERS = {"csv": read_csv, "ndjson": read_ndjson}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Importação de contas em massa (CSV ou NDJSON).")
+    parser.add_argument("input", type=Path, help="arquivo de entrada")
+    parser.add_argument("--format", choices=sorted(_READERS), help="formato (padrão: pela extensão)")
+    parser.add_argument("--rejected", type=Path, help="CSV de saída com os registros rejeitados")
+    parser.add_argument("--chunk-size", type=int, help="registros por lote (padrão: IMPORT_CHUNK_SIZE)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("ndjson" if args.input.suffix.lower() in (".ndjson", ".jsonl") else "csv")
+
+    init_db()
+    use_case = container.import_accounts_uc()
+    if args.chunk_size:
+        use_case.chunk_size = args.chunk_size
+
+    rejected_file = open(args.rejected, "w", newline="", encoding="utf-8") if args.rejected else None
+    writer = csv.writer(rejected_file) if rejected_file else None
+    if writer:
+        writer.writerow(("line", "cpf", "reason"))
+    malformed = 0
+
+    def on_rejected(row: RejectedRow) -> None:
+        if writer:
+            writer.writerow((row.line, row.cpf, row.reason))
+
+    def on_malformed(row: RejectedRow) -> None:
+        nonlocal malformed
+        malformed += 1
+        on_rejected(row)
+
+    started = time.monotonic()
+
+    def on_progress(progress: ImportProgress) -> None:
+        elapsed = time.monotonic() - started
+        rate = progress.processed / elapsed if elapsed else 0.0
+        print(
+            f"\r{progress.processed} processados, {progress.imported} importados, "
+            f"{progress.rejected + malformed} rejeitados ({rate:.0f} registros/s)",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    try:
+        with open(args.input, newline="", encoding="utf-8") as source:
+            rows = _READERS[fmt](source, on_malformed)
+            progress = use_case.execute(rows, on_rejected=on_rejected, on_progress=on_progress)
+    finally:
+        if rejected_file:
+            rejected_file.close()
+        container.hasher().shutdown()
+
+    print(
+        f"\nConcluído em {time.monotonic() - started:.1f}s: {progress.imported} contas importadas, "
+        f"{progress.rejected + malformed} registros rejeitados.",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
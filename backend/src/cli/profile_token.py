@@ -0,0 +1,36 @@
+"""
+CLI: profile_token
+------------------
+
+Gera um token para o cabeçalho ``X-Profile-Token``, que pede o perfil
+de uma requisição (ver src.api.profiling). O token é assinado com
+PROFILING_SECRET e vale por ``--ttl`` segundos.
+
+Uso (a partir de ``backend/``):
+    TOKEN=$(python -m src.cli.profile_token --ttl 300)
+    curl -H "X-Profile-Token: $TOKEN" ...
+"""
+
+import argparse
+import sys
+import time
+
+from ..api.profiling import sign_profile_token
+from ..config.settings import settings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Gera um token para X-Profile-Token.")
+    parser.add_argument("--ttl", type=int, default=300, help="validade em segundos (padrão: 300)")
+    args = parser.parse_args(argv)
+
+    if not settings.profiling_secret:
+        print("PROFILING_SECRET não configurado.", file=sys.stderr)
+        return 1
+
+    print(sign_profile_token(settings.profiling_secret, int(time.time()) + args.ttl))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
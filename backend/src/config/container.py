@@ -10,8 +10,13 @@ Camada: Config / Cross-cutting
 
 Responsabilidades:
 - Registrar implementações concretas de repositórios
-- Registrar serviços externos (ex.: notificações)
+- Registrar serviços externos (ex.: notificações e seus sinks de eventos)
 - Construir instâncias de casos de uso com dependências automaticamente
+- Selecionar entre o caminho síncrono e o assíncrono (Settings.async_database)
+- Selecionar o armazenamento dos repositórios: SQLite ou em memória
+  (Settings.repository_backend)
+- Instrumentar casos de uso e repositórios com métricas, quando
+  ativadas (Settings.metrics_enabled)
 - Servir como Composition Root da aplicação
 
 Importante:
@@ -19,17 +24,72 @@ Não contém regras de negócio nem lógica de aplicação.
 Apenas **liga** as partes da arquitetura.
 """
 
+from datetime import timedelta
+
 from dependency_injector import containers, providers
 
-from ..application.use_cases.open_account import OpenAccountUseCase
-from ..application.use_cases.login import LoginUseCase
-from ..application.use_cases.make_deposit import MakeDepositUseCase
-from ..application.use_cases.make_withdrawal import MakeWithdrawalUseCase
-from ..application.use_cases.make_transfer import MakeTransferUseCase
-from ..application.use_cases.get_statement import GetStatementUseCase
+from ..application.use_cases.open_account import AsyncOpenAccountUseCase, OpenAccountUseCase
+from ..application.use_cases.login import AsyncLoginUseCase, LoginUseCase
+from ..application.use_cases.make_deposit import AsyncMakeDepositUseCase, MakeDepositUseCase
+from ..application.use_cases.make_withdrawal import AsyncMakeWithdrawalUseCase, MakeWithdrawalUseCase
+from ..application.use_cases.make_transfer import AsyncMakeTransferUseCase, MakeTransferUseCase
+from ..application.use_cases.get_statement import AsyncGetStatementUseCase, GetStatementUseCase
+from ..application.use_cases.process_batch import AsyncProcessBatchUseCase, ProcessBatchUseCase
+from ..application.use_cases.audit_balance import AuditBalanceUseCase
+from ..application.use_cases.import_accounts import ImportAccountsUseCase
+from ..application.use_cases.change_withdrawal_limits import (
+    AsyncChangeWithdrawalLimitsUseCase,
+    ChangeWithdrawalLimitsUseCase,
+)
 from ..infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite
+from ..infrastructure.repositories.account_repo_async import AsyncAccountRepositorySQLite
+from ..infrastructure.repositories.account_repo_group_commit import (
+    AsyncGroupCommitAccountRepository,
+    GroupCommitAccountRepository,
+    GroupCommitWriter,
+)
+from ..infrastructure.repositories.account_repo_cached import (
+    AccountCache,
+    AsyncCachedAccountRepository,
+    CachedAccountRepository,
+)
 from ..infrastructure.repositories.customer_repo_sqlite import CustomerRepositorySQLite
+from ..infrastructure.repositories.customer_repo_async import AsyncCustomerRepositorySQLite
+from ..infrastructure.repositories.transaction_repo_sqlite import TransactionRepositorySQLite
+from ..infrastructure.repositories.transaction_repo_async import AsyncTransactionRepositorySQLite
+from ..infrastructure.repositories.outbox_repo_sqlite import OutboxRepositorySQLite
+from ..infrastructure.repositories.account_snapshot_repo_sqlite import AccountSnapshotRepositorySQLite
+from ..infrastructure.repositories.account_import_repo_sqlite import AccountImportRepositorySQLite
+from ..infrastructure.repositories.memory_store import InMemoryStore
+from ..infrastructure.repositories.account_repo_memory import (
+    AsyncInMemoryAccountRepository,
+    InMemoryAccountRepository,
+)
+from ..infrastructure.repositories.customer_repo_memory import (
+    AsyncInMemoryCustomerRepository,
+    InMemoryCustomerRepository,
+)
+from ..infrastructure.repositories.transaction_repo_memory import (
+    AsyncInMemoryTransactionRepository,
+    InMemoryTransactionRepository,
+)
+from ..infrastructure.repositories.unit_of_work_memory import AsyncInMemoryUnitOfWork, InMemoryUnitOfWork
+from ..infrastructure.repositories.outbox_repo_memory import InMemoryOutboxRepository
+from ..infrastructure.repositories.account_snapshot_repo_memory import InMemoryAccountSnapshotRepository
+from ..infrastructure.repositories.account_import_repo_memory import InMemoryAccountImportRepository
+from ..infrastructure.repositories.unit_of_work_sqlite import UnitOfWorkSQLite
+from ..infrastructure.repositories.unit_of_work_async import AsyncUnitOfWorkSQLite
 from ..infrastructure.services.notification_service import ConsoleNotificationService
+from ..infrastructure.services.notification_sink import NotificationEventSink
+from ..infrastructure.services.outbox_dispatcher import OutboxDispatcher
+from ..infrastructure.services.snapshot_compactor import SnapshotCompactor
+from ..infrastructure.services.account_lock_manager import ShardedAccountLockManager
+from ..infrastructure.services.hashing_service import BcryptHashingService
+from ..infrastructure.services.credential_cache import VerifiedCredentialCache
+from ..infrastructure.services.token_service import HMACTokenService
+from ..infrastructure.services.instrumentation import Instrumentation, instrument
+from ..shared.utils.metrics import MetricsRegistry
+from .settings import settings
 
 class Container(containers.DeclarativeContainer):
     """
@@ -39,54 +99,433 @@ class Container(containers.DeclarativeContainer):
     define como ele será instanciado e compartilhado.
     """
 
-    # Repositórios (Infraestrutura)
-    account_repo = providers.Singleton(AccountRepositorySQLite)
-    customer_repo = providers.Singleton(CustomerRepositorySQLite)
+    # Caminho de I/O: "sync" (Session) ou "asynchronous" (AsyncSession)
+    io_mode = providers.Callable(
+        lambda: "asynchronous" if settings.async_database else "sync"
+    )
+
+    # Armazenamento: "sqlite" ou "memory" (InMemoryStore, no processo)
+    storage_mode = providers.Callable(lambda: settings.repository_backend)
+    memory_store = providers.Singleton(InMemoryStore)
+
+    # Cache de contas: "cached" (decorator read-through) ou "direct".
+    # Em memória não há o que economizar: sempre "direct".
+    account_cache_mode = providers.Callable(
+        lambda: (
+            "cached"
+            if settings.account_cache_size > 0 and settings.repository_backend == "sqlite"
+            else "direct"
+        )
+    )
+    account_cache = providers.Selector(
+        account_cache_mode,
+        cached=providers.Singleton(
+            AccountCache,
+            max_entries=settings.account_cache_size,
+            ttl=settings.account_cache_ttl,
+        ),
+        direct=providers.Object(None),
+    )
+    # Cache de credenciais verificadas (logins repetidos sem bcrypt)
+    credential_cache = providers.Singleton(
+        VerifiedCredentialCache,
+        max_entries=settings.credential_cache_size,
+        ttl=settings.credential_cache_ttl,
+    )
+
+    # Métricas: "on" (casos de uso e repositórios instrumentados) ou "off"
+    metrics_mode = providers.Callable(lambda: "on" if settings.metrics_enabled else "off")
+    metrics_registry = providers.Singleton(MetricsRegistry)
+    instrumentation = providers.Selector(
+        metrics_mode,
+        on=providers.Singleton(
+            Instrumentation,
+            registry=metrics_registry,
+            account_cache=account_cache,
+            credential_cache=credential_cache,
+        ),
+        off=providers.Object(None),
+    )
+
+    # Gravação das contas: "group_commit" (fila com commit em lote) ou
+    # "direct". O group commit existe apenas sobre o SQLite.
+    write_mode = providers.Callable(
+        lambda: (
+            "group_commit"
+            if settings.group_commit_enabled and settings.repository_backend == "sqlite"
+            else "direct"
+        )
+    )
+    group_commit_writer = providers.Singleton(
+        GroupCommitWriter,
+        max_batch=settings.group_commit_max_batch,
+        max_delay=settings.group_commit_max_delay_ms / 1000,
+    )
+
+    # Repositórios (Infraestrutura). Os providers usados pelos casos de
+    # uso passam por ``instrument``: com métricas desativadas, devolve o
+    # próprio repositório.
+    sqlite_account_repo = providers.Singleton(AccountRepositorySQLite)
+    base_account_repo = providers.Selector(
+        storage_mode,
+        sqlite=sqlite_account_repo,
+        memory=providers.Singleton(InMemoryAccountRepository, store=memory_store),
+    )
+    account_store = providers.Selector(
+        write_mode,
+        group_commit=providers.Singleton(
+            GroupCommitAccountRepository,
+            writer=group_commit_writer,
+            reader=sqlite_account_repo,
+        ),
+        direct=base_account_repo,
+    )
+    account_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            account_cache_mode,
+            cached=providers.Singleton(
+                CachedAccountRepository,
+                inner=account_store,
+                cache=account_cache,
+            ),
+            direct=account_store,
+        ),
+        kind="repository",
+        name="account",
+        instrumentation=instrumentation,
+    )
+    customer_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            storage_mode,
+            sqlite=providers.Singleton(CustomerRepositorySQLite),
+            memory=providers.Singleton(InMemoryCustomerRepository, store=memory_store),
+        ),
+        kind="repository",
+        name="customer",
+        instrumentation=instrumentation,
+    )
+    transaction_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            storage_mode,
+            sqlite=providers.Singleton(TransactionRepositorySQLite),
+            memory=providers.Singleton(InMemoryTransactionRepository, store=memory_store),
+        ),
+        kind="repository",
+        name="transaction",
+        instrumentation=instrumentation,
+    )
+
+    async_sqlite_account_repo = providers.Singleton(AsyncAccountRepositorySQLite)
+    async_base_account_repo = providers.Selector(
+        storage_mode,
+        sqlite=async_sqlite_account_repo,
+        memory=providers.Singleton(AsyncInMemoryAccountRepository, store=memory_store),
+    )
+    async_account_store = providers.Selector(
+        write_mode,
+        group_commit=providers.Singleton(
+            AsyncGroupCommitAccountRepository,
+            writer=group_commit_writer,
+            reader=async_sqlite_account_repo,
+        ),
+        direct=async_base_account_repo,
+    )
+    async_account_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            account_cache_mode,
+            cached=providers.Singleton(
+                AsyncCachedAccountRepository,
+                inner=async_account_store,
+                cache=account_cache,
+            ),
+            direct=async_account_store,
+        ),
+        kind="repository",
+        name="account",
+        instrumentation=instrumentation,
+    )
+    async_customer_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            storage_mode,
+            sqlite=providers.Singleton(AsyncCustomerRepositorySQLite),
+            memory=providers.Singleton(AsyncInMemoryCustomerRepository, store=memory_store),
+        ),
+        kind="repository",
+        name="customer",
+        instrumentation=instrumentation,
+    )
+    async_transaction_repo = providers.Factory(
+        instrument,
+        providers.Selector(
+            storage_mode,
+            sqlite=providers.Singleton(AsyncTransactionRepositorySQLite),
+            memory=providers.Singleton(AsyncInMemoryTransactionRepository, store=memory_store),
+        ),
+        kind="repository",
+        name="transaction",
+        instrumentation=instrumentation,
+    )
+
+    # Unidade de trabalho: uma nova instância (e transação) a cada uso
+    uow = providers.Selector(
+        storage_mode,
+        sqlite=providers.Factory(UnitOfWorkSQLite, account_cache=account_cache),
+        memory=providers.Factory(InMemoryUnitOfWork, store=memory_store),
+    )
+    async_uow = providers.Selector(
+        storage_mode,
+        sqlite=providers.Factory(AsyncUnitOfWorkSQLite, account_cache=account_cache),
+        memory=providers.Factory(AsyncInMemoryUnitOfWork, store=memory_store),
+    )
+
+    # Locks em memória por conta (serializam operações sobre a mesma conta)
+    account_locks = providers.Singleton(ShardedAccountLockManager, shards=settings.account_lock_shards)
 
     # Serviços externos (Infraestrutura)
     notifier = providers.Singleton(ConsoleNotificationService)
 
-    # Casos de uso (Aplicação)
+    # Outbox: eventos de domínio entregues em segundo plano aos sinks
+    outbox_repo = providers.Selector(
+        storage_mode,
+        sqlite=providers.Singleton(OutboxRepositorySQLite),
+        memory=providers.Singleton(InMemoryOutboxRepository, store=memory_store),
+    )
+    outbox_dispatcher = providers.Singleton(
+        OutboxDispatcher,
+        outbox=outbox_repo,
+        sinks=providers.List(
+            providers.Singleton(NotificationEventSink, notifier=notifier),
+        ),
+        batch_size=settings.outbox_batch_size,
+        poll_interval=settings.outbox_poll_interval,
+        max_attempts=settings.outbox_max_attempts,
+        lease_seconds=settings.outbox_lease_seconds,
+    )
+
+    # Snapshots do ledger, criados em segundo plano
+    snapshot_repo = providers.Selector(
+        storage_mode,
+        sqlite=providers.Singleton(AccountSnapshotRepositorySQLite),
+        memory=providers.Singleton(InMemoryAccountSnapshotRepository, store=memory_store),
+    )
+    snapshot_compactor = providers.Singleton(
+        SnapshotCompactor,
+        snapshots=snapshot_repo,
+        every_transactions=settings.snapshot_every_transactions,
+        max_age=timedelta(hours=settings.snapshot_max_age_hours),
+        interval=settings.snapshot_compactor_interval,
+        settle=settings.snapshot_settle_seconds,
+    )
+    hasher = providers.Singleton(
+        BcryptHashingService,
+        rounds=settings.bcrypt_rounds,
+        max_workers=settings.hashing_workers or None,
+        max_pending=settings.hashing_max_pending,
+        queue_timeout=settings.hashing_queue_timeout,
+    )
+    token_service = providers.Singleton(
+        HMACTokenService,
+        signing_secrets=settings.token_secrets.split(","),
+        ttl=settings.token_ttl,
+    )
+
+    # Casos de uso (Aplicação), instrumentados como os repositórios
     open_account_uc = providers.Factory(
-        OpenAccountUseCase,
-        account_repo=account_repo,
-        customer_repo=customer_repo,
-        notifier=notifier,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(
+                OpenAccountUseCase,
+                account_repo=account_repo,
+                customer_repo=customer_repo,
+                hasher=hasher,
+            ),
+            asynchronous=providers.Factory(
+                AsyncOpenAccountUseCase,
+                account_repo=async_account_repo,
+                customer_repo=async_customer_repo,
+                hasher=hasher,
+            ),
+        ),
+        kind="use_case",
+        name="open_account",
+        instrumentation=instrumentation,
     )
 
     login_uc = providers.Factory(
-        LoginUseCase,
-        customer_repo=customer_repo,
-        account_repo=account_repo,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(
+                LoginUseCase,
+                account_repo=account_repo,
+                hasher=hasher,
+                credential_cache=credential_cache,
+                token_service=token_service,
+            ),
+            asynchronous=providers.Factory(
+                AsyncLoginUseCase,
+                account_repo=async_account_repo,
+                hasher=hasher,
+                credential_cache=credential_cache,
+                token_service=token_service,
+            ),
+        ),
+        kind="use_case",
+        name="login",
+        instrumentation=instrumentation,
     )
 
     deposit_uc = providers.Factory(
-        MakeDepositUseCase,
-        account_repo=account_repo,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(MakeDepositUseCase, account_repo=account_repo, locks=account_locks),
+            asynchronous=providers.Factory(AsyncMakeDepositUseCase, account_repo=async_account_repo, locks=account_locks),
+        ),
+        kind="use_case",
+        name="deposit",
+        instrumentation=instrumentation,
     )
 
     withdrawal_uc = providers.Factory(
-        MakeWithdrawalUseCase,
-        account_repo=account_repo,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(MakeWithdrawalUseCase, account_repo=account_repo, locks=account_locks),
+            asynchronous=providers.Factory(AsyncMakeWithdrawalUseCase, account_repo=async_account_repo, locks=account_locks),
+        ),
+        kind="use_case",
+        name="withdrawal",
+        instrumentation=instrumentation,
+    )
+
+    limits_uc = providers.Factory(
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(ChangeWithdrawalLimitsUseCase, account_repo=account_repo, locks=account_locks),
+            asynchronous=providers.Factory(AsyncChangeWithdrawalLimitsUseCase, account_repo=async_account_repo, locks=account_locks),
+        ),
+        kind="use_case",
+        name="change_limits",
+        instrumentation=instrumentation,
     )
 
     transfer_uc = providers.Factory(
-        MakeTransferUseCase,
-        account_repo=account_repo,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(MakeTransferUseCase, uow_factory=uow.provider, locks=account_locks),
+            asynchronous=providers.Factory(AsyncMakeTransferUseCase, uow_factory=async_uow.provider, locks=account_locks),
+        ),
+        kind="use_case",
+        name="transfer",
+        instrumentation=instrumentation,
+    )
+
+    batch_uc = providers.Factory(
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(ProcessBatchUseCase, uow_factory=uow.provider, locks=account_locks),
+            asynchronous=providers.Factory(AsyncProcessBatchUseCase, uow_factory=async_uow.provider, locks=account_locks),
+        ),
+        kind="use_case",
+        name="batch",
+        instrumentation=instrumentation,
     )
 
     statement_uc = providers.Factory(
-        GetStatementUseCase,
-        account_repo=account_repo,
+        instrument,
+        providers.Selector(
+            io_mode,
+            sync=providers.Factory(
+                GetStatementUseCase,
+                account_repo=account_repo,
+                transaction_repo=transaction_repo,
+            ),
+            asynchronous=providers.Factory(
+                AsyncGetStatementUseCase,
+                account_repo=async_account_repo,
+                transaction_repo=async_transaction_repo,
+            ),
+        ),
+        kind="use_case",
+        name="statement",
+        instrumentation=instrumentation,
+    )
+
+    # Sempre síncrono e sem cache: compara o saldo gravado
+    audit_uc = providers.Factory(
+        instrument,
+        providers.Factory(
+            AuditBalanceUseCase,
+            account_repo=base_account_repo,
+            snapshot_repo=snapshot_repo,
+        ),
+        kind="use_case",
+        name="audit_balance",
+        instrumentation=instrumentation,
+    )
+
+    # Importação em massa (CLI): sempre síncrona, gravando direto no armazenamento
+    account_import_repo = providers.Selector(
+        storage_mode,
+        sqlite=providers.Singleton(AccountImportRepositorySQLite),
+        memory=providers.Singleton(InMemoryAccountImportRepository, store=memory_store),
+    )
+    import_accounts_uc = providers.Factory(
+        instrument,
+        providers.Factory(
+            ImportAccountsUseCase,
+            import_repo=account_import_repo,
+            customer_repo=customer_repo,
+            hasher=hasher,
+            chunk_size=settings.import_chunk_size,
+        ),
+        kind="use_case",
+        name="import_accounts",
+        instrumentation=instrumentation,
     )
 
 # Instância global do contêiner
 container = Container()
 
-# Exposição de fábrica dos casos de uso
-get_open_account_uc = container.open_account_uc
-get_login_uc = container.login_uc
-get_deposit_uc = container.deposit_uc
-get_withdrawal_uc = container.withdrawal_uc
-get_transfer_uc = container.transfer_uc
-get_statement_uc = container.statement_uc
+# Fábricas dos casos de uso, usadas como dependências do FastAPI.
+# São funções comuns (e não os providers em si) porque o FastAPI precisa
+# inspecionar a assinatura de cada dependência.
+def get_open_account_uc():
+    return container.open_account_uc()
+
+def get_login_uc():
+    return container.login_uc()
+
+def get_deposit_uc():
+    return container.deposit_uc()
+
+def get_withdrawal_uc():
+    return container.withdrawal_uc()
+
+def get_limits_uc():
+    return container.limits_uc()
+
+def get_transfer_uc():
+    return container.transfer_uc()
+
+def get_statement_uc():
+    return container.statement_uc()
+
+def get_batch_uc():
+    return container.batch_uc()
+
+def get_audit_uc():
+    return container.audit_uc()
+
+def get_import_accounts_uc():
+    return container.import_accounts_uc()
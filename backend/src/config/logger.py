@@ -0,0 +1,29 @@
+"""
+Configuração de Logging
+-----------------------
+
+Formato e nível dos logs da aplicação (Settings.log_level). Chamada uma
+vez na inicialização da API; os módulos usam apenas
+``logging.getLogger(__name__)``.
+"""
+
+import logging
+
+from .settings import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def setup_logging() -> None:
+    """
+    Configura o logger ``src`` (raiz dos loggers da aplicação). Não
+    altera o logger raiz, de modo que a configuração do servidor
+    (ex.: uvicorn) continua valendo para as demais bibliotecas.
+    """
+    logger = logging.getLogger(__name__.split(".")[0])
+    logger.setLevel(settings.log_level.upper())
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+        logger.propagate = False
@@ -4,6 +4,94 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./data/bank.db"
+    database_echo: bool = False
+    # Caminho de requisição assíncrono (repositórios sobre AsyncEngine)
+    async_database: bool = False
+    # Armazenamento dos repositórios: "sqlite" (DATABASE_URL) ou "memory"
+    # (apenas no processo, para benchmarks e testes; sem group commit
+    # nem cache de contas)
+    repository_backend: str = "sqlite"
     bcrypt_rounds: int = 12
+
+    # Observabilidade: nível dos logs e métricas em /metrics (latência
+    # dos casos de uso, repositórios e commits; erros de domínio; caches)
+    log_level: str = "INFO"
+    # Modo debug da API: respostas serializadas pelo caminho rápido
+    # (api.encoders) são validadas contra os schemas pydantic
+    api_debug: bool = False
+    metrics_enabled: bool = False
+
+    # Profiling sob demanda (src.api.profiling): requisições com
+    # X-Profile-Token assinado com o segredo, ou sorteadas pela taxa,
+    # geram flamegraphs em profiling_output_dir
+    profiling_enabled: bool = False
+    profiling_secret: str = ""
+    profiling_sample_rate: float = 0.0
+    profiling_interval_ms: float = 2.0
+    profiling_max_concurrent: int = 4
+    profiling_output_dir: str = "./data/profiles"
+
+    # Pool de processos do hash de senhas (0 = número de CPUs)
+    hashing_workers: int = 0
+    hashing_max_pending: int = 64
+    hashing_queue_timeout: float = 5.0
+
+    # Cache de credenciais verificadas (logins repetidos sem bcrypt)
+    credential_cache_size: int = 10000
+    credential_cache_ttl: float = 300.0
+
+    # Group commit: gravações concorrentes confirmadas em um único commit
+    group_commit_enabled: bool = False
+    group_commit_max_batch: int = 256
+    group_commit_max_delay_ms: float = 0.0
+
+    # Outbox de eventos de domínio (entrega em segundo plano)
+    outbox_dispatcher_enabled: bool = True
+    outbox_batch_size: int = 100
+    outbox_poll_interval: float = 0.5
+    outbox_max_attempts: int = 10
+    outbox_lease_seconds: float = 60.0
+
+    # Snapshots do ledger: limitam o replay a no máximo N lançamentos
+    # (ou um dia de movimentação) por conta
+    snapshot_compactor_enabled: bool = True
+    snapshot_every_transactions: int = 100
+    snapshot_max_age_hours: float = 24.0
+    snapshot_compactor_interval: float = 60.0
+    snapshot_settle_seconds: float = 60.0
+
+    # Importação de contas em massa (src.cli.import_accounts): registros
+    # por lote (uma consulta de CPFs e um INSERT por lote)
+    import_chunk_size: int = 1000
+
+    # Chaves dos sistemas autorizados a usar as rotas de lote e de
+    # auditoria (separadas por vírgula; vazio desativa as rotas)
+    batch_api_keys: str = ""
+
+    # Número de locks em memória por conta (shards por hash do account_id)
+    account_lock_shards: int = 1024
+
+    # Cache de contas em memória (0 desativa)
+    account_cache_size: int = 10000
+    account_cache_ttl: float = 30.0
+
+    # Tokens de sessão (HMAC). O primeiro segredo assina; os demais,
+    # separados por vírgula, só validam tokens antigos (rotação de chaves).
+    token_secrets: str = ""
+    token_ttl: int = 3600
+
+    # Pool de conexões (ignorado em bancos SQLite em memória)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30  # segundos aguardando uma conexão livre
+    db_pool_recycle: int = 1800  # segundos até reciclar uma conexão
+    db_pool_pre_ping: bool = True
+
+    # Pragmas aplicados a cada nova conexão SQLite
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268435456  # 256 MiB
+    sqlite_busy_timeout_ms: int = 5000
     
 settings = Settings()
@@ -8,7 +8,10 @@ uma conta bancária dentro da camada de Domínio da Clean Architecture.
 Este aggregate encapsula:
 - Estado e regras de negócio relacionadas ao saldo, transações e limites
 - Invariantes de domínio (ex.: limite diário de saque, contagem de saques)
-- Comportamentos essenciais: abrir conta, depósito, saque, extrato
+- Comportamentos essenciais: abrir conta, depósito, saque e registro
+  dos lançamentos gerados
+- Os eventos de domínio de cada operação (AccountOpened, DepositMade,
+  WithdrawalMade, TransferMade)
 
 Importante:
 Este arquivo contém exclusivamente *lógica de domínio*, sem dependências
@@ -17,11 +20,19 @@ de frameworks, transporte HTTP ou banco de dados.
 
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import List
+from typing import List, Optional
 
 from ..entities.customer import Customer
+from ..entities.transaction import Transaction, DEPOSIT, WITHDRAWAL
+from ..events.account_opened import AccountOpened
+from ..events.deposit_made import DepositMade
+from ..events.domain_event import DomainEvent
+from ..events.transfer_made import TransferMade
+from ..events.withdrawal_made import WithdrawalMade
+from ..services.account_rules import DEFAULT_WITHDRAWAL_LIMITS, WithdrawalLimits, check_withdrawal
+from ..value_objects.account_number import AccountNumber
 from ..value_objects.money import Money
-from ...domain.exceptions import InsufficientFunds, DailyLimitExceeded
+from ...shared.utils.uuid_generator import new_id
 
 @dataclass
 class Account:
@@ -29,22 +40,34 @@ class Account:
     Aggregate root que representa uma conta bancária no domínio.
 
     Responsável por:
-    - Armazenar informações principais (cliente, saldo, transações)
+    - Armazenar informações principais (cliente, saldo, limites)
+    - Registrar os lançamentos gerados por cada operação
     - Garantir regras de negócio e invariantes de domínio
     - Coordenar operações de depósito, saque e abertura da conta
     """
 
     account_id: str
     customer: Customer
+    # Número exibido ao cliente; atribuído pelo repositório ao gravar a conta
+    account_number: Optional[AccountNumber] = None
     balance: Money = field(default_factory=lambda: Money("0.00"))
-    transactions: List[dict] = field(default_factory=list)
-
-    # Regras de limite diário
-    daily_withdrawal_limit: Money = Money("3000.00")
+    # Apenas lançamentos novos, ainda não persistidos no ledger.
+    # O histórico nunca é carregado no aggregate: o extrato é servido
+    # diretamente pelo repositório de transações.
+    new_transactions: List[Transaction] = field(default_factory=list, repr=False)
+    # Eventos de domínio registrados e ainda não gravados no outbox
+    events: List[DomainEvent] = field(default_factory=list, repr=False)
+
+    # Regras de limite diário (limites do cliente e totais do dia)
+    withdrawal_limits: WithdrawalLimits = DEFAULT_WITHDRAWAL_LIMITS
     daily_withdrawal_amount: Money = field(default_factory=lambda: Money("0.00"))
     daily_withdrawal_count: int = 0
     last_withdrawal_date: date | None = None
 
+    # Versão persistida do aggregate (0 = conta ainda não gravada).
+    # Usada pelo repositório para controle otimista de concorrência.
+    version: int = 0
+
     @classmethod
     def open(cls, customer: Customer) -> "Account":
         """
@@ -53,16 +76,22 @@ class Account:
         Esta operação pertence ao domínio pois envolve regras e valores
         iniciais da aggregate root.
         """
-        import uuid
-
-        return cls(
-            account_id=str(uuid.uuid4()),
+        account = cls(
+            account_id=new_id(),
             customer=customer,
             balance=Money("0.00"),
-            transactions=[]
         )
-
-    def deposit(self, amount: Money, occurred_at: datetime):
+        account.events.append(
+            AccountOpened(account.account_id, customer.name, datetime.utcnow())
+        )
+        return account
+
+    def deposit(
+        self,
+        amount: Money,
+        occurred_at: datetime,
+        counterpart_account_id: Optional[str] = None,
+    ):
         """
         Realiza um depósito na conta.
 
@@ -72,13 +101,22 @@ class Account:
         """
         self.balance += amount
 
-        self.transactions.append({
-            "type": "deposit",
-            "amount": amount,
-            "occurred_at": occurred_at.isoformat()
-        })
+        self.new_transactions.append(
+            Transaction.record(
+                self.account_id, DEPOSIT, amount, occurred_at, counterpart_account_id
+            )
+        )
+        if counterpart_account_id is None:
+            self.events.append(
+                DepositMade(self.account_id, amount, self.balance, occurred_at)
+            )
 
-    def withdraw(self, amount: Money, occurred_at: datetime):
+    def withdraw(
+        self,
+        amount: Money,
+        occurred_at: datetime,
+        counterpart_account_id: Optional[str] = None,
+    ):
         """
         Realiza um saque aplicando todas as regras de negócio:
 
@@ -98,33 +136,69 @@ class Account:
             self.last_withdrawal_date = today
 
         # Regras de domínio
-        if self.balance < amount:
-            raise InsufficientFunds("Saldo insuficiente")
-
-        if self.daily_withdrawal_amount + amount > self.daily_withdrawal_limit:
-            raise DailyLimitExceeded(
-                "Limite diário de saque excedido (R$ 3.000)"
-            )
-
-        if self.daily_withdrawal_count >= 5:
-            raise DailyLimitExceeded(
-                "Limite de 5 saques por dia excedido"
-            )
+        check_withdrawal(
+            self.withdrawal_limits,
+            self.balance,
+            self.daily_withdrawal_amount,
+            self.daily_withdrawal_count,
+            amount,
+        )
 
         # Aplicação das mudanças de estado
         self.balance -= amount
         self.daily_withdrawal_amount += amount
         self.daily_withdrawal_count += 1
 
-        self.transactions.append({
-            "type": "withdrawal",
-            "amount": amount,
-            "occurred_at": occurred_at.isoformat()
-        })
+        self.new_transactions.append(
+            Transaction.record(
+                self.account_id, WITHDRAWAL, amount, occurred_at, counterpart_account_id
+            )
+        )
+        if counterpart_account_id is None:
+            self.events.append(
+                WithdrawalMade(self.account_id, amount, self.balance, occurred_at)
+            )
+
+    def change_withdrawal_limits(self, limits: WithdrawalLimits):
+        """
+        Define limites de saque próprios do cliente. Os totais já
+        sacados no dia continuam valendo contra os novos limites.
+        """
+        self.withdrawal_limits = limits
+
+    def transfer_to(self, target: "Account", amount: Money, occurred_at: datetime):
+        """
+        Transfere um valor desta conta para a conta de destino.
+
+        Regras aplicadas:
+        - Origem e destino devem ser contas diferentes
+        - O débito segue todas as regras de saque (saldo e limites diários)
+        - Cada lado registra seu lançamento apontando para a outra conta
+        """
+        if target.account_id == self.account_id:
+            raise ValueError("Conta de origem e destino devem ser diferentes")
+
+        self.withdraw(amount, occurred_at, counterpart_account_id=target.account_id)
+        target.deposit(amount, occurred_at, counterpart_account_id=self.account_id)
+
+        self.events.append(
+            TransferMade(
+                self.account_id, target.account_id, amount, self.balance, occurred_at
+            )
+        )
+
+    def pull_new_transactions(self) -> List[Transaction]:
+        """
+        Retorna e limpa os lançamentos pendentes de persistência.
+        Chamado pelo repositório ao gravar o aggregate.
+        """
+        pending, self.new_transactions = self.new_transactions, []
+        return pending
 
-    def get_statement(self) -> List[dict]:
+    def pull_events(self) -> List[DomainEvent]:
         """
-        Retorna uma cópia imutável da lista de transações da conta
-        (evita mutação externa do estado interno do aggregate).
+        Retorna e limpa os eventos de domínio pendentes.
+        Chamado pelo repositório, que os grava no outbox junto com o estado.
         """
-        return self.transactions.copy()
+        pending, self.events = self.events, []
+        return pending
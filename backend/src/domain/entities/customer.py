@@ -8,10 +8,10 @@ A senha nunca é guardada em texto claro — só o hash.
 
 from dataclasses import dataclass, field
 from typing import Optional
-import uuid
 
 from ...domain.value_objects.cpf import CPF
 from ...domain.value_objects.password import Password
+from ...shared.utils.uuid_generator import new_id
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,22 +21,20 @@ class Customer:
     name: str
     email: str
     cpf: CPF
-    customer_id: str = field(default_factory=lambda: str(uuid.uuid4()))  # UUID único da entidade
+    customer_id: str = field(default_factory=new_id)  # UUIDv7 único da entidade
     _password: Optional[Password] = None  # só guarda o hash da senha
 
     @classmethod
-    def create(cls, name: str, email: str, cpf: str, plain_password: str) -> "Customer":
+    def create(cls, name: str, email: str, cpf: str, password_hash: str) -> "Customer":
         """
         Forma recomendada de criar um Customer.
-        Já valida o CPF e faz o hash da senha automaticamente.
+        Já valida o CPF; a senha chega como hash, calculado pelo
+        IPasswordHasher.
         """
-        pwd = Password.create(plain_password)   # hash da senha
         cpf_vo = CPF(cpf)                        # valida e encapsula o CPF
-        return cls(name=name, email=email, cpf=cpf_vo, _password=pwd)
+        return cls(name=name, email=email, cpf=cpf_vo, _password=Password(hashed=password_hash))
 
-    def verify_password(self, plain_password: str) -> bool:
-        """Compara a senha informada com o hash armazenado."""
-        if not self._password:
-            return False
-        return self._password.verify(plain_password)
-    
\ No newline at end of file
+    @property
+    def password_hash(self) -> Optional[str]:
+        """Hash da senha armazenado (None se o cliente não tiver senha)."""
+        return self._password.hashed if self._password else None
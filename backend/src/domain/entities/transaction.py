@@ -0,0 +1,65 @@
+"""
+Entidade Transaction
+--------------------
+Representa um lançamento do extrato (ledger) de uma conta.
+
+Cada depósito, saque ou transferência gera exatamente um lançamento
+imutável, que é anexado ao histórico da conta e nunca alterado depois
+de persistido (ledger append-only).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from ..value_objects.money import Money
+from ...shared.utils.uuid_generator import new_id
+
+
+DEPOSIT = "deposit"
+WITHDRAWAL = "withdrawal"
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    """Lançamento imutável do extrato de uma conta."""
+
+    transaction_id: str
+    account_id: str
+    type: str  # deposit, withdrawal
+    amount: Money
+    occurred_at: datetime
+    target_account_id: Optional[str] = None  # preenchido em transferências
+
+    @classmethod
+    def record(
+        cls,
+        account_id: str,
+        type: str,
+        amount: Money,
+        occurred_at: datetime,
+        target_account_id: Optional[str] = None,
+    ) -> "Transaction":
+        """
+        Forma recomendada de criar um lançamento.
+        Gera o identificador único da transação automaticamente (UUIDv7,
+        crescente no tempo).
+        """
+        return cls(
+            transaction_id=new_id(),
+            account_id=account_id,
+            type=type,
+            amount=amount,
+            occurred_at=occurred_at,
+            target_account_id=target_account_id,
+        )
+
+    def to_dict(self) -> dict:
+        """Representação simples usada pelas camadas externas (ex.: API)."""
+        return {
+            "transaction_id": self.transaction_id,
+            "type": self.type,
+            "amount": self.amount.amount,
+            "occurred_at": self.occurred_at.isoformat(),
+            "target_account_id": self.target_account_id,
+        }
@@ -0,0 +1,20 @@
+"""
+Evento de domínio: AccountOpened
+--------------------------------
+Registrado quando uma nova conta é aberta.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .domain_event import DomainEvent, new_event_id
+
+
+@dataclass(frozen=True)
+class AccountOpened(DomainEvent):
+    name = "account_opened"
+
+    account_id: str
+    customer_name: str
+    occurred_at: datetime
+    event_id: str = field(default_factory=new_event_id)
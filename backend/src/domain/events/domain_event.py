@@ -0,0 +1,57 @@
+"""
+Evento de domínio: DomainEvent
+------------------------------
+
+Base dos eventos de domínio: fatos imutáveis, já ocorridos, registrados
+pelo aggregate Account a cada mudança de estado relevante.
+
+Os eventos são gravados (outbox) na mesma transação de banco da mudança
+de estado e entregues depois, de forma assíncrona, aos interessados
+(notificações, integrações). Assim, um evento nunca é publicado para uma
+operação que não foi confirmada, nem perdido para uma que foi.
+
+Todo evento possui:
+- account_id: conta (aggregate) que originou o evento
+- occurred_at: instante da operação
+- event_id: identificador único (idempotência na entrega)
+"""
+
+from dataclasses import fields
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, ClassVar
+
+from ..value_objects.money import Money
+from ...shared.utils.uuid_generator import new_id
+
+
+def new_event_id() -> str:
+    return new_id()
+
+
+class DomainEvent:
+    """
+    Classe base dos eventos de domínio (as subclasses são dataclasses
+    imutáveis).
+    """
+
+    # Nome estável do evento, usado na serialização
+    name: ClassVar[str]
+
+    account_id: str
+    occurred_at: datetime
+    event_id: str
+
+    def payload(self) -> dict:
+        """Representação serializável em JSON (valores como texto ISO/decimal)."""
+        return {f.name: _serialize(getattr(self, f.name)) for f in fields(self)}
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, Money):
+        return str(value.amount)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
@@ -0,0 +1,23 @@
+"""
+Evento de domínio: TransferMade
+-------------------------------
+Registrado pela conta de origem a cada transferência concluída.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ..value_objects.money import Money
+from .domain_event import DomainEvent, new_event_id
+
+
+@dataclass(frozen=True)
+class TransferMade(DomainEvent):
+    name = "transfer_made"
+
+    account_id: str  # conta de origem
+    target_account_id: str
+    amount: Money
+    balance: Money  # saldo da origem após a operação
+    occurred_at: datetime
+    event_id: str = field(default_factory=new_event_id)
@@ -0,0 +1,23 @@
+"""
+Evento de domínio: WithdrawalMade
+---------------------------------
+Registrado a cada saque da conta (exceto o débito de uma
+transferência, coberto por TransferMade).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ..value_objects.money import Money
+from .domain_event import DomainEvent, new_event_id
+
+
+@dataclass(frozen=True)
+class WithdrawalMade(DomainEvent):
+    name = "withdrawal_made"
+
+    account_id: str
+    amount: Money
+    balance: Money  # saldo após a operação
+    occurred_at: datetime
+    event_id: str = field(default_factory=new_event_id)
@@ -51,3 +51,12 @@ class DuplicateCPFException(DomainException):
     no sistema, violando a regra de unicidade do documento.
     """
     pass
+
+
+class ConcurrentModificationError(DomainException):
+    """
+    Lançada quando um aggregate é gravado a partir de uma versão
+    desatualizada, ou seja, outra operação o alterou desde que ele foi
+    carregado. A operação deve ser refeita com o estado atual.
+    """
+    pass
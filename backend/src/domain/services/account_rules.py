@@ -0,0 +1,71 @@
+"""
+Serviço de domínio: regras de saque
+-----------------------------------
+
+Concentra as regras aplicadas a cada saque (saldo suficiente e limites
+diários de valor e de quantidade) e os limites de cada cliente.
+
+Os limites padrão valem para todas as contas; um cliente pode ter
+limites próprios (ex.: maiores para contas empresariais), gravados na
+conta. Os totais do dia ficam na própria conta, de modo que conferir um
+saque não exige consultar o histórico.
+"""
+
+from dataclasses import dataclass
+
+from ..exceptions import DailyLimitExceeded, InsufficientFunds
+from ..value_objects.money import Money
+
+
+@dataclass(frozen=True)
+class WithdrawalLimits:
+    """
+    Limites diários de saque de um cliente.
+
+    - daily_amount: valor máximo somado dos saques do dia
+    - daily_count: número máximo de saques no dia
+    """
+
+    daily_amount: Money = Money("3000.00")
+    daily_count: int = 5
+
+    def __post_init__(self):
+        if self.daily_amount.amount < 0 or self.daily_count < 0:
+            raise ValueError("Os limites de saque não podem ser negativos")
+
+
+DEFAULT_WITHDRAWAL_LIMITS = WithdrawalLimits()
+
+
+def check_withdrawal(
+    limits: WithdrawalLimits,
+    balance: Money,
+    daily_amount: Money,
+    daily_count: int,
+    amount: Money,
+) -> None:
+    """
+    Valida um saque contra o saldo e os totais já sacados no dia.
+
+    Raises:
+        InsufficientFunds: saldo menor que o valor do saque
+        DailyLimitExceeded: limite diário de valor ou de quantidade atingido
+    """
+    if balance < amount:
+        raise InsufficientFunds("Saldo insuficiente")
+
+    if limits.daily_amount < daily_amount + amount:
+        raise DailyLimitExceeded(
+            f"Limite diário de saque excedido (R$ {_format_brl(limits.daily_amount)})"
+        )
+
+    if daily_count >= limits.daily_count:
+        raise DailyLimitExceeded(
+            f"Limite de {limits.daily_count} saques por dia excedido"
+        )
+
+
+def _format_brl(money: Money) -> str:
+    # 3000.00 -> "3.000"; 1500.50 -> "1.500,50"
+    text = f"{money.amount:,.2f}".translate(str.maketrans(",.", ".,"))
+    return text[:-3] if text.endswith(",00") else text
@@ -0,0 +1,82 @@
+"""
+Serviço de domínio: replay do ledger
+------------------------------------
+
+Deriva o estado de uma conta (saldo e contadores de saque diário) a
+partir dos lançamentos do ledger, aplicando as mesmas regras de
+Account.deposit / Account.withdraw.
+
+O replay parte de um estado conhecido (um snapshot, ou a conta vazia) e
+aplica apenas os lançamentos posteriores a ele, de modo que o custo
+depende do número de lançamentos desde o último snapshot, e não da
+idade da conta.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from ..entities.transaction import DEPOSIT, WITHDRAWAL, Transaction
+from ..value_objects.money import Money
+
+
+@dataclass(frozen=True)
+class LedgerState:
+    """
+    Estado de uma conta derivado do ledger até um lançamento.
+
+    - ledger_count: número de lançamentos aplicados desde a abertura
+    - last_occurred_at / last_transaction_id: posição do último
+      lançamento aplicado (a mesma ordem do extrato)
+    """
+
+    account_id: str
+    balance: Money = Money("0.00")
+    daily_withdrawal_amount: Money = Money("0.00")
+    daily_withdrawal_count: int = 0
+    last_withdrawal_date: Optional[date] = None
+    ledger_count: int = 0
+    last_occurred_at: Optional[datetime] = None
+    last_transaction_id: Optional[str] = None
+
+
+def replay(state: LedgerState, transactions: Iterable[Transaction]) -> LedgerState:
+    """
+    Aplica os lançamentos, em ordem cronológica, ao estado informado.
+
+    Os totais são acumulados em centavos inteiros; Money só é construído
+    para o estado final.
+    """
+    balance = state.balance.cents
+    daily_amount = state.daily_withdrawal_amount.cents
+    daily_count = state.daily_withdrawal_count
+    last_withdrawal_date = state.last_withdrawal_date
+    count = state.ledger_count
+    last = None
+
+    for t in transactions:
+        if t.type == DEPOSIT:
+            balance += t.amount.cents
+        elif t.type == WITHDRAWAL:
+            day = t.occurred_at.date()
+            if last_withdrawal_date != day:
+                daily_amount, daily_count, last_withdrawal_date = 0, 0, day
+            balance -= t.amount.cents
+            daily_amount += t.amount.cents
+            daily_count += 1
+        count += 1
+        last = t
+
+    if last is None:
+        return state
+
+    return replace(
+        state,
+        balance=Money.from_cents(balance),
+        daily_withdrawal_amount=Money.from_cents(daily_amount),
+        daily_withdrawal_count=daily_count,
+        last_withdrawal_date=last_withdrawal_date,
+        ledger_count=count,
+        last_occurred_at=last.occurred_at,
+        last_transaction_id=last.transaction_id,
+    )
@@ -0,0 +1,48 @@
+
+from dataclasses import dataclass
+import re
+
+@dataclass(frozen=True, slots=True)
+class AccountNumber:
+    """
+    Número de conta exibido ao cliente: até 8 dígitos mais um dígito
+    verificador (ex.: "00001234-3").
+
+    O dígito verificador (módulo 11) detecta erros de digitação de um
+    dígito e a troca de dois dígitos vizinhos.
+    """
+
+    number: int
+
+    MAX = 99_999_999
+
+    def __post_init__(self):
+        if not 0 < self.number <= self.MAX:
+            raise ValueError("Número de conta inválido")
+
+    @property
+    def check_digit(self) -> int:
+        return self._check_digit(f"{self.number:08d}")
+
+    @staticmethod
+    def _check_digit(digits: str) -> int:
+        s = sum(int(d) * (len(digits) + 1 - i) for i, d in enumerate(digits))
+        return (s * 10 % 11) % 10
+
+    @classmethod
+    def parse(cls, text: str) -> "AccountNumber":
+        """
+        Converte o número informado pelo cliente ("00001234-3" ou
+        "000012343"), conferindo o dígito verificador.
+        """
+        digits = re.sub(r"\D", "", text)
+        if len(digits) < 2 or len(digits) > 9:
+            raise ValueError("Número de conta inválido")
+
+        body, digit = digits[:-1].zfill(8), int(digits[-1])
+        if cls._check_digit(body) != digit:
+            raise ValueError("Dígito verificador da conta inválido")
+        return cls(int(body))
+
+    def __str__(self) -> str:
+        return f"{self.number:08d}-{self.check_digit}"
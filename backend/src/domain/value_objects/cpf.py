@@ -1,28 +1,55 @@
 
-
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
+_NON_DIGITS = re.compile(r"[^0-9]")
+
+# Pesos dos dígitos verificadores: 10..2 (primeiro) e 11..2 (segundo)
+_WEIGHTS_1 = tuple(range(10, 1, -1))
+_WEIGHTS_2 = tuple(range(11, 1, -1))
+
 @dataclass(frozen=True, slots=True)
 class CPF:
+    """
+    CPF validado. ``value`` guarda sempre a forma canônica (apenas os 11
+    dígitos), usada como chave em buscas e caches; ``str()`` devolve a
+    forma formatada (000.000.000-00).
+    """
+
     value: str
 
     def __post_init__(self):
-        if not self._is_valid(self.value):
+        digits = self.normalize(self.value)
+        if not _is_valid(digits):
             raise ValueError("CPF inválido")
-    
+        object.__setattr__(self, "value", digits)
+
+    @staticmethod
+    def normalize(cpf: str) -> str:
+        """Forma canônica (apenas dígitos), sem validar."""
+        if cpf.isascii() and cpf.isdigit():
+            return cpf
+        return _NON_DIGITS.sub("", cpf)
+
     @staticmethod
     def _is_valid(cpf: str) -> bool:
-        cpf = re.sub(r"\D", "", cpf)
-        if len(cpf) != 11 or len(set(cpf)) == 1:
-            return False
-        # validação dos dígitos verificadores
-        def calc_digit(cpf_part: str) -> int:
-            s = sum(int(cpf_part[i]) * (len(cpf_part) + 1 - i) for i in range(len(cpf_part)))
-            return (s * 10 % 11) % 10
-        return calc_digit(cpf[:9]) == int(cpf[9]) and calc_digit(cpf[:10]) == int(cpf[10])
-    
+        return _is_valid(CPF.normalize(cpf))
+
     def __str__(self) -> str:
         c = self.value
         return f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}"
-    
\ No newline at end of file
+
+def _check_digit(digits: str, weights: tuple) -> int:
+    s = sum(int(d) * w for d, w in zip(digits, weights))
+    return (s * 10 % 11) % 10
+
+@lru_cache(maxsize=65536)
+def _is_valid(digits: str) -> bool:
+    # Memoizado: o mesmo CPF é validado a cada login e busca
+    if len(digits) != 11 or len(set(digits)) == 1:
+        return False
+    return (
+        _check_digit(digits[:9], _WEIGHTS_1) == int(digits[9])
+        and _check_digit(digits[:10], _WEIGHTS_2) == int(digits[10])
+    )
@@ -1,33 +1,72 @@
 
-
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from dataclasses import dataclass
+from typing import Iterable
+
+_HUNDRED = Decimal(100)
 
 @dataclass(frozen=True, slots=True)
 class Money:
-    amount: Decimal
+    """
+    Valor monetário em reais, guardado como um inteiro de centavos.
+
+    A conversão de/para Decimal acontece apenas nas bordas (entrada da
+    API, banco de dados); somas, subtrações e comparações operam sobre
+    inteiros, sem novo arredondamento a cada operação.
+    """
+
+    cents: int
 
     ZERO = Decimal("0.00")
 
     def __init__(self, amount: str | float | Decimal | int):
-        if isinstance(amount, str):
-            amount = Decimal(amount.replace(",", "."))
-        elif isinstance(amount, (int, float)):
-            amount = Decimal(str(amount))
-        object.__setattr__(self, "amount", amount.quantize(Decimal("0.01")))
+        if isinstance(amount, int):
+            cents = amount * 100
+        else:
+            if isinstance(amount, str):
+                amount = Decimal(amount.replace(",", "."))
+            elif isinstance(amount, float):
+                amount = Decimal(str(amount))
+            if not amount.is_finite():
+                raise InvalidOperation(f"Valor inválido: {amount}")
+            # Arredondamento half-even, como Decimal.quantize
+            cents = round(amount * _HUNDRED)
+        object.__setattr__(self, "cents", cents)
+
+    @classmethod
+    def from_cents(cls, cents: int) -> "Money":
+        """Constrói o valor diretamente a partir dos centavos (sem conversão)."""
+        money = object.__new__(cls)
+        object.__setattr__(money, "cents", cents)
+        return money
+
+    @classmethod
+    def total(cls, amounts: Iterable["Money"]) -> "Money":
+        """Soma exata de vários valores."""
+        return cls.from_cents(sum(m.cents for m in amounts))
+
+    @property
+    def amount(self) -> Decimal:
+        """Valor em reais, com duas casas decimais."""
+        return Decimal(self.cents).scaleb(-2)
 
     def __add__(self, other: "Money") -> "Money":
-        return Money(self.amount + other.amount)
+        return Money.from_cents(self.cents + other.cents)
 
     def __sub__(self, other: "Money") -> "Money":
-        return Money(self.amount - other.amount)
+        return Money.from_cents(self.cents - other.cents)
 
     def __lt__(self, other: "Money") -> bool:
-        return self.amount < other.amount
+        return self.cents < other.cents
 
     def __le__(self, other: "Money") -> bool:
-        return self.amount <= other.amount
+        return self.cents <= other.cents
+
+    def __gt__(self, other: "Money") -> bool:
+        return self.cents > other.cents
+
+    def __ge__(self, other: "Money") -> bool:
+        return self.cents >= other.cents
 
     def __repr__(self) -> str:
         return f"R${self.amount:.2f}".replace(".", ",")
-    
\ No newline at end of file
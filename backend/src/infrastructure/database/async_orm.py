@@ -0,0 +1,96 @@
+"""
+Engine assíncrono
+-----------------
+Fornece o AsyncEngine e as sessões assíncronas usadas pelos repositórios
+do caminho async (habilitado por ``Settings.async_database``).
+
+O engine usa o mesmo ``database_url`` do engine síncrono, trocando apenas
+o driver pela variante assíncrona (aiosqlite para SQLite, asyncpg para
+PostgreSQL), com o mesmo pool e os mesmos pragmas SQLite.
+
+O engine só é criado no primeiro uso: sem o caminho async habilitado,
+os drivers assíncronos nem precisam estar instalados.
+"""
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ...config.settings import Settings, settings
+from .orm import configure_sqlite, is_sqlite_memory
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def to_async_url(database_url: str) -> URL:
+    """Troca o driver da URL pela sua variante assíncrona."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if url.get_driver_name() in ("aiosqlite", "asyncpg"):
+        return url
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Banco '{backend}' sem driver assíncrono configurado.")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+def create_async_db_engine(config: Settings) -> AsyncEngine:
+    """
+    Cria o AsyncEngine a partir das configurações da aplicação, com as
+    mesmas regras de pool e pragmas de ``orm.create_db_engine``.
+    """
+    url = to_async_url(config.database_url)
+
+    if url.get_backend_name() != "sqlite":
+        return create_async_engine(
+            url,
+            echo=config.database_echo,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+        )
+
+    in_memory = is_sqlite_memory(url.database)
+    connect_args = {"check_same_thread": False}
+
+    if in_memory:
+        engine = create_async_engine(
+            url,
+            echo=config.database_echo,
+            connect_args=connect_args,
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_async_engine(
+            url,
+            echo=config.database_echo,
+            connect_args=connect_args,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+        )
+
+    # Os eventos de conexão vivem no engine síncrono subjacente
+    configure_sqlite(engine.sync_engine, config, in_memory)
+    return engine
+
+_async_engine: AsyncEngine | None = None
+
+def get_async_engine() -> AsyncEngine:
+    """Retorna o AsyncEngine da aplicação, criando-o no primeiro uso."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(settings)
+    return _async_engine
+
+def async_session() -> AsyncSession:
+    """
+    Nova sessão assíncrona. ``expire_on_commit=False`` evita recarregar
+    (com I/O implícito) os modelos após o commit.
+    """
+    return AsyncSession(get_async_engine(), expire_on_commit=False)
@@ -11,13 +11,16 @@ Importante:
 - O domínio não conhece este modelo
 - Apenas repositórios da infraestrutura interagem diretamente com ele
 - Campos relacionados ao cliente estão “embutidos” (denormalização leve)
+- Identificadores (UUIDv7) são gravados em binário (BinaryUUID)
 """
 
 from sqlmodel import SQLModel, Field
 from decimal import Decimal
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 
+from ..types import BinaryUUID
+
 
 class AccountModel(SQLModel, table=True):
     """
@@ -25,20 +28,40 @@ class AccountModel(SQLModel, table=True):
 
     Campos:
     - account_id: identificador único da conta
+    - account_number: número da conta exibido ao cliente (sem o dígito
+      verificador), sequencial e atribuído na inserção
     - customer_id: identificador do cliente (ainda não usado totalmente)
     - customer_name: nome do titular
     - customer_email: email do titular
-    - customer_cpf: CPF do titular (único no sistema)
+    - customer_cpf: CPF do titular, na forma canônica (11 dígitos; único)
     - customer_birth_date: data de nascimento, opcional
     - password_hash: hash da senha do cliente
     - balance: saldo da conta com precisão decimal
+    - daily_withdrawal_amount / daily_withdrawal_count: totais de saque
+      do dia indicado em last_withdrawal_date
+    - daily_withdrawal_limit / daily_withdrawal_count_limit: limites de
+      saque próprios do cliente (nulos = limites padrão)
+    - version: versão da linha, para controle otimista de concorrência
+    - ledger_count: lançamentos gravados no ledger da conta
+    - snapshot_ledger_count / snapshot_taken_at: posição e instante do
+      último snapshot (usados para decidir quando criar o próximo)
     """
 
-    account_id: str = Field(primary_key=True)
-    customer_id: str = Field(index=True)  # Adicionado
+    account_id: str = Field(primary_key=True, sa_type=BinaryUUID)
+    account_number: Optional[int] = Field(default=None, unique=True)
+    customer_id: str = Field(index=True, sa_type=BinaryUUID)  # Adicionado
     customer_name: str = Field(index=True)
     customer_email: str = Field(index=True)  # Adicionado
     customer_cpf: str = Field(index=True, unique=True)
     customer_birth_date: Optional[date] = None
     password_hash: str
     balance: Decimal = Field(default=Decimal("0.00"), decimal_places=2, max_digits=12)
+    daily_withdrawal_amount: Decimal = Field(default=Decimal("0.00"), decimal_places=2, max_digits=12)
+    daily_withdrawal_count: int = 0
+    last_withdrawal_date: Optional[date] = None
+    daily_withdrawal_limit: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=12)
+    daily_withdrawal_count_limit: Optional[int] = None
+    version: int = Field(default=1)
+    ledger_count: int = 0
+    snapshot_ledger_count: int = 0
+    snapshot_taken_at: Optional[datetime] = None
@@ -0,0 +1,34 @@
+"""
+Modelo ORM: AccountSnapshotModel
+--------------------------------
+Snapshots do estado das contas derivado do ledger (ver
+domain/services/ledger_replay). Cada linha registra o estado até a
+posição (last_occurred_at, last_transaction_id) do extrato da conta.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+from ..types import BinaryUUID
+
+
+class AccountSnapshotModel(SQLModel, table=True):
+    # Último snapshot de uma conta: busca direta pelo índice
+    __table_args__ = (
+        Index("ix_snapshot_account_id", "account_id", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    account_id: str = Field(foreign_key="accountmodel.account_id", sa_type=BinaryUUID)
+    balance: Decimal = Field(decimal_places=2, max_digits=12)
+    daily_withdrawal_amount: Decimal = Field(decimal_places=2, max_digits=12)
+    daily_withdrawal_count: int
+    last_withdrawal_date: Optional[date] = None
+    ledger_count: int
+    last_occurred_at: datetime
+    last_transaction_id: str = Field(sa_type=BinaryUUID)
+    created_at: datetime
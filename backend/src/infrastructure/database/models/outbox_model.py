@@ -0,0 +1,47 @@
+"""
+Modelo ORM: OutboxModel
+-----------------------
+Tabela do outbox transacional: cada evento de domínio é gravado aqui na
+mesma transação da mudança de estado que o originou, e entregue depois
+pelo OutboxDispatcher.
+
+Campos:
+- id: sequência de gravação (ordem de entrega)
+- event_id: identificador único do evento (idempotência nos consumidores)
+- event_type: nome estável do evento (ex.: "deposit_made")
+- account_id: conta que originou o evento
+- payload: evento serializado em JSON
+- occurred_at: instante da operação
+- dispatched_at: instante da entrega (None = pendente)
+- attempts: entregas que falharam até agora
+- claimed_by: dispatcher que reivindicou a mensagem para entrega
+- claimed_until: fim da concessão (depois dele, outro dispatcher pode
+  reivindicá-la)
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+from ..types import BinaryUUID
+
+
+class OutboxModel(SQLModel, table=True):
+    # Índice das pendências: a busca do dispatcher não varre os eventos
+    # já entregues, que permanecem na tabela como histórico
+    __table_args__ = (
+        Index("ix_outbox_pending", "dispatched_at", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    event_id: str = Field(unique=True, sa_type=BinaryUUID)
+    event_type: str
+    account_id: str = Field(index=True, sa_type=BinaryUUID)
+    payload: str
+    occurred_at: datetime
+    dispatched_at: Optional[datetime] = None
+    attempts: int = 0
+    claimed_by: Optional[str] = None
+    claimed_until: Optional[datetime] = None
@@ -1,15 +1,31 @@
 
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 
 from decimal import Decimal
 from datetime import datetime
 from typing import Optional
 
+from ..types import BinaryUUID
+
 class TransactionModel(SQLModel, table=True):
-    transaction_id: str = Field(primary_key=True)
-    account_id: str = Field(foreign_key="accountmodel.account_id", index=True)
+    # Índice composto para o extrato: filtra pela conta e já entrega as
+    # linhas ordenadas por data (desempate pelo ID), permitindo paginação
+    # por cursor (keyset) sem varrer o histórico inteiro.
+    __table_args__ = (
+        Index(
+            "ix_transaction_account_occurred",
+            "account_id",
+            "occurred_at",
+            "transaction_id",
+        ),
+    )
+
+    # Identificadores UUIDv7 em binário: chaves de 16 bytes, crescentes
+    transaction_id: str = Field(primary_key=True, sa_type=BinaryUUID)
+    account_id: str = Field(foreign_key="accountmodel.account_id", sa_type=BinaryUUID)
     type: str  # deposit, withdrawal, transfer
     amount: Decimal = Field(decimal_places=2, max_digits=12)
     occurred_at: datetime
     # Para transferências, podemos adicionar campo de conta destino
-    target_account_id: Optional[str] = None
+    target_account_id: Optional[str] = Field(default=None, sa_type=BinaryUUID)
@@ -1,15 +1,96 @@
 
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
 from pathlib import Path
 
+from ...config.settings import Settings, settings
 from .models.account_model import AccountModel
 from .models.transaction_model import TransactionModel  # importar o novo modelo
+from .models.outbox_model import OutboxModel
+from .models.account_snapshot_model import AccountSnapshotModel
 
-DATABASE_URL = "sqlite:///./data/bank.db"
-engine = create_engine(DATABASE_URL, echo=False)
+def is_sqlite_memory(database: str | None) -> bool:
+    return not database or database == ":memory:" or "mode=memory" in database
+
+def create_db_engine(config: Settings) -> Engine:
+    """
+    Cria o engine do banco a partir das configurações da aplicação.
+
+    - Bancos de servidor (ex.: PostgreSQL): pool com tamanho, overflow,
+      pre-ping e reciclagem de conexões definidos em Settings
+    - SQLite em arquivo: o mesmo pool, mais pragmas aplicados a cada
+      conexão (WAL, synchronous, cache, mmap e busy_timeout). Em WAL os
+      leitores não bloqueiam o escritor (e vice-versa)
+    - SQLite em memória: conexão única compartilhada (StaticPool)
+    """
+    url = make_url(config.database_url)
+
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            echo=config.database_echo,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+        )
+
+    in_memory = is_sqlite_memory(url.database)
+    connect_args = {"check_same_thread": False}
+
+    if in_memory:
+        engine = create_engine(
+            url,
+            echo=config.database_echo,
+            connect_args=connect_args,
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(
+            url,
+            echo=config.database_echo,
+            connect_args=connect_args,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+        )
+
+    configure_sqlite(engine, config, in_memory)
+    return engine
+
+def configure_sqlite(engine: Engine, config: Settings, in_memory: bool) -> None:
+    # O driver sqlite3 abre transações por conta própria (sempre DEFERRED).
+    # Assumimos esse controle para permitir BEGIN IMMEDIATE sob demanda, via
+    # execution_options(sqlite_begin="IMMEDIATE") na conexão da sessão.
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        if not in_memory:
+            cursor.execute(f"PRAGMA journal_mode={config.sqlite_journal_mode}")
+            cursor.execute(f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA synchronous={config.sqlite_synchronous}")
+        # Valor negativo: tamanho do cache em KiB (e não em páginas)
+        cursor.execute(f"PRAGMA cache_size=-{int(config.sqlite_cache_size_kib)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.sqlite_busy_timeout_ms)}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        mode = conn.get_execution_options().get("sqlite_begin", "DEFERRED")
+        conn.exec_driver_sql(f"BEGIN {mode}")
+
+engine = create_db_engine(settings)
 
 def init_db():
-    Path("./data").mkdir(exist_ok=True)
+    if engine.url.get_backend_name() == "sqlite" and not is_sqlite_memory(engine.url.database):
+        Path(engine.url.database).parent.mkdir(parents=True, exist_ok=True)
     SQLModel.metadata.create_all(engine)
 
 def get_session():
@@ -17,4 +98,4 @@ def get_session():
         yield session
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
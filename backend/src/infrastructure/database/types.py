@@ -0,0 +1,35 @@
+"""
+Tipos de coluna personalizados
+------------------------------
+
+BinaryUUID: identificadores UUID gravados como 16 bytes, em vez dos 36
+caracteres do texto. Índices e chaves estrangeiras ficam menores (mais
+entradas por página) e, com UUIDv7, a ordem dos bytes é a ordem de
+criação: as inserções vão para o final do índice.
+
+No código os identificadores continuam sendo texto; a conversão é feita
+apenas na ida e na volta do banco.
+"""
+
+import uuid
+from typing import Optional
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+class BinaryUUID(TypeDecorator):
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        try:
+            return uuid.UUID(value).bytes
+        except (ValueError, TypeError, AttributeError):
+            raise ValueError(f"Identificador inválido: {value!r}")
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
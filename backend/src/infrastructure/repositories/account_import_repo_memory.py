@@ -0,0 +1,46 @@
+"""
+Repositório em memória: InMemoryAccountImportRepository
+-------------------------------------------------------
+
+Implementação da porta IAccountImportRepository sobre o InMemoryStore:
+os CPFs existentes são consultados no índice por CPF e as contas do
+lote são gravadas com um único ``apply`` (tudo ou nada).
+"""
+
+from typing import Iterable, List, Set
+
+from ...application.ports.account_import_repository import IAccountImportRepository
+from ...domain.aggregates.account import Account
+from .memory_store import AccountWrite, InMemoryStore, copy_account
+
+
+class InMemoryAccountImportRepository(IAccountImportRepository):
+    """
+    Implementação em memória da interface IAccountImportRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def existing_cpfs(self, cpfs: Iterable[str]) -> Set[str]:
+        return {cpf for cpf in cpfs if cpf in self.store.ids_by_cpf}
+
+    def insert_many(self, accounts: List[Account]) -> None:
+        if not accounts:
+            return
+
+        # Eventos só são retirados dos aggregates após a gravação (ver
+        # AccountImportRepositorySQLite.insert_many)
+        self.store.apply([
+            AccountWrite(
+                account=copy_account(account),
+                expected_version=0,
+                events=list(account.events),
+                source=account,
+            )
+            for account in accounts
+        ])
+
+        for account in accounts:
+            account.pull_events()
+            account.version = 1
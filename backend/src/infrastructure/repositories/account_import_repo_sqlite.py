@@ -0,0 +1,94 @@
+"""
+Repositório SQLite: AccountImportRepositorySQLite
+-------------------------------------------------
+
+Implementação concreta da porta IAccountImportRepository.
+
+- ``existing_cpfs``: um SELECT ... IN pelo índice único de CPF (em
+  partes de até 500 parâmetros, abaixo do limite de variáveis do SQLite)
+- ``insert_many``: um único INSERT em lote (executemany) das contas e
+  outro dos eventos AccountOpened no outbox, na mesma transação
+
+Os números de conta do lote são reservados de uma vez: a transação é
+aberta com BEGIN IMMEDIATE (lock de escrita), lê o maior número atual e
+numera as contas em sequência. Cadastros concorrentes pela API aguardam
+o lock e continuam a numeração depois do lote. Em bancos sem esse lock
+(ex.: PostgreSQL), um número já confirmado por outro cadastro faz o lote
+ser regravado com a numeração relida.
+"""
+
+from typing import Iterable, List, Set
+
+from sqlmodel import Session, select
+from sqlalchemy import exc, func, insert
+
+from ...application.ports.account_import_repository import IAccountImportRepository
+from ...domain.aggregates.account import Account
+from ...domain.value_objects.account_number import AccountNumber
+from ..database.models.account_model import AccountModel
+from ..database.orm import engine
+from .account_repo_sqlite import ACCOUNT_NUMBER_ATTEMPTS, AccountRepositorySQLite
+from .outbox_repo_sqlite import OutboxRepositorySQLite
+
+_MAX_PARAMS = 500
+
+
+class AccountImportRepositorySQLite(IAccountImportRepository):
+    """
+    Implementação SQLite da interface IAccountImportRepository.
+    """
+
+    def existing_cpfs(self, cpfs: Iterable[str]) -> Set[str]:
+        pending = list(cpfs)
+        found: Set[str] = set()
+
+        with Session(engine) as session:
+            for start in range(0, len(pending), _MAX_PARAMS):
+                part = pending[start:start + _MAX_PARAMS]
+                stmt = select(AccountModel.customer_cpf).where(AccountModel.customer_cpf.in_(part))
+                found.update(session.exec(stmt).all())
+
+        return found
+
+    def insert_many(self, accounts: List[Account]) -> None:
+        if not accounts:
+            return
+
+        for attempt in range(ACCOUNT_NUMBER_ATTEMPTS):
+            with Session(engine) as session:
+                session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+
+                last = session.exec(
+                    select(func.coalesce(func.max(AccountModel.account_number), 0))
+                ).one()
+                numbers = [AccountNumber(last + i) for i in range(1, len(accounts) + 1)]
+
+                rows = []
+                for account, number in zip(accounts, numbers):
+                    rows.append(AccountRepositorySQLite.to_row(account))
+                    rows[-1]["account_number"] = number.number
+                # Eventos só são retirados dos aggregates após o commit: um lote
+                # rejeitado pode ser gravado de novo sem perdê-los
+                outbox = [
+                    OutboxRepositorySQLite.to_row(e)
+                    for account in accounts
+                    for e in account.events
+                ]
+
+                try:
+                    session.execute(insert(AccountModel.__table__), rows)
+                except exc.IntegrityError as error:
+                    column = AccountRepositorySQLite.unique_violation(error)
+                    if column == "customer_cpf":
+                        raise ValueError("CPF já cadastrado no sistema.") from error
+                    if column == "account_number" and attempt + 1 < ACCOUNT_NUMBER_ATTEMPTS:
+                        continue
+                    raise
+                AccountRepositorySQLite.add_outbox(session, outbox)
+                session.commit()
+                break
+
+        for account, number in zip(accounts, numbers):
+            account.pull_events()
+            account.account_number = number
+            account.version = 1
@@ -0,0 +1,165 @@
+"""
+Repositório assíncrono: AsyncAccountRepositorySQLite
+----------------------------------------------------
+
+Implementação da porta IAsyncAccountRepository sobre o AsyncEngine.
+
+Reaproveita o mapeamento e os statements de AccountRepositorySQLite
+(INSERT de contas novas, UPDATE versionado das colunas de estado,
+SELECT ... FOR UPDATE ordenado), diferindo apenas na execução, que
+não bloqueia o event loop enquanto aguarda o banco.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import exc, insert
+
+from ...application.ports.account_repository import IAsyncAccountRepository
+from ...domain.aggregates.account import Account
+from ...domain.exceptions import ConcurrentModificationError
+from ...domain.value_objects.account_number import AccountNumber
+from ...domain.value_objects.cpf import CPF
+from ...shared.utils.uuid_generator import is_valid_id
+from ..database.async_orm import async_session
+from ..database.models.account_model import AccountModel
+from ..database.models.outbox_model import OutboxModel
+from ..database.models.transaction_model import TransactionModel
+from .account_repo_sqlite import ACCOUNT_NUMBER_ATTEMPTS, AccountRepositorySQLite
+from .outbox_repo_sqlite import OutboxRepositorySQLite
+from .transaction_repo_sqlite import TransactionRepositorySQLite
+
+
+class AsyncAccountRepositorySQLite(IAsyncAccountRepository):
+    """
+    Implementação assíncrona da interface IAsyncAccountRepository.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        """
+        Parâmetros:
+            session: sessão externa (Unit of Work assíncrono). Se omitida,
+                cada operação usa uma sessão própria com commit imediato.
+        """
+        self._session = session
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        if self._session is not None:
+            yield self._session
+            return
+
+        async with async_session() as session:
+            yield session
+            await session.commit()
+
+    async def save(self, account: Account) -> None:
+        """
+        Persiste o aggregate com as mesmas regras de AccountRepositorySQLite.save.
+
+        Raises:
+            ValueError: caso o CPF já esteja cadastrado no sistema
+            ConcurrentModificationError: caso a conta tenha sido alterada
+                por outra operação desde que foi carregada
+        """
+        ledger = [
+            TransactionRepositorySQLite.to_model(t)
+            for t in account.pull_new_transactions()
+        ]
+        outbox = [OutboxRepositorySQLite.to_row(e) for e in account.pull_events()]
+
+        async with self._session_scope() as session:
+            if account.version == 0:
+                for attempt in range(ACCOUNT_NUMBER_ATTEMPTS):
+                    model = AccountRepositorySQLite.to_model(account, len(ledger))
+                    try:
+                        async with session.begin_nested():
+                            session.add(model)
+                        break
+                    except exc.IntegrityError as error:
+                        AccountRepositorySQLite.check_insert_error(account, error, attempt)
+                # Número atribuído pelo INSERT: leitura explícita (sem lazy load)
+                await session.refresh(model, ["account_number"])
+                account.account_number = AccountNumber(model.account_number)
+                account.version = 1
+            else:
+                result = await session.execute(
+                    AccountRepositorySQLite.update_statement(account, len(ledger))
+                )
+                if result.rowcount != 1:
+                    raise ConcurrentModificationError(
+                        "A conta foi alterada por outra operação. Tente novamente."
+                    )
+                account.version += 1
+
+            session.add_all(ledger)
+            await session.flush()
+            if outbox:
+                await session.execute(insert(OutboxModel.__table__), outbox)
+
+    async def save_many(self, accounts: List[Account]) -> None:
+        """
+        Gravação em lote com as mesmas regras de AccountRepositorySQLite.save_many.
+        """
+        if not accounts:
+            return
+
+        pending = {a.account_id: a.pull_new_transactions() for a in accounts}
+        appended = {account_id: len(rows) for account_id, rows in pending.items()}
+        ledger = [
+            TransactionRepositorySQLite.to_row(t)
+            for rows in pending.values()
+            for t in rows
+        ]
+        outbox = [
+            OutboxRepositorySQLite.to_row(e)
+            for account in accounts
+            for e in account.pull_events()
+        ]
+
+        async with self._session_scope() as session:
+            result = await session.execute(
+                AccountRepositorySQLite.bulk_update_statement(),
+                [AccountRepositorySQLite.bulk_update_params(a, appended[a.account_id]) for a in accounts],
+            )
+            AccountRepositorySQLite.check_bulk_rowcount(session, result, len(accounts))
+
+            if ledger:
+                await session.execute(insert(TransactionModel.__table__), ledger)
+            if outbox:
+                await session.execute(insert(OutboxModel.__table__), outbox)
+
+        for account in accounts:
+            account.version += 1
+
+    async def get_by_id(self, account_id: str) -> Account | None:
+        if not is_valid_id(account_id):
+            return None
+
+        async with self._session_scope() as session:
+            model = await session.get(AccountModel, account_id)
+            if not model:
+                return None
+
+            return AccountRepositorySQLite.to_domain(model)
+
+    async def get_by_cpf(self, cpf: str) -> Account | None:
+        async with self._session_scope() as session:
+            stmt = select(AccountModel).where(AccountModel.customer_cpf == CPF.normalize(cpf))
+            model = (await session.exec(stmt)).first()
+            if not model:
+                return None
+
+            return AccountRepositorySQLite.to_domain(model)
+
+    async def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        """
+        Carrega e bloqueia as contas em ordem crescente de account_id
+        (ver AccountRepositorySQLite.get_for_update).
+        """
+        async with self._session_scope() as session:
+            stmt = AccountRepositorySQLite.for_update_statement(account_ids)
+            models = (await session.exec(stmt)).all()
+            return {m.account_id: AccountRepositorySQLite.to_domain(m) for m in models}
@@ -0,0 +1,247 @@
+"""
+Repositório com cache: CachedAccountRepository
+----------------------------------------------
+
+Decorator das portas IAccountRepository / IAsyncAccountRepository que
+mantém em memória as contas lidas recentemente (read-through), evitando
+uma ida ao banco, e a reconstrução do aggregate, a cada leitura de
+contas muito acessadas.
+
+Funcionamento:
+- AccountCache guarda cópias das contas por account_id, mais um índice
+  CPF -> account_id, ambos LRU limitados e com TTL
+- Leituras consultam o cache e, em caso de falta, o repositório interno
+- ``save`` grava no repositório interno e atualiza o cache com o estado
+  recém-persistido (write-through); um ConcurrentModificationError ou
+  qualquer outra falha invalida a entrada
+- Dentro de um Unit of Work (``transactional=True``) a gravação apenas
+  invalida a entrada; o novo estado só é publicado no cache depois do
+  commit, e descartado em caso de rollback
+
+Consistência:
+O cache nunca guarda uma versão mais antiga do que a já conhecida, e
+uma leitura obsoleta não causa escrita incorreta: o UPDATE versionado
+do repositório rejeita o save e a entrada é invalidada. Entre processos
+diferentes, o TTL limita por quanto tempo uma leitura pode estar defasada.
+
+``get_for_update`` nunca usa o cache: leituras com bloqueio vão sempre
+ao banco.
+"""
+
+import threading
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from ...application.ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ...domain.aggregates.account import Account
+from ...domain.value_objects.cpf import CPF
+from ...shared.utils.ttl_cache import TTLCache
+
+
+def _snapshot(account: Account) -> Account:
+    # Cópia independente: lançamentos e eventos pendentes nunca são compartilhados
+    return replace(account, new_transactions=[], events=[])
+
+
+class AccountCache:
+    """
+    Armazenamento compartilhado das contas em cache, usado pelos
+    repositórios síncrono e assíncrono e pelos Units of Work.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: Optional[float] = 30.0):
+        """
+        Parâmetros:
+            max_entries: número máximo de contas mantidas
+            ttl: validade de cada entrada, em segundos
+        """
+        self._accounts: TTLCache[Account] = TTLCache(max_entries=max_entries, ttl=ttl)
+        self._ids_by_cpf: TTLCache[str] = TTLCache(max_entries=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, account_id: str) -> Optional[Account]:
+        cached = self._accounts.get(account_id)
+        return _snapshot(cached) if cached is not None else None
+
+    def get_id_by_cpf(self, cpf: str) -> Optional[str]:
+        return self._ids_by_cpf.get(CPF.normalize(cpf))
+
+    def put(self, account: Account) -> None:
+        """
+        Guarda uma cópia da conta, a menos que o cache já tenha uma
+        versão mais recente (ex.: leitura concorrente a um save).
+        """
+        with self._lock:
+            current = self._accounts.peek(account.account_id)
+            if current is not None and current.version > account.version:
+                return
+            self._accounts.set(account.account_id, _snapshot(account))
+        self._ids_by_cpf.set(account.customer.cpf.value, account.account_id)
+
+    def invalidate(self, account_id: str) -> None:
+        with self._lock:
+            self._accounts.delete(account_id)
+
+    def clear(self) -> None:
+        self._accounts.clear()
+        self._ids_by_cpf.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Acertos, faltas e tamanho do cache de contas e do índice por CPF."""
+        return {
+            "accounts": self._accounts.stats(),
+            "cpf_index": self._ids_by_cpf.stats(),
+        }
+
+
+class CachedAccountRepository(IAccountRepository):
+    """
+    Decorator de IAccountRepository com cache read-through.
+    """
+
+    def __init__(self, inner: IAccountRepository, cache: AccountCache, transactional: bool = False):
+        """
+        Parâmetros:
+            inner: repositório que acessa o banco
+            cache: armazenamento compartilhado das contas
+            transactional: True dentro de um Unit of Work (publica no
+                cache apenas após o commit, via ``publish``)
+        """
+        self.inner = inner
+        self.cache = cache
+        self.transactional = transactional
+        self._pending: Dict[str, Account] = {}
+
+    def save(self, account: Account) -> None:
+        try:
+            self.inner.save(account)
+        except Exception:
+            self.cache.invalidate(account.account_id)
+            raise
+
+        self._after_save(account)
+
+    def save_many(self, accounts: List[Account]) -> None:
+        try:
+            self.inner.save_many(accounts)
+        except Exception:
+            for account in accounts:
+                self.cache.invalidate(account.account_id)
+            raise
+
+        for account in accounts:
+            self._after_save(account)
+
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        account = self.cache.get(account_id)
+        if account is None:
+            account = self.inner.get_by_id(account_id)
+            if account is not None:
+                self.cache.put(account)
+        return account
+
+    def get_by_cpf(self, cpf: str) -> Optional[Account]:
+        account_id = self.cache.get_id_by_cpf(cpf)
+        if account_id is not None:
+            account = self.cache.get(account_id)
+            if account is not None:
+                return account
+
+        account = self.inner.get_by_cpf(cpf)
+        if account is not None:
+            self.cache.put(account)
+        return account
+
+    def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        return self.inner.get_for_update(account_ids)
+
+    def _after_save(self, account: Account) -> None:
+        if self.transactional:
+            self.cache.invalidate(account.account_id)
+            self._pending[account.account_id] = _snapshot(account)
+        else:
+            self.cache.put(account)
+
+    def publish(self) -> None:
+        """Publica no cache as contas gravadas, após o commit do Unit of Work."""
+        for account in self._pending.values():
+            self.cache.put(account)
+        self._pending.clear()
+
+    def discard(self) -> None:
+        """Descarta as contas gravadas, após o rollback do Unit of Work."""
+        for account_id in self._pending:
+            self.cache.invalidate(account_id)
+        self._pending.clear()
+
+
+class AsyncCachedAccountRepository(IAsyncAccountRepository):
+    """
+    Versão assíncrona de CachedAccountRepository, sobre o mesmo AccountCache.
+    """
+
+    def __init__(self, inner: IAsyncAccountRepository, cache: AccountCache, transactional: bool = False):
+        self.inner = inner
+        self.cache = cache
+        self.transactional = transactional
+        self._pending: Dict[str, Account] = {}
+
+    async def save(self, account: Account) -> None:
+        try:
+            await self.inner.save(account)
+        except Exception:
+            self.cache.invalidate(account.account_id)
+            raise
+
+        self._after_save(account)
+
+    async def save_many(self, accounts: List[Account]) -> None:
+        try:
+            await self.inner.save_many(accounts)
+        except Exception:
+            for account in accounts:
+                self.cache.invalidate(account.account_id)
+            raise
+
+        for account in accounts:
+            self._after_save(account)
+
+    async def get_by_id(self, account_id: str) -> Optional[Account]:
+        account = self.cache.get(account_id)
+        if account is None:
+            account = await self.inner.get_by_id(account_id)
+            if account is not None:
+                self.cache.put(account)
+        return account
+
+    async def get_by_cpf(self, cpf: str) -> Optional[Account]:
+        account_id = self.cache.get_id_by_cpf(cpf)
+        if account_id is not None:
+            account = self.cache.get(account_id)
+            if account is not None:
+                return account
+
+        account = await self.inner.get_by_cpf(cpf)
+        if account is not None:
+            self.cache.put(account)
+        return account
+
+    async def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        return await self.inner.get_for_update(account_ids)
+
+    def _after_save(self, account: Account) -> None:
+        if self.transactional:
+            self.cache.invalidate(account.account_id)
+            self._pending[account.account_id] = _snapshot(account)
+        else:
+            self.cache.put(account)
+
+    def publish(self) -> None:
+        for account in self._pending.values():
+            self.cache.put(account)
+        self._pending.clear()
+
+    def discard(self) -> None:
+        for account_id in self._pending:
+            self.cache.invalidate(account_id)
+        self._pending.clear()
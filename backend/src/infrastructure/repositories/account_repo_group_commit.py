@@ -0,0 +1,210 @@
+"""
+Repositório com group commit: GroupCommitAccountRepository
+----------------------------------------------------------
+
+Implementação das portas IAccountRepository / IAsyncAccountRepository
+em que as gravações de requisições concorrentes são confirmadas juntas.
+
+No SQLite cada commit custa uma sincronização com o disco, e só há um
+escritor por vez: com um commit por requisição, a vazão de escrita fica
+limitada pela latência do disco, não pela concorrência. Aqui:
+
+- ``save`` / ``save_many`` apenas enfileiram a gravação e aguardam um
+  Future (o caminho async aguarda sem bloquear o event loop)
+- Uma única thread escritora (GroupCommitWriter) retira da fila todas as
+  gravações pendentes e as aplica em uma única transação, cada uma em
+  seu próprio SAVEPOINT
+- Um único commit confirma o lote; só então os Futures são resolvidos
+- A falha de uma gravação (ex.: ConcurrentModificationError) desfaz
+  apenas o seu SAVEPOINT e é entregue somente ao seu chamador
+
+Quanto mais requisições chegam enquanto um commit está em andamento,
+maior o lote seguinte: o custo do commit é dividido entre elas. Sob
+carga baixa o lote tem um único item e não há espera adicional (a menos
+que ``max_delay`` seja configurado).
+
+Leituras não passam pela fila: são delegadas ao repositório comum.
+
+Durabilidade:
+O Future é resolvido após o commit retornar, ou seja, com a garantia
+configurada em ``SQLITE_SYNCHRONOUS`` (FULL sincroniza o disco a cada
+commit; NORMAL, em WAL, apenas nos checkpoints).
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlmodel import Session
+
+from ...application.ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ...domain.aggregates.account import Account
+from ..database.orm import engine
+from .account_repo_sqlite import AccountRepositorySQLite
+
+# Gravação enfileirada: operação sobre o repositório da transação do lote
+_Write = Callable[[AccountRepositorySQLite], None]
+_Job = Tuple[_Write, Future]
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """
+    Thread escritora única, que aplica as gravações enfileiradas em lotes
+    confirmados por um único commit.
+    """
+
+    def __init__(self, max_batch: int = 256, max_delay: float = 0.0):
+        """
+        Parâmetros:
+            max_batch: número máximo de gravações por commit
+            max_delay: tempo (s) que o lote aguarda por mais gravações
+                antes do commit; 0 agrupa apenas o que já está na fila
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, write: _Write) -> Future:
+        """Enfileira uma gravação; o Future é resolvido após o commit do lote."""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((write, future))
+        return future
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def shutdown(self) -> None:
+        """Aplica as gravações já enfileiradas e encerra a thread escritora."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch, stopping = self._collect(first)
+            self._commit(batch)
+
+    def _collect(self, first: _Job) -> Tuple[List[_Job], bool]:
+        """Junta ao primeiro item as gravações pendentes, até max_batch."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                job = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                return batch, True
+            batch.append(job)
+
+        return batch, False
+
+    def _commit(self, batch: List[_Job]) -> None:
+        applied: List[Future] = []
+
+        try:
+            with Session(engine) as session:
+                session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+                repo = AccountRepositorySQLite(session=session)
+
+                for write, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with session.begin_nested():
+                            write(repo)
+                    except Exception as e:
+                        future.set_exception(e)
+                        continue
+                    applied.append(future)
+
+                session.commit()
+        except Exception as e:
+            # Falha do lote inteiro (ex.: banco indisponível): todos os
+            # chamadores ainda pendentes recebem o erro
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future in applied:
+            future.set_result(None)
+
+
+class GroupCommitAccountRepository(IAccountRepository):
+    """
+    IAccountRepository cujas gravações passam pelo GroupCommitWriter.
+    """
+
+    def __init__(self, writer: GroupCommitWriter, reader: IAccountRepository):
+        """
+        Parâmetros:
+            writer: thread escritora compartilhada
+            reader: repositório usado nas leituras
+        """
+        self.writer = writer
+        self.reader = reader
+
+    def save(self, account: Account) -> None:
+        self.writer.submit(lambda repo: repo.save(account)).result()
+
+    def save_many(self, accounts: List[Account]) -> None:
+        self.writer.submit(lambda repo: repo.save_many(accounts)).result()
+
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        return self.reader.get_by_id(account_id)
+
+    def get_by_cpf(self, cpf: str) -> Optional[Account]:
+        return self.reader.get_by_cpf(cpf)
+
+    def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        return self.reader.get_for_update(account_ids)
+
+
+class AsyncGroupCommitAccountRepository(IAsyncAccountRepository):
+    """
+    Versão assíncrona: aguarda o Future do lote sem bloquear o event loop.
+    """
+
+    def __init__(self, writer: GroupCommitWriter, reader: IAsyncAccountRepository):
+        self.writer = writer
+        self.reader = reader
+
+    async def save(self, account: Account) -> None:
+        await asyncio.wrap_future(self.writer.submit(lambda repo: repo.save(account)))
+
+    async def save_many(self, accounts: List[Account]) -> None:
+        await asyncio.wrap_future(self.writer.submit(lambda repo: repo.save_many(accounts)))
+
+    async def get_by_id(self, account_id: str) -> Optional[Account]:
+        return await self.reader.get_by_id(account_id)
+
+    async def get_by_cpf(self, cpf: str) -> Optional[Account]:
+        return await self.reader.get_by_cpf(cpf)
+
+    async def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        return await self.reader.get_for_update(account_ids)
@@ -0,0 +1,130 @@
+"""
+Repositório em memória: InMemoryAccountRepository
+-------------------------------------------------
+
+Implementação das portas IAccountRepository / IAsyncAccountRepository
+sobre o InMemoryStore, com a mesma semântica do repositório SQLite:
+
+- Conta nova: recebe o próximo número de conta; CPF duplicado gera ValueError
+- Conta existente: gravação condicionada à versão carregada
+  (ConcurrentModificationError caso contrário)
+- Lançamentos novos vão para o ledger e eventos para o outbox, junto
+  com o estado da conta
+- Leituras devolvem cópias: alterar um aggregate carregado não altera
+  o armazenamento antes do ``save``
+
+Dentro de um Unit of Work as gravações são apenas acumuladas e aplicadas
+atomicamente no commit (ver InMemoryUnitOfWork).
+"""
+
+from typing import Dict, List, Optional
+
+from ...application.ports.account_repository import IAccountRepository, IAsyncAccountRepository
+from ...domain.aggregates.account import Account
+from ...domain.value_objects.cpf import CPF
+from .memory_store import AccountWrite, InMemoryStore, copy_account
+
+
+class InMemoryAccountRepository(IAccountRepository):
+    """
+    Implementação em memória da interface IAccountRepository.
+    """
+
+    def __init__(self, store: InMemoryStore, pending: Optional[List[AccountWrite]] = None):
+        """
+        Parâmetros:
+            store: armazenamento compartilhado
+            pending: gravações de um Unit of Work. Se informado, ``save``
+                apenas acumula as gravações, aplicadas no commit.
+        """
+        self.store = store
+        self._pending = pending
+
+    def save(self, account: Account) -> None:
+        self._write([account])
+
+    def save_many(self, accounts: List[Account]) -> None:
+        if accounts:
+            self._write(accounts)
+
+    def _write(self, accounts: List[Account]) -> None:
+        writes = [
+            AccountWrite(
+                account=copy_account(account),
+                expected_version=account.version,
+                transactions=account.pull_new_transactions(),
+                events=account.pull_events(),
+                source=account,
+            )
+            for account in accounts
+        ]
+
+        if self._pending is not None:
+            self._pending.extend(writes)
+        else:
+            self.store.apply(writes)
+
+        for account in accounts:
+            account.version += 1
+
+    def get_by_id(self, account_id: str) -> Account | None:
+        staged = self._staged(account_id)
+        if staged is not None:
+            return staged
+        return self.store.get_account(account_id)
+
+    def get_by_cpf(self, cpf: str) -> Account | None:
+        cpf = CPF.normalize(cpf)
+        if self._pending:
+            for write in reversed(self._pending):
+                if write.account.customer.cpf.value == cpf:
+                    return copy_account(write.account)
+        return self.store.get_account_by_cpf(cpf)
+
+    def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        """
+        Contas em ordem crescente de account_id, como no SQLite. Não há
+        bloqueio: o isolamento vem dos locks por conta dos casos de uso
+        e da trava de versão verificada no commit.
+        """
+        accounts = {}
+        for account_id in sorted(set(account_ids)):
+            account = self.get_by_id(account_id)
+            if account is not None:
+                accounts[account_id] = account
+        return accounts
+
+    def _staged(self, account_id: str) -> Optional[Account]:
+        # Leituras dentro de um Unit of Work enxergam as próprias gravações
+        if self._pending:
+            for write in reversed(self._pending):
+                if write.account.account_id == account_id:
+                    account = copy_account(write.account)
+                    account.version = write.expected_version + 1
+                    return account
+        return None
+
+
+class AsyncInMemoryAccountRepository(IAsyncAccountRepository):
+    """
+    Versão assíncrona de InMemoryAccountRepository (sem I/O: apenas
+    delega para a implementação síncrona).
+    """
+
+    def __init__(self, store: InMemoryStore, pending: Optional[List[AccountWrite]] = None):
+        self.inner = InMemoryAccountRepository(store, pending)
+
+    async def save(self, account: Account) -> None:
+        self.inner.save(account)
+
+    async def save_many(self, accounts: List[Account]) -> None:
+        self.inner.save_many(accounts)
+
+    async def get_by_id(self, account_id: str) -> Account | None:
+        return self.inner.get_by_id(account_id)
+
+    async def get_by_cpf(self, cpf: str) -> Account | None:
+        return self.inner.get_by_cpf(cpf)
+
+    async def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        return self.inner.get_for_update(account_ids)
@@ -10,20 +10,46 @@ Este repositório é responsável por:
 - Reconstruí-los a partir dos modelos ORM
 - Fazer a ponte entre entidades/aggregates e o modelo relacional
 
+Sessões:
+Por padrão cada operação abre (e confirma) sua própria sessão. Quando
+construído com uma sessão externa (ex.: dentro de um Unit of Work), o
+repositório apenas opera sobre ela e deixa o commit para quem a criou.
+
 Importante:
 Este módulo **não contém regras de negócio**.
 Ele apenas converte o aggregate Account em um modelo persistível
 (AccountModel) e vice-versa.
 """
 
-from select import select
-from sqlmodel import Session
-from sqlalchemy import exc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from sqlmodel import Session, select
+from sqlalchemy import bindparam, exc, func, insert, update
 
 from ...application.ports.account_repository import IAccountRepository
 from ...domain.aggregates.account import Account
+from ...domain.exceptions import ConcurrentModificationError
+from ...domain.entities.customer import Customer
+from ...domain.services.account_rules import DEFAULT_WITHDRAWAL_LIMITS, WithdrawalLimits
+from ...domain.value_objects.account_number import AccountNumber
+from ...domain.value_objects.cpf import CPF
+from ...domain.value_objects.password import Password
+from ...domain.value_objects.money import Money
 from ..database.models.account_model import AccountModel
+from ..database.models.outbox_model import OutboxModel
+from ..database.models.transaction_model import TransactionModel
 from ..database.orm import engine
+from ...shared.utils.uuid_generator import is_valid_id
+from .outbox_repo_sqlite import OutboxRepositorySQLite
+from .transaction_repo_sqlite import TransactionRepositorySQLite
+
+# Colunas com índice único em AccountModel (além da chave primária)
+UNIQUE_COLUMNS = ("customer_cpf", "account_number")
+
+# Tentativas de INSERT de uma conta nova quando o número sorteado pelo
+# ``SELECT max + 1`` é confirmado antes por um cadastro concorrente
+ACCOUNT_NUMBER_ATTEMPTS = 5
 
 class AccountRepositorySQLite(IAccountRepository):
     """
@@ -33,39 +59,162 @@ class AccountRepositorySQLite(IAccountRepository):
     o modelo de dados definido em AccountModel (SQLModel).
     """
 
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Parâmetros:
+            session: sessão externa (Unit of Work). Se omitida, cada
+                operação usa uma sessão própria com commit imediato.
+        """
+        self._session = session
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """
+        Fornece a sessão da operação.
+
+        Com sessão externa, apenas a repassa (o commit é do Unit of Work).
+        Caso contrário, abre uma sessão nova e a confirma ao final.
+        """
+        if self._session is not None:
+            yield self._session
+            return
+
+        with Session(engine) as session:
+            yield session
+            session.commit()
+
     def save(self, account: Account) -> None:
         """
         Persiste um aggregate Account no banco SQLite.
 
         Regras aplicadas:
-        - Os dados do cliente e do saldo são extraídos do aggregate
-        - Converte o aggregate completo para um modelo ORM
+        - Conta nova (version == 0): INSERT da linha completa
+        - Conta existente: UPDATE apenas das colunas mutáveis (saldo,
+          contadores e limites de saque diário), condicionado à versão
+          carregada
+        - Anexa ao ledger os lançamentos novos do aggregate, na mesma
+          transação de banco do saldo (saldo e extrato nunca divergem)
+        - Grava no outbox os eventos de domínio, também na mesma transação
         - Trata possíveis erros de integridade, como CPF duplicado
 
         Raises:
             ValueError: caso o CPF já esteja cadastrado no sistema
+            ConcurrentModificationError: caso a conta tenha sido alterada
+                por outra operação desde que foi carregada
         """
-        model = AccountModel(
-            account_id=account.account_id,
-            customer_id=account.customer.customer_id,
-            customer_name=account.customer.name,
-            customer_email=account.customer.email,
-            customer_cpf=str(account.customer.cpf),
-            password_hash=(
-                account.customer._password.hashed
-                if account.customer._password
-                else ""
-            ),
-            balance=account.balance.amount,
-        )
+        ledger = [
+            TransactionRepositorySQLite.to_model(t)
+            for t in account.pull_new_transactions()
+        ]
+        outbox = [OutboxRepositorySQLite.to_row(e) for e in account.pull_events()]
 
-        with Session(engine) as session:
+        with self._session_scope() as session:
+            if account.version == 0:
+                self._insert(session, account, len(ledger))
+            else:
+                self._update(session, account, len(ledger))
+
+            session.add_all(ledger)
+            session.flush()
+            self.add_outbox(session, outbox)
+
+    def _insert(self, session: Session, account: Account, appended: int) -> None:
+        """
+        INSERT de uma conta nova, com todos os dados do cliente.
+
+        O INSERT roda em um SAVEPOINT: um CPF duplicado desfaz apenas esta
+        gravação, sem invalidar a transação compartilhada (Unit of Work ou
+        lote do group commit).
+
+        O número da conta é atribuído pelo próprio INSERT (ver
+        ``next_account_number``) e lido de volta para o aggregate. Se um
+        cadastro concorrente confirmar o mesmo número antes, o INSERT é
+        repetido (ver ``check_insert_error``).
+        """
+        for attempt in range(ACCOUNT_NUMBER_ATTEMPTS):
+            model = self.to_model(account, appended)
             try:
-                session.add(model)
-                session.commit()
-            except exc.IntegrityError:
-                session.rollback()
-                raise ValueError("CPF já cadastrado no sistema.")
+                with session.begin_nested():
+                    session.add(model)
+                break
+            except exc.IntegrityError as error:
+                self.check_insert_error(account, error, attempt)
+
+        account.account_number = AccountNumber(model.account_number)
+        account.version = 1
+
+    def _update(self, session: Session, account: Account, appended: int) -> None:
+        """
+        UPDATE direcionado das colunas de estado, com trava otimista.
+        Nenhuma linha afetada significa que outra operação gravou a conta
+        antes desta.
+        """
+        result = session.execute(self.update_statement(account, appended))
+        if result.rowcount != 1:
+            raise ConcurrentModificationError(
+                "A conta foi alterada por outra operação. Tente novamente."
+            )
+
+        account.version += 1
+
+    def save_many(self, accounts: List[Account]) -> None:
+        """
+        Grava várias contas existentes com dois comandos em lote:
+
+        - UPDATE versionado de todas as contas em um único executemany
+        - INSERT de todos os lançamentos novos em um único executemany
+
+        Raises:
+            ConcurrentModificationError: caso alguma conta tenha sido
+                alterada desde que foi carregada (nada é gravado se o
+                chamador desfizer a transação, como faz o Unit of Work)
+        """
+        if not accounts:
+            return
+
+        pending = {a.account_id: a.pull_new_transactions() for a in accounts}
+        appended = {account_id: len(rows) for account_id, rows in pending.items()}
+        ledger = [
+            TransactionRepositorySQLite.to_row(t)
+            for rows in pending.values()
+            for t in rows
+        ]
+        outbox = [
+            OutboxRepositorySQLite.to_row(e)
+            for account in accounts
+            for e in account.pull_events()
+        ]
+
+        with self._session_scope() as session:
+            result = session.execute(
+                self.bulk_update_statement(),
+                [self.bulk_update_params(a, appended[a.account_id]) for a in accounts],
+            )
+            self.check_bulk_rowcount(session, result, len(accounts))
+
+            if ledger:
+                session.execute(insert(TransactionModel.__table__), ledger)
+            self.add_outbox(session, outbox)
+
+        for account in accounts:
+            account.version += 1
+
+    @staticmethod
+    def add_outbox(session: Session, rows: List[dict]) -> None:
+        """INSERT em lote dos eventos no outbox, na transação corrente."""
+        if rows:
+            session.execute(insert(OutboxModel.__table__), rows)
+
+    @staticmethod
+    def check_bulk_rowcount(session, result, expected: int) -> None:
+        # Nem todo driver informa o total de linhas de um executemany;
+        # nesses casos o isolamento depende do lock do Unit of Work.
+        if not session.get_bind().dialect.supports_sane_multi_rowcount:
+            return
+        if result.rowcount != expected:
+            raise ConcurrentModificationError(
+                "Uma das contas foi alterada por outra operação. Tente novamente."
+            )
 
     def get_by_id(self, account_id: str) -> Account | None:
         """
@@ -77,77 +226,288 @@ class AccountRepositorySQLite(IAccountRepository):
         A reconstrução envolve:
         - Recriar Customer (value objects e senha)
         - Recriar o saldo como Money
-        - (TODO) Recarregar lista de transações quando houver tabela própria
+
+        O histórico de transações não é carregado: o extrato é servido
+        pelo ITransactionRepository, de forma paginada.
         """
-        with Session(engine) as session:
+        if not is_valid_id(account_id):
+            return None
+
+        with self._session_scope() as session:
             model = session.get(AccountModel, account_id)
             if not model:
                 return None
 
-            # Importações locais para evitar acoplamento circular
-            from ...domain.entities.customer import Customer
-            from ...domain.value_objects.cpf import CPF
-            from ...domain.value_objects.password import Password
-            from ...domain.value_objects.money import Money
-
-            # Reconstrói o Customer
-            password = (
-                Password(hashed=model.password_hash)
-                if model.password_hash
-                else None
-            )
-
-            customer = Customer(
-                name=model.customer_name,
-                email=model.customer_email,
-                cpf=CPF(model.customer_cpf),
-                customer_id=model.customer_id,
-                _password=password
-            )
-
-            # Reconstrói o Account aggregate
-            account = Account(
-                account_id=model.account_id,
-                customer=customer,
-                balance=Money(str(model.balance)),
-                transactions=[]  # TODO: Carregar transações quando modelo existir
-            )
-
-            return account
+            return self.to_domain(model)
 
     def get_by_cpf(self, cpf: str) -> Account | None:
-        with Session(engine) as session:
+        """
+        Busca pelo CPF em qualquer formato: a consulta usa sempre a forma
+        canônica (11 dígitos), a mesma gravada no índice único.
+        """
+        with self._session_scope() as session:
             stmt = select(AccountModel).where(
-                AccountModel.customer_cpf == cpf
+                AccountModel.customer_cpf == CPF.normalize(cpf)
             )
             model = session.exec(stmt).first()
             if not model:
                 return None
-            # Reconstruir a conta (igual no get_by_id)
-            from ...domain.entities.customer import Customer
-            from ...domain.value_objects.cpf import CPF
-            from ...domain.value_objects.password import Password
-            from ...domain.value_objects.money import Money
-
-            password = (
-                Password(hashed=model.password_hash)
-                if model.password_hash
-                else None
-            )
 
-            customer = Customer(
-                name=model.customer_name,
-                email=model.customer_email,
-                cpf=CPF(model.customer_cpf),
-                customer_id=model.customer_id,
-                _password=password
+            return self.to_domain(model)
+
+    def get_for_update(self, account_ids: List[str]) -> Dict[str, Account]:
+        """
+        Carrega várias contas em uma única consulta, bloqueando suas linhas
+        até o fim da transação corrente (SELECT ... FOR UPDATE).
+
+        As linhas são lidas e bloqueadas sempre em ordem crescente de
+        account_id: duas transações concorrentes sobre o mesmo par de
+        contas disputam os bloqueios na mesma ordem e não entram em deadlock.
+
+        No SQLite não há bloqueio por linha (a cláusula é ignorada); a
+        serialização vem do lock de escrita obtido pelo Unit of Work.
+        """
+        with self._session_scope() as session:
+            models = session.exec(self.for_update_statement(account_ids)).all()
+            return {m.account_id: self.to_domain(m) for m in models}
+
+    # ------------------------------------------------------------------
+    # Mapeamento e construção de statements (compartilhados com a
+    # implementação assíncrona, que difere apenas na forma de executá-los)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def next_account_number():
+        """
+        Próximo número de conta, calculado dentro do próprio INSERT
+        (``SELECT max + 1`` pelo índice único).
+
+        No SQLite o INSERT obtém o lock de escrita antes de avaliá-lo, e
+        dois cadastros concorrentes nunca leem o mesmo máximo. Em bancos
+        com MVCC (ex.: PostgreSQL em READ COMMITTED) ambos podem ler o
+        mesmo valor: o segundo INSERT viola o índice único e é repetido
+        por ``_insert``, já enxergando o número confirmado pelo primeiro.
+        """
+        return (
+            select(func.coalesce(func.max(AccountModel.account_number), 0) + 1)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def unique_violation(error: exc.IntegrityError) -> Optional[str]:
+        """
+        Coluna única violada pelo INSERT, ou None se a falha for outra.
+
+        Tanto o SQLite ("UNIQUE constraint failed: accountmodel.customer_cpf")
+        quanto o PostgreSQL ("Key (customer_cpf)=(...) already exists")
+        citam a coluna na mensagem do driver.
+        """
+        message = str(error.orig)
+        for column in UNIQUE_COLUMNS:
+            if column in message:
+                return column
+        return None
+
+    @staticmethod
+    def check_insert_error(account: Account, error: exc.IntegrityError, attempt: int) -> None:
+        """
+        Trata a falha do INSERT de uma conta nova.
+
+        - CPF duplicado: ValueError com a mensagem de negócio
+        - Número de conta disputado com um cadastro concorrente: retorna
+          normalmente, para que o INSERT seja repetido (até
+          ACCOUNT_NUMBER_ATTEMPTS tentativas)
+        - Qualquer outra violação: repassa o IntegrityError original
+        """
+        column = AccountRepositorySQLite.unique_violation(error)
+        if column == "customer_cpf":
+            raise ValueError("CPF já cadastrado no sistema.") from error
+        if (
+            column == "account_number"
+            and account.account_number is None
+            and attempt + 1 < ACCOUNT_NUMBER_ATTEMPTS
+        ):
+            return
+        raise error
+
+    @staticmethod
+    def to_model(account: Account, appended: int = 0) -> AccountModel:
+        """Converte um aggregate novo na linha completa de AccountModel."""
+        row = AccountRepositorySQLite.to_row(account, appended)
+        if row["account_number"] is None:
+            row["account_number"] = AccountRepositorySQLite.next_account_number()
+        return AccountModel(**row)
+
+    @staticmethod
+    def to_row(account: Account, appended: int = 0) -> dict:
+        """
+        Colunas da linha completa de uma conta nova, para INSERT em lote
+        (Core, sem instanciar AccountModel).
+        """
+        return {
+            "account_id": account.account_id,
+            "account_number": account.account_number.number if account.account_number else None,
+            "customer_id": account.customer.customer_id,
+            "customer_name": account.customer.name,
+            "customer_email": account.customer.email,
+            "customer_cpf": account.customer.cpf.value,
+            "password_hash": (
+                account.customer._password.hashed
+                if account.customer._password
+                else ""
+            ),
+            "balance": account.balance.amount,
+            "daily_withdrawal_amount": account.daily_withdrawal_amount.amount,
+            "daily_withdrawal_count": account.daily_withdrawal_count,
+            "last_withdrawal_date": account.last_withdrawal_date,
+            **AccountRepositorySQLite.limit_columns(account),
+            "version": 1,
+            "ledger_count": appended,
+            "snapshot_ledger_count": 0,
+            "snapshot_taken_at": None,
+        }
+
+    @staticmethod
+    def update_statement(account: Account, appended: int = 0):
+        """
+        UPDATE apenas das colunas mutáveis, condicionado à versão carregada:
+        ``WHERE account_id = ? AND version = ?``. ``appended`` é o número de
+        lançamentos gravados junto, somado ao contador do ledger.
+        """
+        return (
+            update(AccountModel)
+            .where(
+                AccountModel.account_id == account.account_id,
+                AccountModel.version == account.version,
             )
+            .values(
+                balance=account.balance.amount,
+                daily_withdrawal_amount=account.daily_withdrawal_amount.amount,
+                daily_withdrawal_count=account.daily_withdrawal_count,
+                last_withdrawal_date=account.last_withdrawal_date,
+                **AccountRepositorySQLite.limit_columns(account),
+                ledger_count=AccountModel.ledger_count + appended,
+                version=AccountModel.version + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-            account = Account(
-                account_id=model.account_id,
-                customer=customer,
-                balance=Money(str(model.balance)),
-                transactions=[]  # TODO: Carregar transações
+    @staticmethod
+    def bulk_update_statement():
+        """
+        Versão parametrizada de ``update_statement`` (Core), executada uma
+        única vez com a lista de parâmetros de todas as contas (executemany).
+        """
+        table = AccountModel.__table__
+        return (
+            update(table)
+            .where(
+                table.c.account_id == bindparam("b_account_id"),
+                table.c.version == bindparam("b_version"),
             )
+            .values(
+                balance=bindparam("b_balance"),
+                daily_withdrawal_amount=bindparam("b_daily_withdrawal_amount"),
+                daily_withdrawal_count=bindparam("b_daily_withdrawal_count"),
+                last_withdrawal_date=bindparam("b_last_withdrawal_date"),
+                daily_withdrawal_limit=bindparam("b_daily_withdrawal_limit"),
+                daily_withdrawal_count_limit=bindparam("b_daily_withdrawal_count_limit"),
+                ledger_count=table.c.ledger_count + bindparam("b_appended"),
+                version=table.c.version + 1,
+            )
+        )
 
-            return account
+    @staticmethod
+    def bulk_update_params(account: Account, appended: int = 0) -> dict:
+        """Parâmetros de ``bulk_update_statement`` para uma conta."""
+        return {
+            "b_account_id": account.account_id,
+            "b_version": account.version,
+            "b_balance": account.balance.amount,
+            "b_daily_withdrawal_amount": account.daily_withdrawal_amount.amount,
+            "b_daily_withdrawal_count": account.daily_withdrawal_count,
+            "b_last_withdrawal_date": account.last_withdrawal_date,
+            **{f"b_{k}": v for k, v in AccountRepositorySQLite.limit_columns(account).items()},
+            "b_appended": appended,
+        }
+
+    @staticmethod
+    def limit_columns(account: Account) -> dict:
+        """
+        Colunas dos limites de saque. Limites iguais aos padrão são
+        gravados como nulos: a conta segue o padrão mesmo que ele mude.
+        """
+        limits = account.withdrawal_limits
+        if limits == DEFAULT_WITHDRAWAL_LIMITS:
+            return {"daily_withdrawal_limit": None, "daily_withdrawal_count_limit": None}
+        return {
+            "daily_withdrawal_limit": limits.daily_amount.amount,
+            "daily_withdrawal_count_limit": limits.daily_count,
+        }
+
+    @staticmethod
+    def to_limits(model: AccountModel) -> WithdrawalLimits:
+        """Limites de saque da conta; colunas nulas usam o padrão."""
+        if model.daily_withdrawal_limit is None and model.daily_withdrawal_count_limit is None:
+            return DEFAULT_WITHDRAWAL_LIMITS
+        return WithdrawalLimits(
+            daily_amount=(
+                Money(model.daily_withdrawal_limit)
+                if model.daily_withdrawal_limit is not None
+                else DEFAULT_WITHDRAWAL_LIMITS.daily_amount
+            ),
+            daily_count=(
+                model.daily_withdrawal_count_limit
+                if model.daily_withdrawal_count_limit is not None
+                else DEFAULT_WITHDRAWAL_LIMITS.daily_count
+            ),
+        )
+
+    @staticmethod
+    def for_update_statement(account_ids: List[str]):
+        """
+        SELECT ... FOR UPDATE das contas, em ordem crescente de account_id.
+        IDs malformados são ignorados (como contas inexistentes).
+        """
+        valid_ids = sorted({i for i in account_ids if is_valid_id(i)})
+        return (
+            select(AccountModel)
+            .where(AccountModel.account_id.in_(valid_ids))
+            .order_by(AccountModel.account_id)
+            .with_for_update()
+        )
+
+    @staticmethod
+    def to_domain(model: AccountModel) -> Account:
+        """
+        Reconstrói o aggregate Account (e seu Customer) a partir do modelo.
+        """
+        password = (
+            Password(hashed=model.password_hash)
+            if model.password_hash
+            else None
+        )
+
+        customer = Customer(
+            name=model.customer_name,
+            email=model.customer_email,
+            cpf=CPF(model.customer_cpf),
+            customer_id=model.customer_id,
+            _password=password
+        )
+
+        return Account(
+            account_id=model.account_id,
+            customer=customer,
+            account_number=(
+                AccountNumber(model.account_number)
+                if model.account_number is not None
+                else None
+            ),
+            balance=Money(model.balance),
+            daily_withdrawal_amount=Money(model.daily_withdrawal_amount),
+            daily_withdrawal_count=model.daily_withdrawal_count,
+            last_withdrawal_date=model.last_withdrawal_date,
+            withdrawal_limits=AccountRepositorySQLite.to_limits(model),
+            version=model.version,
+        )
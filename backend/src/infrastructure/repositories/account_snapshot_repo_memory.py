@@ -0,0 +1,75 @@
+"""
+Repositório em memória: InMemoryAccountSnapshotRepository
+---------------------------------------------------------
+
+Implementação da porta IAccountSnapshotRepository sobre o InMemoryStore:
+o estado é reconstruído a partir do último snapshot da conta mais o
+replay dos lançamentos posteriores a ele no ledger compacto, como no
+SQLite.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from ...application.ports.account_snapshot_repository import IAccountSnapshotRepository
+from ...domain.services.ledger_replay import LedgerState, replay
+from .memory_store import InMemoryStore
+
+
+class InMemoryAccountSnapshotRepository(IAccountSnapshotRepository):
+    """
+    Implementação em memória da interface IAccountSnapshotRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def load_state(self, account_id: str, until: Optional[datetime] = None) -> LedgerState:
+        with self.store.lock:
+            snapshot = self.store.snapshots.get(account_id)
+            state = snapshot[0] if snapshot else LedgerState(account_id=account_id)
+
+            ledger = self.store.ledgers.get(account_id)
+            if ledger is None:
+                return state
+
+            start = (
+                ledger.position_after(state.last_occurred_at, state.last_transaction_id)
+                if state.last_transaction_id
+                else 0
+            )
+            stop = ledger.position_until(until) if until is not None else len(ledger)
+            transactions = ledger.slice(start, stop)
+
+        return replay(state, transactions)
+
+    def save_snapshot(self, state: LedgerState) -> bool:
+        if state.last_transaction_id is None:
+            return False
+
+        with self.store.lock:
+            if state.account_id not in self.store.accounts:
+                return False
+            current = self.store.snapshots.get(state.account_id)
+            if current is not None and state.ledger_count <= current[0].ledger_count:
+                return False
+
+            self.store.snapshots[state.account_id] = (state, datetime.utcnow())
+            return True
+
+    def accounts_due(self, every_transactions: int, max_age: timedelta, limit: int) -> List[str]:
+        oldest = datetime.utcnow() - max_age
+        due = []
+
+        with self.store.lock:
+            for account_id, ledger in self.store.ledgers.items():
+                snapshot = self.store.snapshots.get(account_id)
+                pending = len(ledger) - (snapshot[0].ledger_count if snapshot else 0)
+                if pending > 0 and (
+                    pending >= every_transactions or snapshot is None or snapshot[1] < oldest
+                ):
+                    due.append((pending, account_id))
+
+        # Contas mais movimentadas primeiro
+        due.sort(reverse=True)
+        return [account_id for _, account_id in due[:limit]]
@@ -0,0 +1,140 @@
+"""
+Repositório SQLite: AccountSnapshotRepositorySQLite
+---------------------------------------------------
+
+Implementação concreta da porta IAccountSnapshotRepository.
+
+Reconstrução do estado pelo ledger:
+1. Lê o último snapshot da conta (uma linha, pelo índice
+   ``(account_id, id)``), ou parte da conta vazia
+2. Lê apenas os lançamentos posteriores à posição do snapshot, em lotes,
+   pela mesma consulta keyset do extrato
+   (TransactionRepositorySQLite.after_statement)
+3. Aplica-os com o replay do domínio
+
+Toda a leitura acontece em uma única transação, de modo que snapshot e
+lançamentos formam uma visão consistente.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlmodel import Session, select
+from sqlalchemy import or_, update
+
+from ...application.ports.account_snapshot_repository import IAccountSnapshotRepository
+from ...domain.services.ledger_replay import LedgerState, replay
+from ...domain.value_objects.money import Money
+from ..database.models.account_model import AccountModel
+from ..database.models.account_snapshot_model import AccountSnapshotModel
+from ..database.models.transaction_model import TransactionModel
+from ..database.orm import engine
+from .transaction_repo_sqlite import TransactionRepositorySQLite
+
+
+class AccountSnapshotRepositorySQLite(IAccountSnapshotRepository):
+    """
+    Implementação SQLite da interface IAccountSnapshotRepository.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        """
+        Parâmetros:
+            batch_size: lançamentos lidos por consulta durante o replay
+        """
+        self.batch_size = batch_size
+
+    def load_state(self, account_id: str, until: Optional[datetime] = None) -> LedgerState:
+        with Session(engine) as session:
+            state = self._latest_snapshot(session, account_id)
+
+            while True:
+                after = (
+                    (state.last_occurred_at, state.last_transaction_id)
+                    if state.last_transaction_id
+                    else None
+                )
+                stmt = TransactionRepositorySQLite.after_statement(account_id, after, self.batch_size)
+                if until is not None:
+                    stmt = stmt.where(TransactionModel.occurred_at <= until)
+
+                models = session.exec(stmt).all()
+                state = replay(state, (TransactionRepositorySQLite.to_domain(m) for m in models))
+                if len(models) < self.batch_size:
+                    return state
+
+    def save_snapshot(self, state: LedgerState) -> bool:
+        if state.last_transaction_id is None:
+            return False
+
+        with Session(engine) as session:
+            account = session.get(AccountModel, state.account_id)
+            if account is None or state.ledger_count <= account.snapshot_ledger_count:
+                return False
+
+            now = datetime.utcnow()
+            session.add(self.to_model(state, now))
+            # Não altera a versão: o snapshot não concorre com as gravações da conta
+            session.execute(
+                update(AccountModel)
+                .where(AccountModel.account_id == state.account_id)
+                .values(snapshot_ledger_count=state.ledger_count, snapshot_taken_at=now)
+            )
+            session.commit()
+            return True
+
+    def accounts_due(self, every_transactions: int, max_age: timedelta, limit: int) -> List[str]:
+        pending = AccountModel.ledger_count - AccountModel.snapshot_ledger_count
+        stmt = (
+            select(AccountModel.account_id)
+            .where(
+                pending > 0,
+                or_(
+                    pending >= every_transactions,
+                    AccountModel.snapshot_taken_at.is_(None),
+                    AccountModel.snapshot_taken_at < datetime.utcnow() - max_age,
+                ),
+            )
+            # Contas mais movimentadas primeiro
+            .order_by(pending.desc())
+            .limit(limit)
+        )
+        with Session(engine) as session:
+            return list(session.exec(stmt).all())
+
+    def _latest_snapshot(self, session: Session, account_id: str) -> LedgerState:
+        stmt = (
+            select(AccountSnapshotModel)
+            .where(AccountSnapshotModel.account_id == account_id)
+            .order_by(AccountSnapshotModel.id.desc())
+            .limit(1)
+        )
+        model = session.exec(stmt).first()
+        return self.to_state(model) if model else LedgerState(account_id=account_id)
+
+    @staticmethod
+    def to_model(state: LedgerState, created_at: datetime) -> AccountSnapshotModel:
+        return AccountSnapshotModel(
+            account_id=state.account_id,
+            balance=state.balance.amount,
+            daily_withdrawal_amount=state.daily_withdrawal_amount.amount,
+            daily_withdrawal_count=state.daily_withdrawal_count,
+            last_withdrawal_date=state.last_withdrawal_date,
+            ledger_count=state.ledger_count,
+            last_occurred_at=state.last_occurred_at,
+            last_transaction_id=state.last_transaction_id,
+            created_at=created_at,
+        )
+
+    @staticmethod
+    def to_state(model: AccountSnapshotModel) -> LedgerState:
+        return LedgerState(
+            account_id=model.account_id,
+            balance=Money(model.balance),
+            daily_withdrawal_amount=Money(model.daily_withdrawal_amount),
+            daily_withdrawal_count=model.daily_withdrawal_count,
+            last_withdrawal_date=model.last_withdrawal_date,
+            ledger_count=model.ledger_count,
+            last_occurred_at=model.last_occurred_at,
+            last_transaction_id=model.last_transaction_id,
+        )
@@ -0,0 +1,51 @@
+"""
+Repositório assíncrono: AsyncCustomerRepositorySQLite
+-----------------------------------------------------
+
+Implementação da porta IAsyncCustomerRepository sobre o AsyncEngine,
+com o mesmo comportamento de CustomerRepositorySQLite.
+"""
+
+from sqlmodel import select
+
+from ...application.ports.customer_repository import IAsyncCustomerRepository
+from ...domain.entities.customer import Customer
+from ...domain.value_objects.cpf import CPF
+from ...domain.value_objects.password import Password
+from ..database.async_orm import async_session
+from ..database.models.account_model import AccountModel
+from .customer_repo_sqlite import CustomerRepositorySQLite
+
+
+class AsyncCustomerRepositorySQLite(IAsyncCustomerRepository):
+    """
+    Implementação assíncrona da interface IAsyncCustomerRepository.
+    """
+
+    async def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
+        """
+        Cria o Customer em memória (a persistência ocorre via repositório
+        de contas), como em CustomerRepositorySQLite.create.
+        """
+        return CustomerRepositorySQLite().create(name, email, cpf, password_hash)
+
+    async def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        async with async_session() as session:
+            stmt = select(AccountModel).where(AccountModel.customer_cpf == cpf.value)
+            result = (await session.exec(stmt)).first()
+
+            if not result:
+                return None
+
+            password = (
+                Password(hashed=result.password_hash)
+                if result.password_hash
+                else None
+            )
+
+            return Customer(
+                name=result.customer_name,
+                email=result.customer_email,
+                cpf=CPF(result.customer_cpf),
+                _password=password
+            )
@@ -0,0 +1,48 @@
+"""
+Repositório em memória: InMemoryCustomerRepository
+--------------------------------------------------
+
+Implementação das portas ICustomerRepository / IAsyncCustomerRepository
+sobre o InMemoryStore. Como no SQLite, ``create`` apenas constrói o
+Customer (a persistência ocorre junto com a conta) e a busca por CPF
+usa o índice de contas por CPF.
+"""
+
+from ...application.ports.customer_repository import IAsyncCustomerRepository, ICustomerRepository
+from ...domain.entities.customer import Customer
+from ...domain.value_objects.cpf import CPF
+from .customer_repo_sqlite import CustomerRepositorySQLite
+from .memory_store import InMemoryStore
+
+
+class InMemoryCustomerRepository(ICustomerRepository):
+    """
+    Implementação em memória da interface ICustomerRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
+        return CustomerRepositorySQLite().create(name, email, cpf, password_hash)
+
+    def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        account_id = self.store.ids_by_cpf.get(cpf.value)
+        account = self.store.accounts.get(account_id) if account_id is not None else None
+        # Customer é imutável: pode ser compartilhado sem cópia
+        return account.customer if account is not None else None
+
+
+class AsyncInMemoryCustomerRepository(IAsyncCustomerRepository):
+    """
+    Versão assíncrona de InMemoryCustomerRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.inner = InMemoryCustomerRepository(store)
+
+    async def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
+        return self.inner.create(name, email, cpf, password_hash)
+
+    async def get_by_cpf(self, cpf: CPF) -> Customer | None:
+        return self.inner.get_by_cpf(cpf)
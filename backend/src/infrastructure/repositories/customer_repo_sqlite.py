@@ -35,7 +35,7 @@ class CustomerRepositorySQLite(ICustomerRepository):
     Customer a partir dos dados armazenados no banco SQLite.
     """
 
-    def create(self, name: str, email: str, cpf: CPF, password_plain: str) -> Customer:
+    def create(self, name: str, email: str, cpf: CPF, password_hash: str) -> Customer:
         """
         Cria e retorna uma instância de Customer em memória.
 
@@ -45,7 +45,7 @@ class CustomerRepositorySQLite(ICustomerRepository):
         AccountRepository. Portanto, este método apenas cria o objeto
         de domínio sem salvar diretamente no banco.
         """
-        password = Password.create(password_plain) if password_plain else None
+        password = Password(hashed=password_hash) if password_hash else None
 
         return Customer(
             name=name,
@@ -67,7 +67,7 @@ class CustomerRepositorySQLite(ICustomerRepository):
         """
         with Session(engine) as session:
             stmt = select(AccountModel).where(
-                AccountModel.customer_cpf == str(cpf)
+                AccountModel.customer_cpf == cpf.value
             )
             result = session.exec(stmt).first()
 
@@ -0,0 +1,261 @@
+"""
+Armazenamento em memória: InMemoryStore
+---------------------------------------
+
+"Banco de dados" compartilhado pelos repositórios em memória
+(Settings.repository_backend = "memory"), usados em benchmarks e testes
+para medir o custo do domínio e dos casos de uso sem I/O de disco nem
+hidratação do ORM.
+
+Estrutura:
+- Contas por account_id, mais um índice CPF -> account_id
+- Ledger de cada conta em colunas compactas (AccountLedger), em vez de
+  um objeto Transaction por lançamento
+- Outbox e snapshots em dicionários simples
+
+Consistência:
+Todas as gravações de contas passam por ``apply``, que valida e aplica
+um conjunto de alterações atomicamente, sob um único lock, com a mesma
+trava otimista de versão e a mesma unicidade de CPF do repositório
+SQLite. Os dados duram apenas enquanto o processo estiver ativo.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ...application.ports.outbox_repository import OutboxMessage
+from ...application.ports.transaction_repository import LedgerRow
+from ...domain.aggregates.account import Account
+from ...domain.entities.transaction import DEPOSIT, WITHDRAWAL, Transaction
+from ...domain.events.domain_event import DomainEvent
+from ...domain.exceptions import ConcurrentModificationError
+from ...domain.services.ledger_replay import LedgerState
+from ...domain.value_objects.account_number import AccountNumber
+from ...domain.value_objects.money import Money
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_TYPES = (DEPOSIT, WITHDRAWAL)
+_NO_ID = bytes(16)
+
+
+def _to_micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def copy_account(account: Account) -> Account:
+    """Cópia independente do aggregate, sem lançamentos e eventos pendentes."""
+    return replace(account, new_transactions=[], events=[])
+
+
+class AccountLedger:
+    """
+    Lançamentos de uma conta, em ordem cronológica, guardados coluna a
+    coluna em arrays compactos: IDs como 16 bytes, tipo em 1 byte,
+    valor em centavos e instante em microssegundos (8 bytes cada).
+    Objetos Transaction só são criados na leitura.
+    """
+
+    __slots__ = ("account_id", "_ids", "_types", "_cents", "_times", "_targets")
+
+    def __init__(self, account_id: str):
+        self.account_id = account_id
+        self._ids = bytearray()
+        self._types = array("b")
+        self._cents = array("q")
+        self._times = array("q")
+        self._targets = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._cents)
+
+    def append(self, transaction: Transaction) -> None:
+        time = _to_micros(transaction.occurred_at)
+        i = len(self._times)
+        if i and time < self._times[-1]:
+            # Lançamento concorrente gravado depois de um mais recente:
+            # inserido na posição cronológica, como na ordem do extrato
+            i = bisect_right(self._times, time)
+
+        target = transaction.target_account_id
+        self._ids[i * 16:i * 16] = UUID(transaction.transaction_id).bytes
+        self._types.insert(i, _TYPES.index(transaction.type))
+        self._cents.insert(i, transaction.amount.cents)
+        self._times.insert(i, time)
+        self._targets[i * 16:i * 16] = UUID(target).bytes if target else _NO_ID
+
+    def get(self, i: int) -> Transaction:
+        target = bytes(self._targets[i * 16:i * 16 + 16])
+        return Transaction(
+            transaction_id=str(UUID(bytes=bytes(self._ids[i * 16:i * 16 + 16]))),
+            account_id=self.account_id,
+            type=_TYPES[self._types[i]],
+            amount=Money.from_cents(self._cents[i]),
+            occurred_at=_EPOCH + self._times[i] * _MICROSECOND,
+            target_account_id=str(UUID(bytes=target)) if target != _NO_ID else None,
+        )
+
+    def slice(self, start: int, stop: int) -> List[Transaction]:
+        return [self.get(i) for i in range(start, min(stop, len(self)))]
+
+    def rows(self, start: int, stop: int) -> List[LedgerRow]:
+        """Lançamentos como tuplas (LedgerRow), sem criar entidades."""
+        rows = []
+        for i in range(start, min(stop, len(self))):
+            target = bytes(self._targets[i * 16:i * 16 + 16])
+            rows.append((
+                str(UUID(bytes=bytes(self._ids[i * 16:i * 16 + 16]))),
+                _TYPES[self._types[i]],
+                self._cents[i],
+                _EPOCH + self._times[i] * _MICROSECOND,
+                str(UUID(bytes=target)) if target != _NO_ID else None,
+            ))
+        return rows
+
+    def position_after(self, occurred_at: datetime, transaction_id: str) -> int:
+        """Índice do primeiro lançamento posterior a (occurred_at, transaction_id)."""
+        time = _to_micros(occurred_at)
+        key = UUID(transaction_id).bytes
+        i = bisect_left(self._times, time)
+        while i < len(self) and self._times[i] == time and self._ids[i * 16:i * 16 + 16] <= key:
+            i += 1
+        return i
+
+    def position_until(self, until: datetime) -> int:
+        """Número de lançamentos com occurred_at <= until."""
+        return bisect_right(self._times, _to_micros(until))
+
+
+@dataclass
+class AccountWrite:
+    """
+    Gravação pendente de uma conta: cópia do estado, versão esperada
+    (0 para conta nova) e os lançamentos e eventos que a acompanham.
+    """
+
+    account: Account
+    expected_version: int
+    transactions: List[Transaction] = field(default_factory=list)
+    events: List[DomainEvent] = field(default_factory=list)
+    # Aggregate de origem, que recebe o número da conta ao ser criada
+    source: Optional[Account] = None
+
+
+@dataclass
+class OutboxEntry:
+    message: OutboxMessage
+    attempts: int = 0
+    # Fim da concessão do dispatcher que reivindicou a mensagem
+    # (time.monotonic; 0 = livre)
+    claimed_until: float = 0.0
+
+
+class InMemoryStore:
+    """
+    Estado compartilhado pelos repositórios em memória.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.accounts: Dict[str, Account] = {}
+        self.ids_by_cpf: Dict[str, str] = {}
+        self.ledgers: Dict[str, AccountLedger] = {}
+        # Apenas mensagens ainda não entregues, na ordem de gravação
+        self.outbox: Dict[int, OutboxEntry] = {}
+        # Último snapshot de cada conta, com o instante em que foi criado
+        self.snapshots: Dict[str, Tuple[LedgerState, datetime]] = {}
+        self._last_account_number = 0
+        self._last_outbox_id = 0
+
+    def get_account(self, account_id: str) -> Optional[Account]:
+        account = self.accounts.get(account_id)
+        return copy_account(account) if account is not None else None
+
+    def get_account_by_cpf(self, cpf: str) -> Optional[Account]:
+        account_id = self.ids_by_cpf.get(cpf)
+        return self.get_account(account_id) if account_id is not None else None
+
+    def apply(self, writes: List[AccountWrite]) -> None:
+        """
+        Valida e aplica as gravações atomicamente: se alguma delas for
+        recusada, nenhuma é aplicada.
+
+        Raises:
+            ValueError: caso o CPF de uma conta nova já esteja cadastrado
+            ConcurrentModificationError: caso alguma conta tenha sido
+                alterada desde que foi carregada
+        """
+        with self.lock:
+            self._validate(writes)
+
+            for write in writes:
+                account = write.account
+                if write.expected_version == 0:
+                    self._last_account_number += 1
+                    account.account_number = AccountNumber(self._last_account_number)
+                    if write.source is not None:
+                        write.source.account_number = account.account_number
+                    self.ids_by_cpf[account.customer.cpf.value] = account.account_id
+                account.version = write.expected_version + 1
+                self.accounts[account.account_id] = account
+
+                self.append_transactions(write.transactions)
+                for event in write.events:
+                    self._last_outbox_id += 1
+                    self.outbox[self._last_outbox_id] = OutboxEntry(
+                        OutboxMessage(
+                            id=self._last_outbox_id,
+                            event_id=event.event_id,
+                            event_type=event.name,
+                            account_id=event.account_id,
+                            payload=event.payload(),
+                            occurred_at=event.occurred_at,
+                        )
+                    )
+
+    def _validate(self, writes: List[AccountWrite]) -> None:
+        # Versões após as gravações anteriores do mesmo conjunto
+        versions: Dict[str, int] = {}
+        new_cpfs = set()
+
+        for write in writes:
+            account_id = write.account.account_id
+            current = versions.get(account_id)
+            if current is None:
+                stored = self.accounts.get(account_id)
+                current = stored.version if stored is not None else 0
+
+            if write.expected_version == 0:
+                cpf = write.account.customer.cpf.value
+                if cpf in self.ids_by_cpf or cpf in new_cpfs:
+                    raise ValueError("CPF já cadastrado no sistema.")
+                new_cpfs.add(cpf)
+            elif current != write.expected_version:
+                raise ConcurrentModificationError(
+                    "A conta foi alterada por outra operação. Tente novamente."
+                )
+            versions[account_id] = write.expected_version + 1
+
+    def append_transactions(self, transactions: List[Transaction]) -> None:
+        with self.lock:
+            for t in transactions:
+                ledger = self.ledgers.get(t.account_id)
+                if ledger is None:
+                    ledger = self.ledgers[t.account_id] = AccountLedger(t.account_id)
+                ledger.append(t)
+
+    def clear(self) -> None:
+        """Descarta todos os dados (ex.: entre testes)."""
+        with self.lock:
+            self.accounts.clear()
+            self.ids_by_cpf.clear()
+            self.ledgers.clear()
+            self.outbox.clear()
+            self.snapshots.clear()
+            self._last_account_number = 0
+            self._last_outbox_id = 0
@@ -0,0 +1,59 @@
+"""
+Repositório em memória: InMemoryOutboxRepository
+------------------------------------------------
+
+Implementação da porta IOutboxRepository sobre o InMemoryStore, para
+que o OutboxDispatcher funcione também com o backend em memória.
+
+As mensagens são gravadas pelo InMemoryStore junto com as contas; ao
+contrário do SQLite, mensagens entregues são removidas em vez de
+apenas marcadas (não há histórico a consultar depois). O armazenamento
+é do próprio processo, mas a concessão é respeitada do mesmo modo, caso
+mais de um dispatcher compartilhe o store.
+"""
+
+import time
+from typing import List
+
+from ...application.ports.outbox_repository import IOutboxRepository, OutboxMessage
+from .memory_store import InMemoryStore
+
+
+class InMemoryOutboxRepository(IOutboxRepository):
+    """
+    Implementação em memória da interface IOutboxRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def claim_pending(
+        self,
+        owner: str,
+        limit: int,
+        max_attempts: int,
+        lease_seconds: float,
+    ) -> List[OutboxMessage]:
+        now = time.monotonic()
+        messages = []
+        with self.store.lock:
+            for entry in self.store.outbox.values():
+                if entry.attempts < max_attempts and entry.claimed_until <= now:
+                    entry.claimed_until = now + lease_seconds
+                    messages.append(entry.message)
+                    if len(messages) == limit:
+                        break
+        return messages
+
+    def mark_dispatched(self, ids: List[int]) -> None:
+        with self.store.lock:
+            for message_id in ids:
+                self.store.outbox.pop(message_id, None)
+
+    def record_failure(self, ids: List[int]) -> None:
+        with self.store.lock:
+            for message_id in ids:
+                entry = self.store.outbox.get(message_id)
+                if entry is not None:
+                    entry.attempts += 1
+                    entry.claimed_until = 0.0
@@ -0,0 +1,127 @@
+"""
+Repositório SQLite: OutboxRepositorySQLite
+------------------------------------------
+
+Implementação concreta da porta IOutboxRepository.
+
+A gravação das mensagens não passa por aqui: os repositórios de
+aggregates usam ``to_row`` para inseri-las na própria transação da
+mudança de estado (ver AccountRepositorySQLite.save). Este repositório
+atende o dispatcher, que consome as pendências em lotes.
+
+Reivindicação (lease):
+Um UPDATE condicional grava ``claimed_by`` e ``claimed_until`` nas
+mensagens pendentes sem concessão válida, que são então lidas de volta
+pela concessão recém-gravada. A condição é repetida no próprio UPDATE:
+no PostgreSQL (READ COMMITTED) uma linha reivindicada por outro processo
+entre a subconsulta e o UPDATE é reavaliada e fica de fora; no SQLite o
+BEGIN IMMEDIATE serializa as reivindicações.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlmodel import Session, select
+from sqlalchemy import or_, update
+
+from ...application.ports.outbox_repository import IOutboxRepository, OutboxMessage
+from ...domain.events.domain_event import DomainEvent
+from ..database.models.outbox_model import OutboxModel
+from ..database.orm import engine
+
+
+class OutboxRepositorySQLite(IOutboxRepository):
+    """
+    Implementação SQLite da interface IOutboxRepository.
+    """
+
+    @staticmethod
+    def to_row(event: DomainEvent) -> dict:
+        """Converte um evento de domínio em parâmetros de INSERT (Core)."""
+        return {
+            "event_id": event.event_id,
+            "event_type": event.name,
+            "account_id": event.account_id,
+            "payload": json.dumps(event.payload()),
+            "occurred_at": event.occurred_at,
+            "attempts": 0,
+        }
+
+    @staticmethod
+    def to_message(model: OutboxModel) -> OutboxMessage:
+        return OutboxMessage(
+            id=model.id,
+            event_id=model.event_id,
+            event_type=model.event_type,
+            account_id=model.account_id,
+            payload=json.loads(model.payload),
+            occurred_at=model.occurred_at,
+        )
+
+    @staticmethod
+    def unclaimed(now: datetime):
+        """Condição das mensagens sem concessão válida em ``now``."""
+        return or_(OutboxModel.claimed_until.is_(None), OutboxModel.claimed_until < now)
+
+    def claim_pending(
+        self,
+        owner: str,
+        limit: int,
+        max_attempts: int,
+        lease_seconds: float,
+    ) -> List[OutboxMessage]:
+        now = datetime.utcnow()
+        until = now + timedelta(seconds=lease_seconds)
+
+        with Session(engine) as session:
+            session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+            candidates = (
+                select(OutboxModel.id)
+                .where(
+                    OutboxModel.dispatched_at.is_(None),
+                    OutboxModel.attempts < max_attempts,
+                    self.unclaimed(now),
+                )
+                .order_by(OutboxModel.id)
+                .limit(limit)
+            )
+            session.execute(
+                update(OutboxModel)
+                .where(OutboxModel.id.in_(candidates), self.unclaimed(now))
+                .values(claimed_by=owner, claimed_until=until)
+            )
+            session.commit()
+
+            stmt = (
+                select(OutboxModel)
+                .where(
+                    OutboxModel.claimed_by == owner,
+                    OutboxModel.claimed_until == until,
+                    OutboxModel.dispatched_at.is_(None),
+                )
+                .order_by(OutboxModel.id)
+            )
+            return [self.to_message(m) for m in session.exec(stmt).all()]
+
+    def mark_dispatched(self, ids: List[int]) -> None:
+        with Session(engine) as session:
+            session.execute(
+                update(OutboxModel)
+                .where(OutboxModel.id.in_(ids))
+                .values(dispatched_at=datetime.utcnow())
+            )
+            session.commit()
+
+    def record_failure(self, ids: List[int]) -> None:
+        with Session(engine) as session:
+            session.execute(
+                update(OutboxModel)
+                .where(OutboxModel.id.in_(ids))
+                .values(
+                    attempts=OutboxModel.attempts + 1,
+                    claimed_by=None,
+                    claimed_until=None,
+                )
+            )
+            session.commit()
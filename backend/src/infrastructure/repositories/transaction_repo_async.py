@@ -0,0 +1,103 @@
+"""
+Repositório assíncrono: AsyncTransactionRepositorySQLite
+--------------------------------------------------------
+
+Implementação da porta IAsyncTransactionRepository sobre o AsyncEngine.
+
+Usa os mesmos statements keyset de TransactionRepositorySQLite; o
+stream do extrato é um gerador assíncrono que lê um lote por vez.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from ...application.ports.transaction_repository import (
+    IAsyncTransactionRepository,
+    LedgerRow,
+    StatementPage,
+    StatementRows,
+)
+from ...domain.entities.transaction import Transaction
+from ..database.async_orm import async_session
+from ..database.models.transaction_model import TransactionModel
+from .transaction_repo_sqlite import LEDGER_ROW_COLUMNS, TransactionRepositorySQLite, decode_cursor
+
+
+class AsyncTransactionRepositorySQLite(IAsyncTransactionRepository):
+    """
+    Implementação assíncrona da interface IAsyncTransactionRepository.
+    """
+
+    async def add_many(self, transactions: List[Transaction]) -> None:
+        if not transactions:
+            return
+
+        async with async_session() as session:
+            session.add_all([TransactionRepositorySQLite.to_model(t) for t in transactions])
+            await session.commit()
+
+    async def _fetch_after(
+        self,
+        account_id: str,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[TransactionModel]:
+        stmt = TransactionRepositorySQLite.after_statement(account_id, after, limit)
+        async with async_session() as session:
+            return (await session.exec(stmt)).all()
+
+    async def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage:
+        after = decode_cursor(cursor) if cursor else None
+        models = await self._fetch_after(account_id, after, limit + 1)
+        return TransactionRepositorySQLite.to_page(models, limit)
+
+    async def iter_by_account(self, account_id: str, batch_size: int = 500) -> AsyncIterator[Transaction]:
+        after = None
+        while True:
+            models = await self._fetch_after(account_id, after, batch_size)
+            for model in models:
+                yield TransactionRepositorySQLite.to_domain(model)
+
+            if len(models) < batch_size:
+                return
+
+            last = models[-1]
+            after = (last.occurred_at, last.transaction_id)
+
+    async def _fetch_rows_after(
+        self,
+        account_id: str,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[LedgerRow]:
+        stmt = TransactionRepositorySQLite.after_statement(account_id, after, limit, LEDGER_ROW_COLUMNS)
+        async with async_session() as session:
+            return (await session.exec(stmt)).all()
+
+    async def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows:
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self._fetch_rows_after(account_id, after, limit + 1)
+        return TransactionRepositorySQLite.to_rows_page(rows, limit)
+
+    async def iter_row_batches(self, account_id: str, batch_size: int = 500) -> AsyncIterator[List[LedgerRow]]:
+        after = None
+        while True:
+            rows = await self._fetch_rows_after(account_id, after, batch_size)
+            if rows:
+                yield rows
+
+            if len(rows) < batch_size:
+                return
+
+            transaction_id, _, _, occurred_at, _ = rows[-1]
+            after = (occurred_at, transaction_id)
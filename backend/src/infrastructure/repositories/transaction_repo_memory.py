@@ -0,0 +1,147 @@
+"""
+Repositório em memória: InMemoryTransactionRepository
+-----------------------------------------------------
+
+Implementação das portas ITransactionRepository /
+IAsyncTransactionRepository sobre o ledger compacto de cada conta
+(AccountLedger, no InMemoryStore).
+
+A paginação usa o mesmo cursor opaco do SQLite (posição
+``(occurred_at, transaction_id)`` do último lançamento entregue),
+localizado por busca binária no ledger da conta: o custo de cada página
+independe do tamanho do histórico.
+"""
+
+from typing import AsyncIterator, Iterator, List, Optional
+
+from ...application.ports.transaction_repository import (
+    IAsyncTransactionRepository,
+    ITransactionRepository,
+    LedgerRow,
+    StatementPage,
+    StatementRows,
+)
+from ...domain.entities.transaction import Transaction
+from .memory_store import InMemoryStore
+from .transaction_repo_sqlite import decode_cursor, encode_cursor
+
+
+class InMemoryTransactionRepository(ITransactionRepository):
+    """
+    Implementação em memória da interface ITransactionRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def add_many(self, transactions: List[Transaction]) -> None:
+        self.store.append_transactions(transactions)
+
+    def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage:
+        after = decode_cursor(cursor) if cursor else None
+
+        with self.store.lock:
+            ledger = self.store.ledgers.get(account_id)
+            if ledger is None:
+                return StatementPage()
+
+            start = ledger.position_after(*after) if after else 0
+            transactions = ledger.slice(start, start + limit + 1)
+
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            last = transactions[-1]
+            next_cursor = encode_cursor(last.occurred_at, last.transaction_id)
+
+        return StatementPage(transactions=transactions, next_cursor=next_cursor)
+
+    def iter_by_account(self, account_id: str, batch_size: int = 500) -> Iterator[Transaction]:
+        """
+        Gera o extrato lote a lote; o lock do armazenamento é mantido
+        apenas durante a cópia de cada lote.
+        """
+        cursor = None
+        while True:
+            page = self.list_by_account(account_id, batch_size, cursor)
+            yield from page.transactions
+
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows:
+        after = decode_cursor(cursor) if cursor else None
+
+        with self.store.lock:
+            ledger = self.store.ledgers.get(account_id)
+            if ledger is None:
+                return StatementRows()
+
+            start = ledger.position_after(*after) if after else 0
+            rows = ledger.rows(start, start + limit + 1)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            transaction_id, _, _, occurred_at, _ = rows[-1]
+            next_cursor = encode_cursor(occurred_at, transaction_id)
+
+        return StatementRows(rows=rows, next_cursor=next_cursor)
+
+    def iter_row_batches(self, account_id: str, batch_size: int = 500) -> Iterator[List[LedgerRow]]:
+        cursor = None
+        while True:
+            page = self.list_rows_by_account(account_id, batch_size, cursor)
+            if page.rows:
+                yield page.rows
+
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+
+class AsyncInMemoryTransactionRepository(IAsyncTransactionRepository):
+    """
+    Versão assíncrona de InMemoryTransactionRepository.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.inner = InMemoryTransactionRepository(store)
+
+    async def add_many(self, transactions: List[Transaction]) -> None:
+        self.inner.add_many(transactions)
+
+    async def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage:
+        return self.inner.list_by_account(account_id, limit, cursor)
+
+    async def iter_by_account(self, account_id: str, batch_size: int = 500) -> AsyncIterator[Transaction]:
+        for transaction in self.inner.iter_by_account(account_id, batch_size):
+            yield transaction
+
+    async def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows:
+        return self.inner.list_rows_by_account(account_id, limit, cursor)
+
+    async def iter_row_batches(self, account_id: str, batch_size: int = 500) -> AsyncIterator[List[LedgerRow]]:
+        for rows in self.inner.iter_row_batches(account_id, batch_size):
+            yield rows
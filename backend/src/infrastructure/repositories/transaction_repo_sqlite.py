@@ -0,0 +1,271 @@
+"""
+Repositório SQLite: TransactionRepositorySQLite
+-----------------------------------------------
+
+Implementação concreta da porta ITransactionRepository localizada na
+camada de Infraestrutura da Clean Architecture.
+
+Este repositório é responsável por:
+- Anexar lançamentos ao ledger (tabela TransactionModel), sem nunca alterá-los
+- Servir o extrato paginado por cursor (keyset pagination)
+- Servir o extrato completo como stream, lido em lotes
+- Servir as mesmas consultas como tuplas (LedgerRow), sem ORM nem
+  entidades, para a serialização rápida do extrato na API
+
+Paginação por cursor:
+O cursor codifica a posição (occurred_at, transaction_id) do último
+lançamento entregue. A próxima página é obtida com
+``WHERE account_id = ? AND (occurred_at, transaction_id) > cursor``,
+que é resolvida diretamente pelo índice composto
+``(account_id, occurred_at, transaction_id)``. Assim, o custo de cada
+página é constante, independente do tamanho do histórico da conta
+(ao contrário de OFFSET, que precisa percorrer as linhas anteriores).
+"""
+
+import base64
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from sqlmodel import Session, select
+from sqlalchemy import Integer, and_, cast, func, or_
+
+from ...application.ports.transaction_repository import (
+    ITransactionRepository,
+    InvalidCursor,
+    LedgerRow,
+    StatementPage,
+    StatementRows,
+)
+from ...domain.entities.transaction import Transaction
+from ...domain.value_objects.money import Money
+from ..database.models.transaction_model import TransactionModel
+from ..database.orm import engine
+from ...shared.utils.uuid_generator import is_valid_id
+
+
+# Colunas de LedgerRow. O valor já sai do banco em centavos (inteiro):
+# nenhuma conversão para Decimal por linha.
+LEDGER_ROW_COLUMNS = (
+    TransactionModel.transaction_id,
+    TransactionModel.type,
+    cast(func.round(TransactionModel.amount * 100), Integer).label("amount_cents"),
+    TransactionModel.occurred_at,
+    TransactionModel.target_account_id,
+)
+
+
+def encode_cursor(occurred_at: datetime, transaction_id: str) -> str:
+    """Codifica a posição de um lançamento em um cursor opaco (base64 url-safe)."""
+    raw = f"{occurred_at.isoformat()}|{transaction_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+
+    Raises:
+        InvalidCursor: caso o cursor seja inválido
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        occurred_at, transaction_id = raw.split("|", 1)
+        position = datetime.fromisoformat(occurred_at), transaction_id
+    except (ValueError, UnicodeError):
+        raise InvalidCursor("Cursor de paginação inválido.")
+
+    if not is_valid_id(transaction_id):
+        raise InvalidCursor("Cursor de paginação inválido.")
+    return position
+
+
+class TransactionRepositorySQLite(ITransactionRepository):
+    """
+    Implementação SQLite da interface ITransactionRepository.
+
+    Responsável por persistir e consultar lançamentos utilizando o
+    modelo de dados definido em TransactionModel (SQLModel).
+    """
+
+    @staticmethod
+    def to_model(transaction: Transaction) -> TransactionModel:
+        """Converte um lançamento de domínio para o modelo ORM."""
+        return TransactionModel(
+            transaction_id=transaction.transaction_id,
+            account_id=transaction.account_id,
+            type=transaction.type,
+            amount=transaction.amount.amount,
+            occurred_at=transaction.occurred_at,
+            target_account_id=transaction.target_account_id,
+        )
+
+    @staticmethod
+    def to_row(transaction: Transaction) -> dict:
+        """Converte um lançamento em parâmetros de um INSERT em lote (Core)."""
+        return {
+            "transaction_id": transaction.transaction_id,
+            "account_id": transaction.account_id,
+            "type": transaction.type,
+            "amount": transaction.amount.amount,
+            "occurred_at": transaction.occurred_at,
+            "target_account_id": transaction.target_account_id,
+        }
+
+    @staticmethod
+    def to_domain(model: TransactionModel) -> Transaction:
+        """Reconstrói um lançamento de domínio a partir do modelo ORM."""
+        return Transaction(
+            transaction_id=model.transaction_id,
+            account_id=model.account_id,
+            type=model.type,
+            amount=Money(model.amount),
+            occurred_at=model.occurred_at,
+            target_account_id=model.target_account_id,
+        )
+
+    def add_many(self, transactions: List[Transaction]) -> None:
+        """
+        Anexa os lançamentos ao ledger em uma única transação de banco.
+        """
+        if not transactions:
+            return
+
+        with Session(engine) as session:
+            session.add_all([self.to_model(t) for t in transactions])
+            session.commit()
+
+    @staticmethod
+    def after_statement(
+        account_id: str,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+        columns: Optional[tuple] = None,
+    ):
+        """
+        SELECT de até ``limit`` lançamentos da conta posteriores à posição
+        ``after`` (occurred_at, transaction_id), resolvido pelo índice composto.
+        Com ``columns``, seleciona apenas essas colunas (ex.: LEDGER_ROW_COLUMNS).
+        """
+        stmt = select(*columns) if columns else select(TransactionModel)
+        stmt = stmt.where(TransactionModel.account_id == account_id)
+
+        if after:
+            after_occurred_at, after_id = after
+            stmt = stmt.where(
+                or_(
+                    TransactionModel.occurred_at > after_occurred_at,
+                    and_(
+                        TransactionModel.occurred_at == after_occurred_at,
+                        TransactionModel.transaction_id > after_id,
+                    ),
+                )
+            )
+
+        return stmt.order_by(
+            TransactionModel.occurred_at, TransactionModel.transaction_id
+        ).limit(limit)
+
+    @staticmethod
+    def to_page(models: List[TransactionModel], limit: int) -> StatementPage:
+        """
+        Monta a página a partir de até ``limit + 1`` linhas: a linha
+        excedente apenas indica que existe uma próxima página, sem a
+        necessidade de um COUNT(*).
+        """
+        has_more = len(models) > limit
+        models = models[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = models[-1]
+            next_cursor = encode_cursor(last.occurred_at, last.transaction_id)
+
+        return StatementPage(
+            transactions=[TransactionRepositorySQLite.to_domain(m) for m in models],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def to_rows_page(rows: List[LedgerRow], limit: int) -> StatementRows:
+        """Como ``to_page``, para linhas de LEDGER_ROW_COLUMNS."""
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            transaction_id, _, _, occurred_at, _ = rows[-1]
+            next_cursor = encode_cursor(occurred_at, transaction_id)
+        return StatementRows(rows=rows, next_cursor=next_cursor)
+
+    def _fetch_after(
+        self,
+        account_id: str,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[TransactionModel]:
+        with Session(engine) as session:
+            return session.exec(self.after_statement(account_id, after, limit)).all()
+
+    def list_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementPage:
+        """
+        Retorna uma página do extrato em ordem cronológica.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        models = self._fetch_after(account_id, after, limit + 1)
+        return self.to_page(models, limit)
+
+    def iter_by_account(self, account_id: str, batch_size: int = 500) -> Iterator[Transaction]:
+        """
+        Gera todos os lançamentos da conta, lote a lote.
+
+        Cada lote é uma consulta keyset curta em sua própria sessão, em vez
+        de um cursor aberto durante todo o stream: nenhuma transação de
+        leitura fica presa enquanto o cliente HTTP consome a resposta.
+        """
+        after = None
+        while True:
+            models = self._fetch_after(account_id, after, batch_size)
+            for model in models:
+                yield self.to_domain(model)
+
+            if len(models) < batch_size:
+                return
+
+            last = models[-1]
+            after = (last.occurred_at, last.transaction_id)
+
+    def _fetch_rows_after(
+        self,
+        account_id: str,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[LedgerRow]:
+        stmt = self.after_statement(account_id, after, limit, LEDGER_ROW_COLUMNS)
+        with Session(engine) as session:
+            return session.exec(stmt).all()
+
+    def list_rows_by_account(
+        self,
+        account_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> StatementRows:
+        after = decode_cursor(cursor) if cursor else None
+        return self.to_rows_page(self._fetch_rows_after(account_id, after, limit + 1), limit)
+
+    def iter_row_batches(self, account_id: str, batch_size: int = 500) -> Iterator[List[LedgerRow]]:
+        """Como ``iter_by_account``: uma consulta keyset curta por lote."""
+        after = None
+        while True:
+            rows = self._fetch_rows_after(account_id, after, batch_size)
+            if rows:
+                yield rows
+
+            if len(rows) < batch_size:
+                return
+
+            transaction_id, _, _, occurred_at, _ = rows[-1]
+            after = (occurred_at, transaction_id)
@@ -0,0 +1,46 @@
+"""
+Unit of Work assíncrono: AsyncUnitOfWorkSQLite
+----------------------------------------------
+
+Variante assíncrona de UnitOfWorkSQLite: uma única AsyncSession
+compartilhada pelos repositórios, aberta com ``BEGIN IMMEDIATE`` no
+SQLite (ver unit_of_work_sqlite para a justificativa).
+"""
+
+from typing import Optional
+
+from ...application.ports.unit_of_work import IAsyncUnitOfWork
+from ..database.async_orm import async_session
+from .account_repo_async import AsyncAccountRepositorySQLite
+from .account_repo_cached import AccountCache, AsyncCachedAccountRepository
+
+
+class AsyncUnitOfWorkSQLite(IAsyncUnitOfWork):
+    """
+    Unidade de trabalho baseada em uma AsyncSession.
+    """
+
+    def __init__(self, account_cache: Optional[AccountCache] = None):
+        self.account_cache = account_cache
+
+    async def __aenter__(self) -> "AsyncUnitOfWorkSQLite":
+        self.session = async_session()
+        await self.session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+        self.accounts = AsyncAccountRepositorySQLite(session=self.session)
+        if self.account_cache is not None:
+            self.accounts = AsyncCachedAccountRepository(self.accounts, self.account_cache, transactional=True)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await super().__aexit__(exc_type, exc_value, traceback)
+        await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        if self.account_cache is not None:
+            self.accounts.publish()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        if self.account_cache is not None:
+            self.accounts.discard()
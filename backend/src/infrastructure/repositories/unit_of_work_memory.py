@@ -0,0 +1,58 @@
+"""
+Unit of Work em memória: InMemoryUnitOfWork
+-------------------------------------------
+
+Implementações das portas IUnitOfWork / IAsyncUnitOfWork sobre o
+InMemoryStore. As gravações feitas pelos repositórios da unidade de
+trabalho são acumuladas e aplicadas de uma só vez no commit
+(InMemoryStore.apply): ou todas as contas são gravadas, ou nenhuma.
+Sem commit, as gravações são simplesmente descartadas.
+"""
+
+from typing import List
+
+from ...application.ports.unit_of_work import IAsyncUnitOfWork, IUnitOfWork
+from .account_repo_memory import AsyncInMemoryAccountRepository, InMemoryAccountRepository
+from .memory_store import AccountWrite, InMemoryStore
+
+
+class InMemoryUnitOfWork(IUnitOfWork):
+    """
+    Unidade de trabalho sobre o armazenamento em memória.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def __enter__(self) -> "InMemoryUnitOfWork":
+        self._writes: List[AccountWrite] = []
+        self.accounts = InMemoryAccountRepository(self.store, pending=self._writes)
+        return self
+
+    def commit(self) -> None:
+        self.store.apply(self._writes)
+        self._writes.clear()
+
+    def rollback(self) -> None:
+        self._writes.clear()
+
+
+class AsyncInMemoryUnitOfWork(IAsyncUnitOfWork):
+    """
+    Versão assíncrona de InMemoryUnitOfWork.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def __aenter__(self) -> "AsyncInMemoryUnitOfWork":
+        self._writes: List[AccountWrite] = []
+        self.accounts = AsyncInMemoryAccountRepository(self.store, pending=self._writes)
+        return self
+
+    async def commit(self) -> None:
+        self.store.apply(self._writes)
+        self._writes.clear()
+
+    async def rollback(self) -> None:
+        self._writes.clear()
@@ -0,0 +1,59 @@
+"""
+Unit of Work SQLite: UnitOfWorkSQLite
+-------------------------------------
+
+Implementação concreta da porta IUnitOfWork sobre uma única sessão
+SQLModel. Os repositórios expostos compartilham essa sessão, de modo
+que saldos e lançamentos do ledger de várias contas são gravados em
+uma única transação (um único commit).
+
+No SQLite a transação é aberta com ``BEGIN IMMEDIATE``: o lock de
+escrita do banco é obtido logo no início, antes das leituras. Assim,
+duas unidades de trabalho concorrentes nunca leem o mesmo saldo para
+depois disputarem o upgrade do lock (o que resultaria em SQLITE_BUSY).
+Em bancos com bloqueio por linha (ex.: PostgreSQL) a opção é ignorada
+e o isolamento vem do SELECT ... FOR UPDATE dos repositórios.
+
+Com um AccountCache configurado, as contas gravadas só são publicadas
+no cache depois do commit (e invalidadas em caso de rollback).
+"""
+
+from typing import Optional
+
+from sqlmodel import Session
+
+from ...application.ports.unit_of_work import IUnitOfWork
+from ..database.orm import engine
+from .account_repo_cached import AccountCache, CachedAccountRepository
+from .account_repo_sqlite import AccountRepositorySQLite
+
+
+class UnitOfWorkSQLite(IUnitOfWork):
+    """
+    Unidade de trabalho baseada em uma sessão SQLModel.
+    """
+
+    def __init__(self, account_cache: Optional[AccountCache] = None):
+        self.account_cache = account_cache
+
+    def __enter__(self) -> "UnitOfWorkSQLite":
+        self.session = Session(engine)
+        self.session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+        self.accounts = AccountRepositorySQLite(session=self.session)
+        if self.account_cache is not None:
+            self.accounts = CachedAccountRepository(self.accounts, self.account_cache, transactional=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        super().__exit__(exc_type, exc_value, traceback)
+        self.session.close()
+
+    def commit(self) -> None:
+        self.session.commit()
+        if self.account_cache is not None:
+            self.accounts.publish()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+        if self.account_cache is not None:
+            self.accounts.discard()
@@ -0,0 +1,69 @@
+"""
+Serviço: ShardedAccountLockManager
+----------------------------------
+
+Implementação em memória da porta IAccountLockManager.
+
+Em vez de um lock por conta (que exigiria criar, contar referências e
+remover locks dinamicamente), as contas são distribuídas por hash entre
+um número fixo de shards, cada um com seu lock. Duas contas no mesmo
+shard se serializam desnecessariamente, o que é raro com shards
+suficientes, e a memória ocupada é constante.
+
+- Caminho síncrono: ``threading.Lock`` (requisições no threadpool)
+- Caminho async: ``asyncio.Lock`` (tarefas no event loop), sem bloquear
+  a thread do loop enquanto aguarda
+
+Os shards de uma operação são deduplicados e adquiridos em ordem
+crescente, o que impede deadlocks entre operações sobre várias contas.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterable, Iterator, List
+
+from ...application.ports.account_lock_manager import IAccountLockManager
+
+
+class ShardedAccountLockManager(IAccountLockManager):
+    """
+    Locks por conta distribuídos em um número fixo de shards.
+    """
+
+    def __init__(self, shards: int = 1024):
+        """
+        Parâmetros:
+            shards: número de locks; contas são mapeadas por hash do account_id
+        """
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._async_locks = [asyncio.Lock() for _ in range(shards)]
+
+    def _shards_for(self, account_ids: Iterable[str]) -> List[int]:
+        return sorted({hash(account_id) % len(self._locks) for account_id in account_ids})
+
+    @contextmanager
+    def locked(self, account_ids: Iterable[str]) -> Iterator[None]:
+        acquired: List[threading.Lock] = []
+        try:
+            for shard in self._shards_for(account_ids):
+                lock = self._locks[shard]
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    @asynccontextmanager
+    async def locked_async(self, account_ids: Iterable[str]) -> AsyncIterator[None]:
+        acquired: List[asyncio.Lock] = []
+        try:
+            for shard in self._shards_for(account_ids):
+                lock = self._async_locks[shard]
+                await lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
@@ -0,0 +1,56 @@
+"""
+Serviço: VerifiedCredentialCache
+--------------------------------
+
+Implementação em memória da porta ICredentialCache.
+
+Cada CPF ocupa no máximo uma entrada, com a impressão digital
+``HMAC-SHA256(chave, hash_da_senha || senha)``. A chave é aleatória e
+existe só na memória do processo, de modo que o cache nunca guarda a
+senha em texto claro nem algo reutilizável fora dele. Como o hash
+armazenado faz parte da impressão digital, uma troca de senha (novo
+hash) invalida a entrada sem nenhuma ação adicional.
+
+Uma consulta custa um HMAC (microssegundos) em vez de uma rodada bcrypt.
+"""
+
+import hashlib
+import hmac
+import secrets
+
+from ...application.ports.credential_cache import ICredentialCache
+from ...shared.utils.ttl_cache import TTLCache
+
+
+class VerifiedCredentialCache(ICredentialCache):
+    """
+    Cache LRU com TTL curto de verificações de senha bem-sucedidas.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300.0):
+        """
+        Parâmetros:
+            max_entries: número máximo de CPFs mantidos (limite de memória)
+            ttl: validade de cada verificação, em segundos
+        """
+        self._key = secrets.token_bytes(32)
+        self._cache: TTLCache[bytes] = TTLCache(max_entries=max_entries, ttl=ttl)
+
+    def _fingerprint(self, password_hash: str, plain: str) -> bytes:
+        message = password_hash.encode("utf-8") + b"\0" + plain.encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def is_verified(self, cpf: str, password_hash: str, plain: str) -> bool:
+        cached = self._cache.get(cpf)
+        if cached is None:
+            return False
+        return hmac.compare_digest(cached, self._fingerprint(password_hash, plain))
+
+    def remember(self, cpf: str, password_hash: str, plain: str) -> None:
+        self._cache.set(cpf, self._fingerprint(password_hash, plain))
+
+    def invalidate(self, cpf: str) -> None:
+        self._cache.delete(cpf)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
@@ -0,0 +1,154 @@
+"""
+Serviço de Hash: BcryptHashingService
+-------------------------------------
+
+Implementação da porta IPasswordHasher com bcrypt (passlib), executada
+em um pool de processos.
+
+Por que processos:
+bcrypt leva centenas de milissegundos de CPU por operação. Executado na
+thread da requisição, ele ocupa o GIL e trava o servidor inteiro. Em um
+ProcessPoolExecutor cada hash roda em um núcleo próprio, e o throughput
+de login/abertura de conta passa a escalar com o número de núcleos.
+
+Contrapressão (backpressure):
+No máximo ``max_pending`` operações podem estar em andamento ou na fila
+do pool. Acima disso o chamador aguarda até ``queue_timeout`` segundos
+por uma vaga e, se não houver, recebe PasswordHasherBusy — em vez de a
+fila crescer sem limite e todas as requisições estourarem o tempo.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+from passlib.context import CryptContext
+
+from ...application.ports.password_hasher import IPasswordHasher, PasswordHasherBusy
+
+MAX_BCRYPT_BYTES = 72  # limite do bcrypt
+
+# Contextos por número de rounds, criados sob demanda em cada processo
+_contexts: dict[int, CryptContext] = {}
+
+def _context(rounds: int) -> CryptContext:
+    context = _contexts.get(rounds)
+    if context is None:
+        context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        _contexts[rounds] = context
+    return context
+
+# Funções executadas nos processos do pool (precisam ser de nível de módulo)
+def _hash_password(plain: str, rounds: int) -> str:
+    # Trunca para 72 bytes UTF-8 (limite do bcrypt)
+    return _context(rounds).hash(plain.encode("utf-8")[:MAX_BCRYPT_BYTES])
+
+def _hash_passwords(plains: List[str], rounds: int) -> List[str]:
+    return [_hash_password(plain, rounds) for plain in plains]
+
+def _verify_password(plain: str, hashed: str, rounds: int) -> bool:
+    return _context(rounds).verify(plain.encode("utf-8")[:MAX_BCRYPT_BYTES], hashed)
+
+
+class BcryptHashingService(IPasswordHasher):
+    """
+    Hash e verificação bcrypt em um pool de processos limitado.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        queue_timeout: float = 5.0,
+    ):
+        """
+        Parâmetros:
+            rounds: custo do bcrypt (Settings.bcrypt_rounds)
+            max_workers: processos do pool (padrão: número de CPUs)
+            max_pending: operações simultâneas aceitas (em execução + fila)
+            queue_timeout: segundos aguardando vaga antes de PasswordHasherBusy
+        """
+        self.rounds = rounds
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Criado no primeiro uso: importar o módulo não sobe processos
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # "spawn": não herda threads/locks do servidor (fork é inseguro aqui)
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        """Envia o trabalho ao pool, já com uma vaga reservada."""
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PasswordHasherBusy("Serviço de autenticação sobrecarregado. Tente novamente.")
+
+    async def _acquire_slot_async(self) -> None:
+        # Caminho rápido sem bloquear; só espera (fora do event loop) se estiver cheio
+        if self._slots.acquire(blocking=False):
+            return
+        if not await asyncio.to_thread(self._slots.acquire, True, self.queue_timeout):
+            raise PasswordHasherBusy("Serviço de autenticação sobrecarregado. Tente novamente.")
+
+    def hash(self, plain: str) -> str:
+        self._acquire_slot()
+        return self._submit(_hash_password, plain, self.rounds).result()
+
+    def hash_many(self, plains: List[str]) -> List[str]:
+        """
+        Divide as senhas em poucas tarefas por processo (menos idas e
+        voltas entre processos do que uma tarefa por senha). Cada tarefa
+        ocupa uma vaga do limite de contrapressão, como um hash avulso.
+        """
+        if not plains:
+            return []
+
+        tasks = min(self.max_workers * 2, self.max_pending)
+        size = -(-len(plains) // tasks)
+        futures = []
+        for start in range(0, len(plains), size):
+            self._acquire_slot()
+            futures.append(self._submit(_hash_passwords, plains[start:start + size], self.rounds))
+
+        return [hashed for future in futures for hashed in future.result()]
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        self._acquire_slot()
+        return self._submit(_verify_password, plain, hashed, self.rounds).result()
+
+    async def hash_async(self, plain: str) -> str:
+        await self._acquire_slot_async()
+        return await asyncio.wrap_future(self._submit(_hash_password, plain, self.rounds))
+
+    async def verify_async(self, plain: str, hashed: str) -> bool:
+        await self._acquire_slot_async()
+        return await asyncio.wrap_future(self._submit(_verify_password, plain, hashed, self.rounds))
+
+    def shutdown(self) -> None:
+        """Encerra o pool de processos (chamado no desligamento da aplicação)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,238 @@
+"""
+Serviço: Instrumentation
+------------------------
+
+Métricas de latência e de erros dos casos de uso, dos repositórios e
+dos commits no banco, registradas em um MetricsRegistry e expostas em
+``/metrics`` (Settings.metrics_enabled).
+
+- ``bank_use_case_duration_seconds``: cada chamada pública de um caso
+  de uso (``execute``), por caso de uso e resultado
+- ``bank_repository_duration_seconds``: cada chamada a um repositório,
+  por repositório, método e resultado
+- ``bank_db_commit_duration_seconds``: cada commit de Session (inclui
+  AsyncSession, que usa uma Session por baixo)
+- ``bank_domain_errors_total``: exceções de domínio (ex.:
+  InsufficientFunds, DailyLimitExceeded), por caso de uso e tipo
+- ``bank_cache_*``: acertos, faltas e tamanho dos caches, lidos apenas
+  quando ``/metrics`` é consultado
+
+Os objetos são instrumentados por um proxy (``instrument``) aplicado no
+contêiner: nenhuma classe conhece as métricas. Com as métricas
+desativadas o proxy não é criado e o custo é zero.
+"""
+
+import functools
+import inspect
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ...domain.exceptions import DomainException
+from ...shared.utils.metrics import MetricsRegistry
+
+_COMMIT_STARTED = "metrics_commit_started"
+
+# Estatísticas dos caches: (chave em stats(), descrição, tipo da métrica)
+_CACHE_STATS = (
+    ("hits", "acertos", "counter"),
+    ("misses", "faltas", "counter"),
+    ("size", "entradas atuais", "gauge"),
+)
+
+
+class Instrumentation:
+    """
+    Métricas da aplicação e os proxies que as alimentam.
+    """
+
+    def __init__(self, registry: MetricsRegistry, account_cache=None, credential_cache=None):
+        """
+        Parâmetros:
+            registry: registro onde as métricas são criadas
+            account_cache: AccountCache (opcional), exportado em bank_cache_*
+            credential_cache: VerifiedCredentialCache (opcional), idem
+        """
+        self.registry = registry
+        self.use_case_duration = registry.histogram(
+            "bank_use_case_duration_seconds",
+            "Duração da execução dos casos de uso.",
+            ("use_case", "outcome"),
+        )
+        self.repository_duration = registry.histogram(
+            "bank_repository_duration_seconds",
+            "Duração das chamadas aos repositórios.",
+            ("repository", "method", "outcome"),
+        )
+        self.commit_duration = registry.histogram(
+            "bank_db_commit_duration_seconds",
+            "Duração dos commits no banco.",
+        )
+        self.domain_errors = registry.counter(
+            "bank_domain_errors_total",
+            "Exceções de domínio lançadas pelos casos de uso.",
+            ("use_case", "error"),
+        )
+
+        self._repositories = {}
+        self._account_cache = account_cache
+        self._credential_cache = credential_cache
+        if account_cache is not None or credential_cache is not None:
+            for stat, description, type_name in _CACHE_STATS:
+                registry.register_collector(
+                    _cache_metric(stat),
+                    f"Caches em memória: {description}.",
+                    functools.partial(self._cache_samples, stat),
+                    type_name=type_name,
+                )
+
+    def _cache_samples(self, stat: str):
+        caches = {}
+        if self._account_cache is not None:
+            for name, stats in self._account_cache.stats().items():
+                caches[f"account_{name}"] = stats
+        if self._credential_cache is not None:
+            caches["credentials"] = self._credential_cache.stats()
+
+        for cache, stats in caches.items():
+            yield _cache_metric(stat), {"cache": cache}, stats[stat]
+
+    def install_commit_timing(self) -> None:
+        """
+        Mede os commits de todas as Sessions (listeners globais do
+        SQLAlchemy). Chamado na inicialização; repetir não tem efeito.
+        """
+        if not event.contains(Session, "before_commit", self._before_commit):
+            event.listen(Session, "before_commit", self._before_commit)
+            event.listen(Session, "after_commit", self._after_commit)
+            event.listen(Session, "after_rollback", self._after_rollback)
+
+    def uninstall_commit_timing(self) -> None:
+        if event.contains(Session, "before_commit", self._before_commit):
+            event.remove(Session, "before_commit", self._before_commit)
+            event.remove(Session, "after_commit", self._after_commit)
+            event.remove(Session, "after_rollback", self._after_rollback)
+
+    # Listeners de Session: o início do commit fica em ``session.info``
+    def _before_commit(self, session) -> None:
+        session.info[_COMMIT_STARTED] = time.perf_counter()
+
+    def _after_commit(self, session) -> None:
+        started = session.info.pop(_COMMIT_STARTED, None)
+        if started is not None:
+            self.commit_duration.observe(time.perf_counter() - started)
+
+    def _after_rollback(self, session) -> None:
+        session.info.pop(_COMMIT_STARTED, None)
+
+    def wrap(self, target: Any, kind: str, name: str) -> Any:
+        if kind == "use_case":
+            return _InstrumentedProxy(target, self._use_case_recorder(name))
+
+        # Repositórios são singletons: um único proxy por instância
+        proxy = self._repositories.get(id(target))
+        if proxy is None or proxy._target is not target:
+            proxy = self._repositories[id(target)] = _InstrumentedProxy(
+                target, self._repository_recorder(name)
+            )
+        return proxy
+
+    def _use_case_recorder(self, use_case: str):
+        histogram, errors = self.use_case_duration, self.domain_errors
+
+        def record(method: str, elapsed: float, error: Optional[BaseException]) -> None:
+            if error is None:
+                histogram.labels(use_case, "ok").observe(elapsed)
+                return
+            histogram.labels(use_case, "error").observe(elapsed)
+            if isinstance(error, DomainException):
+                errors.labels(use_case, type(error).__name__).inc()
+
+        return record
+
+    def _repository_recorder(self, repository: str):
+        histogram = self.repository_duration
+
+        def record(method: str, elapsed: float, error: Optional[BaseException]) -> None:
+            outcome = "ok" if error is None else "error"
+            histogram.labels(repository, method, outcome).observe(elapsed)
+
+        return record
+
+
+def _cache_metric(stat: str) -> str:
+    return f"bank_cache_{stat}" if stat == "size" else f"bank_cache_{stat}_total"
+
+
+def instrument(target: Any, kind: str, name: str, instrumentation: Optional[Instrumentation]) -> Any:
+    """
+    Devolve ``target`` instrumentado, ou o próprio ``target`` quando as
+    métricas estão desativadas (``instrumentation`` None).
+
+    Parâmetros:
+        kind: "use_case" ou "repository"
+        name: rótulo do componente nas métricas (ex.: "deposit", "account")
+    """
+    if instrumentation is None:
+        return target
+    return instrumentation.wrap(target, kind, name)
+
+
+class _InstrumentedProxy:
+    """
+    Proxy que mede os métodos públicos do objeto envolvido (síncronos ou
+    corrotinas). Geradores (ex.: ``stream``) e atributos comuns passam
+    direto. Os métodos medidos são criados no primeiro acesso e
+    reaproveitados.
+    """
+
+    def __init__(self, target: Any, record):
+        self._target = target
+        self._record = record
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._target, attr)
+        if attr.startswith("_") or not inspect.ismethod(value):
+            return value
+        if inspect.isgeneratorfunction(value) or inspect.isasyncgenfunction(value):
+            return value
+
+        wrapped = _timed(value, attr, self._record)
+        # Próximos acessos não passam mais por __getattr__
+        self.__dict__[attr] = wrapped
+        return wrapped
+
+    def __repr__(self) -> str:
+        return f"Instrumented({self._target!r})"
+
+
+def _timed(method, name: str, record):
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def timed_async(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = await method(*args, **kwargs)
+            except BaseException as e:
+                record(name, time.perf_counter() - started, e)
+                raise
+            record(name, time.perf_counter() - started, None)
+            return result
+
+        return timed_async
+
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException as e:
+            record(name, time.perf_counter() - started, e)
+            raise
+        record(name, time.perf_counter() - started, None)
+        return result
+
+    return timed
+
@@ -0,0 +1,48 @@
+"""
+Serviço: NotificationEventSink
+------------------------------
+
+Sink de eventos que transforma eventos de domínio em mensagens para o
+INotificationService (console, e-mail, SMS...). Eventos sem mensagem
+definida são ignorados.
+"""
+
+from typing import List, Optional
+
+from ...application.ports.event_sink import IEventSink
+from ...application.ports.notification_service import INotificationService
+from ...application.ports.outbox_repository import OutboxMessage
+
+
+class NotificationEventSink(IEventSink):
+    """
+    Adapta os eventos do outbox para o serviço de notificação.
+    """
+
+    def __init__(self, notifier: INotificationService):
+        self.notifier = notifier
+
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        for message in messages:
+            text = self.format(message)
+            if text:
+                self.notifier.notify(text)
+
+    @staticmethod
+    def format(message: OutboxMessage) -> Optional[str]:
+        p = message.payload
+        # Final do ID: com UUIDv7 o início é o timestamp, igual entre contas
+        account = message.account_id[-8:]
+
+        if message.event_type == "account_opened":
+            return f"Conta {account} criada com sucesso para {p['customer_name']}!"
+        if message.event_type == "deposit_made":
+            return f"Depósito de R$ {p['amount']} na conta {account}. Saldo: R$ {p['balance']}"
+        if message.event_type == "withdrawal_made":
+            return f"Saque de R$ {p['amount']} na conta {account}. Saldo: R$ {p['balance']}"
+        if message.event_type == "transfer_made":
+            return (
+                f"Transferência de R$ {p['amount']} da conta {account} "
+                f"para a conta {p['target_account_id'][-8:]}."
+            )
+        return None
@@ -0,0 +1,126 @@
+"""
+Serviço: OutboxDispatcher
+-------------------------
+
+Entrega, em segundo plano, os eventos de domínio gravados no outbox.
+
+Uma thread dedicada lê as mensagens pendentes em lotes (na ordem em que
+foram gravadas), entrega cada lote a todos os sinks configurados e só
+então o marca como entregue. Se algum sink falhar, o lote inteiro tem a
+tentativa contabilizada e é reenviado na próxima rodada; após
+``max_attempts`` falhas as mensagens deixam de ser buscadas (ficam no
+outbox para análise).
+
+Como a entrega acontece fora da requisição, um sink lento (e-mail, SMS,
+fila externa) nunca adiciona latência a depósitos ou aberturas de conta.
+
+Vários processos (ex.: workers do uvicorn/gunicorn) podem rodar um
+dispatcher cada: o lote é reivindicado com uma concessão de
+``lease_seconds`` (ver IOutboxRepository.claim_pending), e cada mensagem
+é entregue por um único dispatcher. Repetições só ocorrem se o dono da
+concessão cair, ou demorar mais do que ela, antes de marcar o lote como
+entregue; por isso a entrega continua sendo "pelo menos uma vez", e os
+sinks devem tolerar repetições (event_id é único).
+"""
+
+import logging
+import os
+import secrets
+import socket
+import threading
+from typing import List, Optional
+
+from ...application.ports.event_sink import IEventSink
+from ...application.ports.outbox_repository import IOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """
+    Thread de entrega do outbox para os sinks de eventos.
+    """
+
+    def __init__(
+        self,
+        outbox: IOutboxRepository,
+        sinks: List[IEventSink],
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        max_attempts: int = 10,
+        lease_seconds: float = 60.0,
+        owner: Optional[str] = None,
+    ):
+        """
+        Parâmetros:
+            outbox: repositório das mensagens pendentes
+            sinks: destinos de cada lote, na ordem informada
+            batch_size: mensagens por lote
+            poll_interval: espera (s) quando não há pendências
+            max_attempts: falhas toleradas antes de desistir da mensagem
+            lease_seconds: duração da concessão de cada lote (deve cobrir
+                com folga o tempo de entrega aos sinks)
+            owner: identificação do dispatcher nas concessões (padrão:
+                host, pid e um sufixo aleatório)
+        """
+        self.outbox = outbox
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe a thread após o lote em andamento."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def dispatch_once(self) -> int:
+        """
+        Reivindica e entrega um lote de pendências.
+
+        Retorna o número de mensagens entregues (0 se não havia
+        pendências ou se a entrega falhou).
+        """
+        messages = self.outbox.claim_pending(
+            self.owner, self.batch_size, self.max_attempts, self.lease_seconds
+        )
+        if not messages:
+            return 0
+
+        ids = [m.id for m in messages]
+        try:
+            for sink in self.sinks:
+                sink.deliver(messages)
+        except Exception:
+            logger.exception("Falha na entrega de %d eventos do outbox", len(messages))
+            self.outbox.record_failure(ids)
+            return 0
+
+        self.outbox.mark_dispatched(ids)
+        return len(messages)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delivered = self.dispatch_once()
+            except Exception:
+                # Ex.: banco indisponível; tenta de novo na próxima rodada
+                logger.exception("Falha ao consultar o outbox")
+                delivered = 0
+
+            # Lote cheio: provavelmente há mais pendências, segue sem esperar
+            if delivered < self.batch_size:
+                self._stop.wait(self.poll_interval)
@@ -0,0 +1,93 @@
+"""
+Serviço: SnapshotCompactor
+--------------------------
+
+Cria, em segundo plano, snapshots do estado das contas derivado do
+ledger, mantendo limitado o custo de reconstruí-lo: no máximo
+``every_transactions`` lançamentos (mais a movimentação de um dia) após
+o último snapshot.
+
+A cada rodada, as contas com mais lançamentos pendentes são atendidas
+primeiro. Lançamentos mais recentes que ``settle`` segundos não entram
+no snapshot: uma gravação concorrente, com horário um pouco anterior,
+ainda pode estar em andamento, e o snapshot não pode passar à frente
+dela.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ...application.ports.account_snapshot_repository import IAccountSnapshotRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCompactor:
+    """
+    Thread que cria snapshots para as contas que precisam deles.
+    """
+
+    def __init__(
+        self,
+        snapshots: IAccountSnapshotRepository,
+        every_transactions: int = 100,
+        max_age: timedelta = timedelta(days=1),
+        interval: float = 60.0,
+        settle: float = 60.0,
+        batch_size: int = 100,
+    ):
+        """
+        Parâmetros:
+            snapshots: repositório de snapshots
+            every_transactions: lançamentos entre snapshots de uma conta
+            max_age: idade máxima do snapshot de uma conta com movimentação
+            interval: espera (s) entre rodadas
+            settle: idade mínima (s) dos lançamentos incluídos
+            batch_size: contas atendidas por rodada
+        """
+        self.snapshots = snapshots
+        self.every_transactions = every_transactions
+        self.max_age = max_age
+        self.interval = interval
+        self.settle = settle
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-compactor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def compact_once(self) -> int:
+        """Executa uma rodada; retorna o número de snapshots criados."""
+        until = datetime.utcnow() - timedelta(seconds=self.settle)
+        created = 0
+
+        for account_id in self.snapshots.accounts_due(
+            self.every_transactions, self.max_age, self.batch_size
+        ):
+            if self._stop.is_set():
+                break
+            state = self.snapshots.load_state(account_id, until=until)
+            if self.snapshots.save_snapshot(state):
+                created += 1
+
+        return created
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.compact_once()
+            except Exception:
+                logger.exception("Falha ao criar snapshots de contas")
@@ -0,0 +1,102 @@
+"""
+Serviço: HMACTokenService
+-------------------------
+
+Implementação da porta ITokenService com tokens compactos assinados por
+HMAC-SHA256:
+
+    <kid>.<account_id>.<exp>.<assinatura base64url>
+
+- kid: identificador da chave que assinou o token (derivado do segredo)
+- exp: instante de expiração, em segundos desde a epoch
+- assinatura: HMAC-SHA256 de ``<kid>.<account_id>.<exp>``
+
+Rotação de chaves:
+O primeiro segredo da lista assina os novos tokens; os demais apenas
+validam tokens já emitidos. Para rotacionar, coloque o novo segredo na
+frente e mantenha o antigo até que seus tokens expirem (token_ttl).
+
+Sem nenhum segredo configurado, uma chave aleatória é gerada por
+processo: útil em desenvolvimento, mas os tokens deixam de valer a cada
+reinício e não são aceitos por outros workers.
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from typing import Callable, Dict, Sequence
+
+from ...application.ports.token_service import ITokenService, InvalidTokenError, TokenClaims
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _key_id(secret: bytes) -> str:
+    return hashlib.sha256(secret).hexdigest()[:8]
+
+
+class HMACTokenService(ITokenService):
+    """
+    Emite e verifica tokens de sessão sem estado, com expiração e
+    rotação de chaves.
+    """
+
+    def __init__(
+        self,
+        signing_secrets: Sequence[str] = (),
+        ttl: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Parâmetros:
+            signing_secrets: segredos HMAC; o primeiro assina, todos validam
+            ttl: validade dos tokens emitidos, em segundos
+            clock: fonte de tempo (epoch, em segundos)
+        """
+        keys = [s.strip().encode("utf-8") for s in signing_secrets if s.strip()]
+        if not keys:
+            keys = [secrets.token_bytes(32)]
+
+        # HMAC pré-inicializado por chave: cada assinatura só copia o estado
+        self._macs: Dict[str, hmac.HMAC] = {}
+        for key in keys:
+            self._macs.setdefault(_key_id(key), hmac.new(key, digestmod=hashlib.sha256))
+
+        self._active_kid = _key_id(keys[0])
+        self._ttl = ttl
+        self._clock = clock
+
+    def _sign(self, kid: str, signing_input: str) -> str:
+        mac = self._macs[kid].copy()
+        mac.update(signing_input.encode("utf-8"))
+        return _b64encode(mac.digest())
+
+    def issue(self, subject: str) -> str:
+        expires_at = int(self._clock()) + self._ttl
+        signing_input = f"{self._active_kid}.{subject}.{expires_at}"
+        return f"{signing_input}.{self._sign(self._active_kid, signing_input)}"
+
+    def verify(self, token: str) -> TokenClaims:
+        try:
+            signing_input, signature = token.rsplit(".", 1)
+            kid, rest = signing_input.split(".", 1)
+            subject, exp = rest.rsplit(".", 1)
+            expires_at = int(exp)
+        except ValueError:
+            raise InvalidTokenError("Token malformado.")
+
+        if kid not in self._macs:
+            raise InvalidTokenError("Token assinado por chave desconhecida.")
+
+        expected = self._sign(kid, signing_input)
+        if not hmac.compare_digest(signature.encode("utf-8"), expected.encode("ascii")):
+            raise InvalidTokenError("Assinatura do token inválida.")
+
+        if expires_at <= self._clock():
+            raise InvalidTokenError("Token expirado.")
+
+        return TokenClaims(subject=subject, expires_at=expires_at)
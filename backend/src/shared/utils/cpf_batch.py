@@ -0,0 +1,72 @@
+"""
+Utilitário: cpf_batch
+---------------------
+
+Validação de CPFs em lote (ex.: importação de clientes), com NumPy.
+
+Em vez de validar um CPF por vez, os CPFs são normalizados e convertidos
+em uma matriz de dígitos (n x 11); os dois dígitos verificadores de
+todas as linhas são calculados com um único produto matricial cada.
+
+As regras são as mesmas de CPF (domain/value_objects/cpf.py): 11
+dígitos, não todos iguais, e os dois dígitos verificadores corretos.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from ...domain.value_objects.cpf import CPF
+
+_WEIGHTS_1 = np.arange(10, 1, -1, dtype=np.int64)
+_WEIGHTS_2 = np.arange(11, 1, -1, dtype=np.int64)
+
+
+def canonical_cpfs(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normaliza e valida os CPFs informados.
+
+    Retorna:
+        (canônicos, válidos): array com a forma canônica de cada CPF
+        (11 dígitos; vazio quando não é possível obtê-la) e máscara
+        booleana dos CPFs válidos
+    """
+    cpfs = np.asarray(values, dtype=str)
+    if cpfs.size == 0:
+        return np.empty(0, dtype="<U11"), np.empty(0, dtype=bool)
+
+    # Formatação usual removida de uma vez; o restante (espaços, outros
+    # separadores) é normalizado individualmente
+    cpfs = np.char.replace(np.char.replace(cpfs, ".", ""), "-", "")
+    for i in np.flatnonzero(~_eleven_digits(cpfs)):
+        cpfs[i] = CPF.normalize(str(cpfs[i]))
+
+    well_formed = _eleven_digits(cpfs)
+    canonical = np.where(well_formed, cpfs, "").astype("<U11")
+
+    valid = np.zeros(canonical.size, dtype=bool)
+    if well_formed.any():
+        # Cada caractere de um array "<U11" é um código UTF-32
+        digits = canonical[well_formed].view(np.uint32).reshape(-1, 11).astype(np.int64) - ord("0")
+        valid[well_formed] = _valid_digits(digits)
+
+    return canonical, valid
+
+
+def validate_cpfs(values: Sequence[str]) -> np.ndarray:
+    """Máscara booleana dos CPFs válidos."""
+    return canonical_cpfs(values)[1]
+
+
+def _eleven_digits(cpfs: np.ndarray) -> np.ndarray:
+    """Máscara dos textos com exatamente 11 dígitos ASCII."""
+    codes = cpfs.astype("<U11").view(np.uint32).reshape(-1, 11)
+    digits = ((codes >= ord("0")) & (codes <= ord("9"))).all(axis=1)
+    return digits & (np.char.str_len(cpfs) == 11)
+
+
+def _valid_digits(digits: np.ndarray) -> np.ndarray:
+    first = (digits[:, :9] @ _WEIGHTS_1) * 10 % 11 % 10
+    second = (digits[:, :10] @ _WEIGHTS_2) * 10 % 11 % 10
+    repeated = (digits == digits[:, :1]).all(axis=1)
+    return (first == digits[:, 9]) & (second == digits[:, 10]) & ~repeated
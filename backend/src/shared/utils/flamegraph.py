@@ -0,0 +1,99 @@
+"""
+Flamegraph (SVG)
+----------------
+Gera um flamegraph autocontido (SVG, sem JavaScript) a partir de pilhas
+no formato "collapsed" de Brendan Gregg, em que cada linha é a pilha
+da raiz até a folha separada por ``;`` seguida do número de amostras:
+
+    src.api.main.app;src.application.use_cases.make_transfer.execute 12
+
+A largura de cada retângulo é proporcional às amostras em que a função
+estava na pilha; passar o mouse mostra o nome completo e a fração.
+"""
+
+import hashlib
+from typing import Dict, List, Mapping, Tuple
+from xml.sax.saxutils import escape
+
+Stack = Tuple[str, ...]
+
+FRAME_HEIGHT = 16
+CHAR_WIDTH = 7  # largura média de um caractere a 12px, para truncar rótulos
+
+
+def collapsed_lines(samples: Mapping[Stack, int]) -> List[str]:
+    """Pilhas no formato collapsed, da mais frequente para a menos."""
+    ordered = sorted(samples.items(), key=lambda item: (-item[1], item[0]))
+    return [f"{';'.join(stack)} {count}" for stack, count in ordered]
+
+
+class _Node:
+    __slots__ = ("name", "value", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0
+        self.children: Dict[str, "_Node"] = {}
+
+
+def _build_tree(samples: Mapping[Stack, int]) -> _Node:
+    root = _Node("all")
+    for stack, count in samples.items():
+        root.value += count
+        node = root
+        for name in stack:
+            node = node.children.setdefault(name, _Node(name))
+            node.value += count
+    return root
+
+
+def _depth(node: _Node) -> int:
+    return 1 + max((_depth(child) for child in node.children.values()), default=0)
+
+
+def _color(name: str) -> str:
+    # Cor estável por função, em tons quentes
+    h = hashlib.md5(name.encode("utf-8")).digest()
+    return f"rgb({205 + h[0] % 50},{80 + h[1] % 130},{h[2] % 60})"
+
+
+def render_svg(samples: Mapping[Stack, int], title: str = "", width: int = 1200) -> str:
+    root = _build_tree(samples)
+    depth = _depth(root)
+    top = 2 * FRAME_HEIGHT if title else 0
+    height = top + depth * FRAME_HEIGHT + 4
+    scale = width / root.value if root.value else 0.0
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="monospace" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="#fdf6e3"/>',
+    ]
+    if title:
+        parts.append(f'<text x="{width / 2}" y="{FRAME_HEIGHT}" text-anchor="middle" font-size="14">{escape(title)}</text>')
+
+    def draw(node: _Node, x: float, level: int) -> None:
+        w = node.value * scale
+        if w < 0.5:
+            return
+        y = height - 4 - (level + 1) * FRAME_HEIGHT
+        share = node.value / root.value * 100
+        label = escape(node.name)
+        parts.append(
+            f'<g><title>{label} ({node.value} amostras, {share:.2f}%)</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{w:.2f}" height="{FRAME_HEIGHT - 1}" fill="{_color(node.name)}"/>'
+        )
+        chars = int((w - 4) / CHAR_WIDTH)
+        if chars >= 3:
+            text = node.name if len(node.name) <= chars else node.name[: chars - 2] + ".."
+            parts.append(f'<text x="{x + 2:.2f}" y="{y + FRAME_HEIGHT - 4}">{escape(text)}</text>')
+        parts.append("</g>")
+
+        child_x = x
+        for child in sorted(node.children.values(), key=lambda c: c.name):
+            draw(child, child_x, level + 1)
+            child_x += child.value * scale
+
+    draw(root, 0.0, 0)
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
@@ -0,0 +1,70 @@
+"""
+Utilitário: money_arrays
+------------------------
+
+Operações vetorizadas (NumPy) sobre muitos valores monetários de uma vez,
+para lotes, totais de extrato e conciliações.
+
+Os valores são convertidos uma única vez para um array de centavos
+(int64) e as operações rodam sobre o array, sem criar um Money por
+resultado intermediário. Os resultados são idênticos aos das operações
+de Money, que também usam centavos inteiros.
+
+Limite: cada valor, e a soma dos valores, deve caber em int64 (cerca de
+92 quatrilhões de reais); somas que poderiam ultrapassá-lo são feitas
+com inteiros do Python.
+"""
+
+from decimal import Decimal
+from typing import Iterable, Union
+
+import numpy as np
+
+from ...domain.value_objects.money import Money
+
+AmountLike = Union[Money, Decimal, str, int]
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def to_cents(amounts: Iterable[AmountLike]) -> np.ndarray:
+    """
+    Array de centavos (int64). Aceita Money ou valores em reais
+    (Decimal, texto ou inteiro), convertidos como em Money(...).
+    """
+    return np.fromiter(
+        (a.cents if isinstance(a, Money) else Money(a).cents for a in amounts),
+        dtype=np.int64,
+    )
+
+
+def total(cents: np.ndarray) -> Money:
+    """Soma exata dos valores."""
+    if cents.size == 0:
+        return Money.from_cents(0)
+    if int(np.abs(cents).max()) > _INT64_MAX // cents.size:
+        # A soma pode não caber em int64
+        return Money.from_cents(sum(int(c) for c in cents))
+    return Money.from_cents(int(cents.sum()))
+
+
+def compare(left: np.ndarray, right: Union[np.ndarray, Money]) -> np.ndarray:
+    """
+    Comparação elemento a elemento: -1 (menor), 0 (igual) ou 1 (maior).
+    ``right`` pode ser outro array ou um único valor.
+    """
+    other = right.cents if isinstance(right, Money) else right
+    return np.sign(left - other).astype(np.int8)
+
+
+def exceeds(cents: np.ndarray, limit: Money) -> np.ndarray:
+    """Máscara dos valores maiores que o limite."""
+    return cents > limit.cents
+
+
+def running_balance(start: Money, signed_cents: np.ndarray) -> np.ndarray:
+    """
+    Saldos após cada lançamento, dado o saldo inicial e os lançamentos
+    com sinal (créditos positivos, débitos negativos).
+    """
+    return start.cents + np.cumsum(signed_cents, dtype=np.int64)
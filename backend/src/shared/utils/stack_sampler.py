@@ -0,0 +1,156 @@
+"""
+Amostrador de pilhas (profiling estatístico)
+--------------------------------------------
+Perfil de tempo de parede de uma única requisição: uma thread auxiliar
+lê, a cada ``interval`` segundos, onde a requisição está e conta as
+pilhas observadas (formato collapsed, ver shared.utils.flamegraph).
+
+Uma requisição ASGI pode estar, a cada instante, em um de três lugares:
+
+- Executando no event loop: a pilha da thread do loop contém o frame
+  raiz da requisição (``root_frame``); os frames acima dele (o próprio
+  loop, o servidor) são descartados
+- Suspensa em um ``await`` (I/O assíncrono, threadpool): a pilha é
+  reconstruída pela cadeia de corrotinas da task (``cr_await``), com a
+  folha marcada como ``[aguardando]``
+- Em threads auxiliares registradas com ``add_thread`` (ex.: casos de
+  uso síncronos no threadpool): a pilha da thread é anexada à cadeia de
+  corrotinas que a aguarda
+
+Tudo é lido de fora das threads observadas (``sys._current_frames``),
+sem hooks de trace: o custo sobre a requisição é apenas a disputa pelo
+GIL com a thread de amostragem.
+"""
+
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+WAITING = "[aguardando]"
+
+# Rótulo por objeto de código: "<módulo>.<nome qualificado>"
+_labels: Dict[object, str] = {}
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    label = _labels.get(code)
+    if label is None:
+        module = frame.f_globals.get("__name__", "?")
+        label = _labels[code] = f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+    return label
+
+
+def _thread_stack(frame: Optional[FrameType], root: Optional[FrameType]) -> Optional[List[str]]:
+    """
+    Pilha (raiz -> folha) abaixo de ``root``, sem incluí-lo. None se
+    ``root`` não estiver na pilha.
+    """
+    names = []
+    while frame is not None:
+        if frame is root:
+            names.reverse()
+            return names
+        names.append(_label(frame))
+        frame = frame.f_back
+    return None
+
+
+def _await_stack(task, root: Optional[FrameType]) -> List[str]:
+    """Cadeia de corrotinas da task suspensa, abaixo de ``root``."""
+    names: List[str] = []
+    coro = task.get_coro() if task is not None else None
+    below_root = root is None
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is not None:
+            if below_root:
+                names.append(_label(frame))
+            elif frame is root:
+                below_root = True
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return names
+
+
+class StackSampler:
+    """
+    Amostra periodicamente as pilhas de uma requisição.
+
+    Uso:
+        sampler = StackSampler(interval=0.002, loop_thread_id=..., root_frame=..., task=...)
+        sampler.start()
+        ...  # requisição
+        sampler.stop()
+        sampler.samples  # Counter[Stack, int]
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        loop_thread_id: Optional[int] = None,
+        root_frame: Optional[FrameType] = None,
+        task=None,
+    ):
+        """
+        Parâmetros:
+            interval: intervalo entre amostras, em segundos
+            loop_thread_id: thread do event loop que executa a requisição
+            root_frame: frame a partir do qual a pilha pertence à requisição
+            task: task asyncio da requisição (pilha enquanto suspensa)
+        """
+        self.interval = interval
+        self.loop_thread_id = loop_thread_id
+        self.root_frame = root_frame
+        self.task = task
+        self.samples: Counter = Counter()
+        self._threads: Dict[int, FrameType] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_thread(self, thread_id: int, root_frame: FrameType) -> None:
+        """Passa a amostrar ``thread_id`` abaixo de ``root_frame``."""
+        self._threads[thread_id] = root_frame
+
+    def remove_thread(self, thread_id: int) -> None:
+        self._threads.pop(thread_id, None)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        frames = sys._current_frames()
+        me = threading.get_ident()
+
+        # Na thread do loop, executando código da requisição
+        if self.loop_thread_id is not None and self.loop_thread_id != me:
+            stack = _thread_stack(frames.get(self.loop_thread_id), self.root_frame)
+            if stack:
+                self.samples[tuple(stack)] += 1
+                return
+
+        prefix = _await_stack(self.task, self.root_frame)
+        workers = [
+            _thread_stack(frames.get(thread_id), root)
+            for thread_id, root in list(self._threads.items())
+        ]
+        workers = [stack for stack in workers if stack]
+        if workers:
+            for stack in workers:
+                self.samples[tuple(prefix + stack)] += 1
+        elif prefix:
+            self.samples[tuple(prefix) + (WAITING,)] += 1
@@ -0,0 +1,94 @@
+"""
+Cache LRU com expiração (TTL)
+-----------------------------
+Cache em memória, limitado em número de entradas e com tempo de vida
+por entrada. Seguro para uso concorrente entre threads.
+
+- Ao atingir ``max_entries``, a entrada usada há mais tempo é descartada
+- Entradas mais antigas que ``ttl`` segundos são tratadas como ausentes
+- Contadores de acertos/faltas ficam disponíveis em ``stats()``
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Cache LRU limitado, com expiração por entrada.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Parâmetros:
+            max_entries: número máximo de entradas mantidas
+            ttl: tempo de vida de cada entrada, em segundos (None = sem expiração)
+            clock: relógio monotônico (substituível em testes)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Retorna o valor da chave, ou None se ausente ou expirado."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if expires_at < self._clock():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Como ``get``, mas sem afetar a ordem LRU nem os contadores."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < self._clock():
+                return None
+            return item[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Grava (ou substitui) o valor da chave, descartando a entrada menos recente se cheio."""
+        expires_at = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a chave, se existir."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        """Métricas do cache: acertos, faltas e tamanho atual."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
@@ -0,0 +1,69 @@
+"""
+Utilitário: uuid_generator
+--------------------------
+
+Gera identificadores UUIDv7 (RFC 9562): os 48 bits iniciais são o
+instante da criação em milissegundos, seguidos de um contador e de bits
+aleatórios.
+
+Por começarem pelo instante, IDs gerados em sequência também são
+crescentes (inclusive dentro do mesmo milissegundo, graças ao
+contador). Usados como chave primária, as inserções vão sempre para o
+final do índice, em vez de se espalharem por páginas aleatórias como
+acontece com o UUIDv4.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """Novo UUIDv7, estritamente crescente dentro do processo."""
+    global _last_ms, _counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big")
+
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            # Contador inicia em um valor aleatório da metade inferior,
+            # deixando espaço para incrementos no mesmo milissegundo
+            _last_ms, _counter = ms, random_bits >> (64 - _COUNTER_BITS + 1)
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                # Contador esgotado: avança o relógio lógico
+                _last_ms, _counter = _last_ms + 1, 0
+        ms, counter = _last_ms, _counter
+
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Novo identificador (UUIDv7) em texto, formato padrão 8-4-4-4-12."""
+    return str(uuid7())
+
+
+def is_valid_id(value: str) -> bool:
+    """Indica se o texto é um UUID válido (de qualquer versão)."""
+    try:
+        uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
@@ -0,0 +1,108 @@
+"""
+Configuração dos testes
+-----------------------
+
+As configurações (Settings) e o engine são lidos na importação de
+``src``: as variáveis de ambiente abaixo precisam ser definidas antes.
+Os testes usam um banco SQLite temporário, com group commit ativado.
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+_TMP_DIR = tempfile.mkdtemp(prefix="bank-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["GROUP_COMMIT_ENABLED"] = "true"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["BATCH_API_KEYS"] = "chave-de-teste"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.config.container import container  # noqa: E402
+from src.domain.aggregates.account import Account  # noqa: E402
+from src.domain.value_objects.cpf import CPF  # noqa: E402
+from src.domain.value_objects.money import Money  # noqa: E402
+from src.infrastructure.database.orm import init_db  # noqa: E402
+
+_cpf_seq = itertools.count(100000001)
+
+# Hash bcrypt fictício: as contas dos testes não fazem login
+PASSWORD_HASH = "$2b$04$" + "x" * 53
+
+
+def new_cpf() -> str:
+    """CPF válido e inédito (dígitos verificadores calculados)."""
+    digits = [int(d) for d in f"{next(_cpf_seq):09d}"]
+    for size in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(size + 1, 1, -1)))
+        digits.append(total * 10 % 11 % 10)
+    return "".join(map(str, digits))
+
+
+@pytest.fixture(scope="session")
+def app_container():
+    """Contêiner da aplicação sobre o banco temporário."""
+    init_db()
+    yield container
+    container.group_commit_writer().shutdown()
+    container.hasher().shutdown()
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def new_account(app_container):
+    """Conta nova, ainda não gravada (sem passar pelo bcrypt)."""
+
+    def _new(cpf: str = "") -> Account:
+        customer = app_container.customer_repo().create(
+            name="Teste",
+            email="teste@example.com",
+            cpf=CPF(cpf or new_cpf()),
+            password_hash=PASSWORD_HASH,
+        )
+        return Account.open(customer)
+
+    return _new
+
+
+@pytest.fixture
+def open_account(app_container, new_account):
+    """
+    Abre uma conta e devolve o seu account_id. Com ``balance``, deposita
+    o valor inicial.
+    """
+
+    def _open(balance: str = "") -> str:
+        account = new_account()
+        if balance:
+            account.deposit(Money(balance), datetime.utcnow())
+        app_container.account_repo().save(account)
+        return account.account_id
+
+    return _open
+
+
+@pytest.fixture
+def client(app_container):
+    """
+    Cliente HTTP da aplicação, sem o lifespan: os workers em segundo
+    plano (outbox, snapshots) não são iniciados.
+    """
+    from src.api.main import create_app
+
+    return TestClient(create_app(), raise_server_exceptions=False)
+
+
+@pytest.fixture
+def auth_headers(app_container):
+    """Cabeçalho Authorization com um token de sessão da conta."""
+
+    def _headers(account_id: str) -> dict:
+        return {"Authorization": f"Bearer {app_container.token_service().issue(account_id)}"}
+
+    return _headers
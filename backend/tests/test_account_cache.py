@@ -0,0 +1,88 @@
+"""
+Cache de contas
+---------------
+
+Dentro de um Unit of Work o novo estado só chega ao cache depois do
+commit (e nunca após um rollback); uma gravação rejeitada invalida a
+entrada; e o cache não troca uma versão mais nova por uma mais antiga.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.application.use_cases.make_transfer import TransferCommand
+from src.domain.exceptions import ConcurrentModificationError
+from src.domain.value_objects.money import Money
+from src.infrastructure.repositories.account_repo_cached import AccountCache
+from src.infrastructure.repositories.unit_of_work_sqlite import UnitOfWorkSQLite
+
+
+@pytest.fixture
+def cache(app_container):
+    cache = app_container.account_cache()
+    assert isinstance(cache, AccountCache), "ACCOUNT_CACHE_SIZE deve estar ativo nos testes"
+    return cache
+
+
+def test_transfer_publishes_new_state_after_commit(app_container, cache, open_account):
+    source, target = open_account("100.00"), open_account()
+    repo = app_container.account_repo()
+    # Aquece o cache com o estado anterior
+    assert repo.get_by_id(source).balance == Money("100.00")
+    assert repo.get_by_id(target).balance == Money("0.00")
+
+    app_container.transfer_uc().execute(TransferCommand(source, target, "30.00"))
+
+    assert cache.get(source).balance == Money("70.00")
+    assert cache.get(target).balance == Money("30.00")
+    assert repo.get_by_id(source).version == cache.get(source).version
+
+
+def test_uncommitted_state_is_never_cached(cache, open_account):
+    account_id = open_account("50.00")
+    uow = UnitOfWorkSQLite(account_cache=cache)
+
+    with pytest.raises(RuntimeError):
+        with uow:
+            account = uow.accounts.get_for_update([account_id])[account_id]
+            account.deposit(Money("25.00"), datetime.utcnow())
+            uow.accounts.save(account)
+            # Ainda não confirmado: nada publicado
+            assert cache.get(account_id) is None
+            raise RuntimeError("rollback")
+
+    assert cache.get(account_id) is None
+    # A próxima leitura vem do banco, com o saldo anterior
+    uow = UnitOfWorkSQLite(account_cache=cache)
+    with uow:
+        assert uow.accounts.get_for_update([account_id])[account_id].balance.amount == Decimal("50.00")
+
+
+def test_rejected_save_invalidates_entry(app_container, cache, open_account):
+    account_id = open_account("10.00")
+    repo = app_container.account_repo()
+    stale = repo.get_by_id(account_id)
+
+    fresh = repo.get_by_id(account_id)
+    fresh.deposit(Money("1.00"), datetime.utcnow())
+    repo.save(fresh)
+
+    stale.deposit(Money("5.00"), datetime.utcnow())
+    with pytest.raises(ConcurrentModificationError):
+        repo.save(stale)
+
+    assert cache.get(account_id) is None
+    assert repo.get_by_id(account_id).balance == Money("11.00")
+
+
+def test_older_version_does_not_replace_newer(app_container, cache, open_account):
+    account_id = open_account("10.00")
+    current = app_container.account_repo().get_by_id(account_id)
+
+    cache.put(replace(current, version=current.version + 1, balance=Money("99.00")))
+    cache.put(current)
+
+    assert cache.get(account_id).balance == Money("99.00")
@@ -0,0 +1,108 @@
+"""
+Números de conta e violações de unicidade
+-----------------------------------------
+
+Um número de conta disputado com um cadastro concorrente faz o INSERT
+ser repetido; CPF duplicado vira erro de negócio; qualquer outra
+violação de integridade é repassada sem alteração.
+"""
+
+import pytest
+from sqlalchemy import exc, literal
+
+from src.infrastructure.repositories.account_import_repo_sqlite import (
+    AccountImportRepositorySQLite,
+)
+from src.infrastructure.repositories.account_repo_sqlite import (
+    ACCOUNT_NUMBER_ATTEMPTS,
+    AccountRepositorySQLite,
+)
+
+
+def _integrity_error(message: str) -> exc.IntegrityError:
+    return exc.IntegrityError("INSERT INTO accountmodel ...", {}, Exception(message))
+
+
+@pytest.fixture
+def colliding_numbers(monkeypatch, open_account):
+    """
+    Faz as ``n`` primeiras chamadas de next_account_number devolverem um
+    número já usado, como se outro cadastro o tivesse confirmado antes.
+    """
+    open_account()  # garante que o número 1 existe
+    original = AccountRepositorySQLite.next_account_number
+    calls = []
+
+    def install(n: int):
+        def fake():
+            calls.append(1)
+            return literal(1) if len(calls) <= n else original()
+
+        monkeypatch.setattr(AccountRepositorySQLite, "next_account_number", staticmethod(fake))
+        return calls
+
+    return install
+
+
+def test_colliding_account_number_is_retried(colliding_numbers, new_account):
+    calls = colliding_numbers(1)
+    account = new_account()
+
+    AccountRepositorySQLite().save(account)
+
+    assert len(calls) == 2
+    assert account.account_number.number > 1
+    saved = AccountRepositorySQLite().get_by_id(account.account_id)
+    assert saved.account_number == account.account_number
+
+
+def test_collision_gives_up_after_max_attempts(colliding_numbers, new_account):
+    calls = colliding_numbers(ACCOUNT_NUMBER_ATTEMPTS)
+    account = new_account()
+
+    with pytest.raises(exc.IntegrityError, match="account_number"):
+        AccountRepositorySQLite().save(account)
+    assert len(calls) == ACCOUNT_NUMBER_ATTEMPTS
+    assert AccountRepositorySQLite().get_by_id(account.account_id) is None
+
+
+def test_duplicate_cpf_is_a_business_error(new_account):
+    first = new_account()
+    AccountRepositorySQLite().save(first)
+
+    with pytest.raises(ValueError, match="CPF já cadastrado"):
+        AccountRepositorySQLite().save(new_account(first.customer.cpf.value))
+    with pytest.raises(ValueError, match="CPF já cadastrado"):
+        AccountImportRepositorySQLite().insert_many([new_account(first.customer.cpf.value)])
+
+
+@pytest.mark.parametrize(
+    "message, column",
+    [
+        ("UNIQUE constraint failed: accountmodel.customer_cpf", "customer_cpf"),
+        ('Key (account_number)=(7) already exists.', "account_number"),
+        ("NOT NULL constraint failed: accountmodel.customer_name", None),
+    ],
+)
+def test_unique_violation_names_the_column(message, column):
+    assert AccountRepositorySQLite.unique_violation(_integrity_error(message)) == column
+
+
+def test_other_integrity_errors_are_reraised(new_account):
+    error = _integrity_error("NOT NULL constraint failed: accountmodel.customer_name")
+
+    with pytest.raises(exc.IntegrityError) as raised:
+        AccountRepositorySQLite.check_insert_error(new_account(), error, attempt=0)
+    assert raised.value is error
+
+
+def test_import_numbers_accounts_in_sequence(new_account, open_account):
+    open_account()
+    accounts = [new_account() for _ in range(3)]
+
+    AccountImportRepositorySQLite().insert_many(accounts)
+
+    numbers = [a.account_number.number for a in accounts]
+    assert numbers == list(range(numbers[0], numbers[0] + 3))
+    assert all(a.version == 1 and not a.events for a in accounts)
+    assert AccountRepositorySQLite().get_by_id(accounts[1].account_id).account_number.number == numbers[1]
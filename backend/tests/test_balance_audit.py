@@ -0,0 +1,134 @@
+"""
+Snapshots e replay do ledger
+----------------------------
+
+O replay reproduz as regras da conta (saldo e contadores de saque
+diário); o estado reconstruído a partir de um snapshot é o mesmo do
+replay completo; e a auditoria compara o saldo gravado com o do ledger.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlmodel import Session
+
+from src.application.use_cases.audit_balance import AuditBalanceUseCase
+from src.application.use_cases.make_deposit import DepositCommand
+from src.application.use_cases.make_withdrawal import WithdrawalCommand
+from src.domain.entities.transaction import DEPOSIT, WITHDRAWAL, Transaction
+from src.domain.services.ledger_replay import LedgerState, replay
+from src.domain.value_objects.money import Money
+from src.infrastructure.database.models.account_model import AccountModel
+from src.infrastructure.database.orm import engine
+from src.infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite
+from src.infrastructure.repositories.account_snapshot_repo_sqlite import (
+    AccountSnapshotRepositorySQLite,
+)
+from src.infrastructure.services.snapshot_compactor import SnapshotCompactor
+
+BATCH_HEADERS = {"X-API-Key": "chave-de-teste"}
+
+
+def _ledger(account_id, day):
+    moment = datetime.combine(day, datetime.min.time())
+    return [
+        Transaction.record(account_id, DEPOSIT, Money("100.00"), moment),
+        Transaction.record(account_id, WITHDRAWAL, Money("10.50"), moment + timedelta(hours=1)),
+        Transaction.record(account_id, WITHDRAWAL, Money("0.25"), moment + timedelta(hours=2)),
+        # Dia seguinte: os contadores de saque recomeçam
+        Transaction.record(account_id, WITHDRAWAL, Money("5.00"), moment + timedelta(days=1)),
+    ]
+
+
+def _movements(app_container, account_id):
+    app_container.deposit_uc().execute(DepositCommand(account_id, "40.00"))
+    app_container.withdrawal_uc().execute(WithdrawalCommand(account_id, "7.30"))
+    app_container.deposit_uc().execute(DepositCommand(account_id, "0.05"))
+
+
+def test_replay_applies_account_rules():
+    day = datetime(2026, 3, 1).date()
+    ledger = _ledger("conta", day)
+
+    state = replay(LedgerState(account_id="conta"), ledger)
+
+    assert state.balance == Money("84.25")
+    assert state.ledger_count == 4
+    assert state.daily_withdrawal_amount == Money("5.00")
+    assert state.daily_withdrawal_count == 1
+    assert state.last_withdrawal_date == day + timedelta(days=1)
+    assert state.last_transaction_id == ledger[-1].transaction_id
+
+    # Partir de um estado intermediário dá o mesmo resultado
+    assert replay(replay(LedgerState(account_id="conta"), ledger[:2]), ledger[2:]) == state
+    # Sem lançamentos, o estado não muda
+    assert replay(state, []) is state
+
+
+def test_state_from_snapshot_matches_full_replay(app_container, open_account):
+    account_id = open_account("100.00")
+    _movements(app_container, account_id)
+    snapshots = AccountSnapshotRepositorySQLite(batch_size=2)
+
+    full = snapshots.load_state(account_id)
+    assert full.balance == Money("132.75")
+    assert full.ledger_count == 4
+
+    assert snapshots.save_snapshot(full)
+    # Um snapshot que não avança é descartado
+    assert not snapshots.save_snapshot(full)
+
+    _movements(app_container, account_id)
+    after = snapshots.load_state(account_id)
+
+    assert after.balance == Money("165.50")
+    assert after.ledger_count == 7
+    assert after == AccountSnapshotRepositorySQLite(batch_size=500).load_state(account_id)
+    account = AccountRepositorySQLite().get_by_id(account_id)
+    assert (after.daily_withdrawal_amount, after.daily_withdrawal_count) == (
+        account.daily_withdrawal_amount,
+        account.daily_withdrawal_count,
+    )
+
+
+def test_compactor_snapshots_accounts_due(app_container, open_account):
+    busy, quiet = open_account("10.00"), open_account()
+    _movements(app_container, busy)
+    snapshots = AccountSnapshotRepositorySQLite()
+    compactor = SnapshotCompactor(snapshots, every_transactions=3, settle=0, batch_size=1000)
+
+    assert busy in snapshots.accounts_due(3, timedelta(days=1), 1000)
+    assert quiet not in snapshots.accounts_due(3, timedelta(days=1), 1000)
+
+    assert compactor.compact_once() >= 1
+    assert busy not in snapshots.accounts_due(3, timedelta(days=1), 1000)
+
+
+def test_audit_reports_balance_against_ledger(app_container, client, open_account):
+    account_id = open_account("100.00")
+    _movements(app_container, account_id)
+    url = f"/accounts/{account_id}/audit"
+
+    assert client.get(url).status_code == 403
+    response = client.get(url, headers=BATCH_HEADERS)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["consistent"] is True
+    assert body["ledger_count"] == 4
+    assert body["balance"] == body["ledger_balance"]
+
+    # Saldo gravado divergente do ledger
+    with Session(engine) as session:
+        session.execute(
+            update(AccountModel)
+            .where(AccountModel.account_id == account_id)
+            .values(balance=AccountModel.balance + 1)
+        )
+        session.commit()
+    audit = AuditBalanceUseCase(
+        AccountRepositorySQLite(), AccountSnapshotRepositorySQLite()
+    ).execute(account_id)
+
+    assert not audit.consistent
+    assert audit.balance == Money("133.75")
+    assert audit.ledger_balance == Money("132.75")
@@ -0,0 +1,113 @@
+"""
+Escritas concorrentes
+---------------------
+
+Transferências nos dois sentidos, depósitos e saques simultâneos sobre
+as mesmas contas (Unit of Work, locks por conta e group commit), e o
+isolamento de uma gravação que falha dentro de um lote do group commit.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from src.application.use_cases.change_withdrawal_limits import ChangeWithdrawalLimitsCommand
+from src.application.use_cases.make_deposit import DepositCommand
+from src.application.use_cases.make_transfer import TransferCommand
+from src.application.use_cases.make_withdrawal import WithdrawalCommand
+from src.domain.entities.transaction import DEPOSIT
+from src.domain.value_objects.money import Money
+from src.infrastructure.database.orm import engine
+from src.infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite
+from src.infrastructure.repositories.transaction_repo_sqlite import TransactionRepositorySQLite
+
+def _stored_balance(account_id: str) -> Decimal:
+    # Leitura direta do banco, sem o cache de contas
+    return AccountRepositorySQLite().get_by_id(account_id).balance.amount
+
+
+def _ledger_sum(account_id: str) -> Decimal:
+    total = Decimal("0.00")
+    for transaction in TransactionRepositorySQLite().iter_by_account(account_id):
+        amount = transaction.amount.amount
+        total += amount if transaction.type == DEPOSIT else -amount
+    return total
+
+
+def test_concurrent_transfers_keep_balances_equal_to_ledger(app_container, open_account):
+    a = open_account()
+    b = open_account()
+    for account_id in (a, b):
+        app_container.limits_uc().execute(
+            ChangeWithdrawalLimitsCommand(account_id, daily_amount="1000000.00", daily_count=10_000)
+        )
+        app_container.deposit_uc().execute(DepositCommand(account_id, "1000.00"))
+
+    operations = (
+        [lambda: app_container.transfer_uc().execute(TransferCommand(a, b, "7.35"))] * 60
+        + [lambda: app_container.transfer_uc().execute(TransferCommand(b, a, "3.10"))] * 60
+        + [lambda: app_container.deposit_uc().execute(DepositCommand(a, "2.00"))] * 20
+        + [lambda: app_container.withdrawal_uc().execute(WithdrawalCommand(b, "1.50"))] * 20
+    )
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(op) for op in operations]
+        for future in futures:
+            future.result()
+
+    expected_a = Decimal("1000.00") - 60 * Decimal("7.35") + 60 * Decimal("3.10") + 20 * Decimal("2.00")
+    expected_b = Decimal("1000.00") + 60 * Decimal("7.35") - 60 * Decimal("3.10") - 20 * Decimal("1.50")
+
+    assert _stored_balance(a) == expected_a
+    assert _stored_balance(b) == expected_b
+    assert _ledger_sum(a) == expected_a
+    assert _ledger_sum(b) == expected_b
+
+
+def test_failed_write_in_group_commit_batch_keeps_the_others(app_container, open_account):
+    writer = app_container.group_commit_writer()
+    ok_1, failing, ok_2 = (open_account() for _ in range(3))
+
+    reader = AccountRepositorySQLite()
+    accounts = {account_id: reader.get_by_id(account_id) for account_id in (ok_1, failing, ok_2)}
+    for account in accounts.values():
+        account.deposit(Money("10.00"), datetime.utcnow())
+
+    def failing_write(repo):
+        # Grava saldo e lançamento e só então falha: o SAVEPOINT desfaz tudo
+        repo.save(accounts[failing])
+        raise RuntimeError("falha simulada")
+
+    # Ocupa a thread escritora para que as três gravações entrem no mesmo lote
+    started, release = threading.Event(), threading.Event()
+    blocker = writer.submit(lambda repo: (started.set(), release.wait()))
+    assert started.wait(timeout=5)
+
+    commits = []
+    listener = lambda connection: commits.append(connection)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    try:
+        first = writer.submit(lambda repo: repo.save(accounts[ok_1]))
+        broken = writer.submit(failing_write)
+        second = writer.submit(lambda repo: repo.save(accounts[ok_2]))
+        release.set()
+
+        blocker.result(timeout=5)
+        first.result(timeout=5)
+        second.result(timeout=5)
+        with pytest.raises(RuntimeError, match="falha simulada"):
+            broken.result(timeout=5)
+    finally:
+        event.remove(engine, "commit", listener)
+
+    # Lote do bloqueio + um único lote com as três gravações
+    assert len(commits) == 2
+
+    for account_id in (ok_1, ok_2):
+        assert _stored_balance(account_id) == Decimal("10.00")
+        assert _ledger_sum(account_id) == Decimal("10.00")
+    assert _stored_balance(failing) == Decimal("0.00")
+    assert _ledger_sum(failing) == Decimal("0.00")
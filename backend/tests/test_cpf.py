@@ -0,0 +1,100 @@
+"""
+Validação de CPF: escalar e em lote
+-----------------------------------
+
+cpf_batch deve aceitar e canonicalizar exatamente os mesmos CPFs que o
+value object CPF, inclusive com formatação, espaços, dígitos repetidos
+e caracteres fora do ASCII.
+"""
+
+import random
+
+import pytest
+
+from src.domain.value_objects.cpf import CPF
+from src.shared.utils.cpf_batch import canonical_cpfs, validate_cpfs
+
+VALID = "52998224725"
+
+
+def _with_check_digits(base: str) -> str:
+    digits = [int(d) for d in base]
+    for size in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(size + 1, 1, -1)))
+        digits.append(total * 10 % 11 % 10)
+    return "".join(map(str, digits))
+
+
+def _scalar(value: str):
+    """(canônico, válido) segundo o value object."""
+    try:
+        return CPF(value).value, True
+    except ValueError:
+        return None, False
+
+
+def _samples():
+    rng = random.Random(2026)
+    samples = [
+        VALID,
+        "529.982.247-25",
+        " 529.982.247-25 ",
+        "529 982 247 25",
+        "529982247-26",  # dígito verificador errado
+        "11111111111",
+        "111.111.111-11",
+        "5299822472",
+        "529982247250",
+        "5299822472a",
+        "",
+        "abc",
+        "５２９９８２２４７２５",  # dígitos de largura total
+        "٥٢٩٩٨٢٢٤٧٢٥",  # dígitos arábicos
+    ]
+    for _ in range(500):
+        cpf = _with_check_digits("".join(rng.choice("0123456789") for _ in range(9)))
+        kind = rng.randrange(4)
+        if kind == 1:
+            cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        elif kind == 2:
+            i = rng.randrange(len(cpf))
+            cpf = cpf[:i] + str((int(cpf[i]) + rng.randrange(1, 10)) % 10) + cpf[i + 1:]
+        elif kind == 3:
+            cpf = cpf[: rng.randrange(len(cpf))]
+        samples.append(cpf)
+    return samples
+
+
+def test_batch_matches_scalar_validation():
+    samples = _samples()
+
+    canonical, valid = canonical_cpfs(samples)
+
+    for value, batch_cpf, batch_valid in zip(samples, canonical, valid):
+        scalar_cpf, scalar_valid = _scalar(value)
+        assert bool(batch_valid) == scalar_valid, value
+        if scalar_valid:
+            assert str(batch_cpf) == scalar_cpf, value
+    assert validate_cpfs(samples).tolist() == valid.tolist()
+    # A amostra cobre os dois lados
+    assert 0 < valid.sum() < len(samples)
+
+
+def test_empty_batch():
+    canonical, valid = canonical_cpfs([])
+    assert canonical.size == 0 and valid.size == 0
+
+
+@pytest.mark.parametrize("value", [VALID, "529.982.247-25", "529 982 247 25"])
+def test_cpf_is_stored_in_canonical_form(value):
+    cpf = CPF(value)
+
+    assert cpf.value == VALID
+    assert str(cpf) == "529.982.247-25"
+    assert cpf == CPF(VALID)
+
+
+@pytest.mark.parametrize("value", ["11111111111", "52998224726", "5299822472", ""])
+def test_invalid_cpf_is_rejected(value):
+    with pytest.raises(ValueError, match="CPF inválido"):
+        CPF(value)
@@ -0,0 +1,93 @@
+"""
+Cache de credenciais verificadas
+--------------------------------
+
+Logins repetidos com a mesma senha dispensam o bcrypt; senha errada,
+troca de senha, invalidação e TTL vencido voltam a exigir a verificação.
+"""
+
+import pytest
+
+from src.application.ports.password_hasher import IPasswordHasher
+from src.application.use_cases.login import LoginCommand, LoginUseCase
+from src.infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite
+from src.infrastructure.services.credential_cache import VerifiedCredentialCache
+from src.shared.utils.ttl_cache import TTLCache
+
+CPF = "52998224725"
+HASH = "$2b$04$hash-da-senha"
+
+
+class CountingHasher(IPasswordHasher):
+    """Hasher de teste: aceita apenas "senha-certa" e conta as verificações."""
+
+    def __init__(self):
+        self.verifications = 0
+
+    def hash(self, plain: str) -> str:
+        return HASH
+
+    def hash_many(self, plains):
+        return [HASH for _ in plains]
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        self.verifications += 1
+        return plain == "senha-certa"
+
+    async def hash_async(self, plain: str) -> str:
+        return HASH
+
+    async def verify_async(self, plain: str, hashed: str) -> bool:
+        return self.verify(plain, hashed)
+
+
+def test_remembered_credential_is_verified():
+    cache = VerifiedCredentialCache()
+    cache.remember(CPF, HASH, "senha-certa")
+
+    assert cache.is_verified(CPF, HASH, "senha-certa")
+    assert not cache.is_verified(CPF, HASH, "senha-errada")
+    assert not cache.is_verified("11144477735", HASH, "senha-certa")
+
+
+def test_password_change_and_invalidation_require_verification():
+    cache = VerifiedCredentialCache()
+    cache.remember(CPF, HASH, "senha-certa")
+
+    # Novo hash (troca de senha): a impressão digital não confere mais
+    assert not cache.is_verified(CPF, "$2b$04$outro-hash", "senha-certa")
+
+    cache.invalidate(CPF)
+    assert not cache.is_verified(CPF, HASH, "senha-certa")
+
+
+def test_entries_expire_after_ttl():
+    now = [1000.0]
+    cache = TTLCache(max_entries=10, ttl=300.0, clock=lambda: now[0])
+    cache.set(CPF, b"impressao")
+
+    now[0] += 299
+    assert cache.get(CPF) == b"impressao"
+    now[0] += 2
+    assert cache.get(CPF) is None
+
+
+def test_repeated_login_skips_the_hasher(app_container, open_account):
+    account_id = open_account()
+    cpf = AccountRepositorySQLite().get_by_id(account_id).customer.cpf.value
+    hasher = CountingHasher()
+    login = LoginUseCase(
+        account_repo=app_container.account_repo(),
+        hasher=hasher,
+        credential_cache=VerifiedCredentialCache(),
+        token_service=app_container.token_service(),
+    )
+
+    for _ in range(3):
+        assert login.execute(LoginCommand(cpf, "senha-certa")).account_id == account_id
+    assert hasher.verifications == 1
+
+    # Senha errada nunca é respondida pelo cache
+    with pytest.raises(ValueError, match="CPF ou senha inválidos"):
+        login.execute(LoginCommand(cpf, "senha-errada"))
+    assert hasher.verifications == 2
@@ -0,0 +1,138 @@
+"""
+Importação de contas em massa
+-----------------------------
+
+Leitura de CSV/NDJSON com registros malformados, motivos de rejeição do
+ImportAccountsUseCase e o relatório de rejeitados da CLI.
+"""
+
+import csv
+import io
+
+from src.application.use_cases.import_accounts import ImportRow
+from src.cli import import_accounts as cli
+from src.domain.value_objects.cpf import CPF
+from src.infrastructure.repositories.account_repo_sqlite import AccountRepositorySQLite
+
+from conftest import PASSWORD_HASH, new_cpf
+
+
+def _read(reader, text: str):
+    rejected = []
+    rows = list(reader(io.StringIO(text, newline=""), rejected.append))
+    return rows, rejected
+
+
+def test_read_csv_reports_malformed_rows():
+    text = (
+        "name,email,cpf,password\n"
+        "Ana,ana@example.com,52998224725,segredo1\n"
+        "Bia,bia@example.com,11144477735,segredo2,coluna-extra\n"
+        "Caio,caio@example.com\n"
+        '"Davi\nSilva",davi@example.com,39053344705,segredo3\n'
+    )
+
+    rows, rejected = _read(cli.read_csv, text)
+
+    assert [(r.line, r.name) for r in rows] == [(2, "Ana"), (6, "Davi\nSilva")]
+    assert [(r.line, r.cpf, r.reason) for r in rejected] == [
+        (3, "", "Número de colunas diferente do cabeçalho"),
+        (4, "", "Número de colunas diferente do cabeçalho"),
+    ]
+    # Nenhuma senha no relatório
+    assert all("segredo" not in r.reason for r in rejected)
+
+
+def test_read_csv_reports_parser_errors_and_continues():
+    limit = csv.field_size_limit(20)
+    try:
+        text = (
+            "name,email,cpf,password\n"
+            f"Ana,{'a' * 30}@example.com,52998224725,segredo1\n"
+            "Bia,b@example.com,11144477735,segredo2\n"
+        )
+        rows, rejected = _read(cli.read_csv, text)
+    finally:
+        csv.field_size_limit(limit)
+
+    assert [r.name for r in rows] == ["Bia"]
+    assert [r.line for r in rejected] == [2]
+    assert rejected[0].reason.startswith("Linha CSV inválida")
+
+
+def test_read_ndjson_reports_invalid_records():
+    text = (
+        '{"name": "Ana", "email": "ana@example.com", "cpf": "52998224725", "password": "x"}\n'
+        "\n"
+        "{quebrado\n"
+        "[1, 2]\n"
+    )
+
+    rows, rejected = _read(cli.read_ndjson, text)
+
+    assert [r.line for r in rows] == [1]
+    assert [(r.line, r.reason) for r in rejected] == [
+        (3, "Registro JSON inválido"),
+        (4, "Registro JSON inválido"),
+    ]
+
+
+def test_use_case_rejects_with_reasons(app_container, open_account):
+    existing = AccountRepositorySQLite().get_by_id(open_account()).customer.cpf.value
+    fresh, hashed, repeated = new_cpf(), new_cpf(), new_cpf()
+    rows = [
+        ImportRow(1, "Ana", "ana@example.com", fresh, password="segredo1"),
+        ImportRow(2, "Bia", "bia@example.com", "123", password="segredo1"),
+        ImportRow(3, "", "sem-nome@example.com", new_cpf(), password="segredo1"),
+        ImportRow(4, "Caio", "caio@example.com", existing, password="segredo1"),
+        ImportRow(5, "Davi", "davi@example.com", repeated, password="segredo1"),
+        ImportRow(6, "Davi", "davi@example.com", repeated, password="segredo1"),
+        ImportRow(7, "Eva", "eva@example.com", new_cpf(), password_hash="$1$md5$legado"),
+        ImportRow(8, "Fábio", "fabio@example.com", hashed, password_hash=PASSWORD_HASH),
+        ImportRow(9, "Gil", "gil@example.com", new_cpf(), password="123"),
+    ]
+    rejected = []
+
+    use_case = app_container.import_accounts_uc()
+    use_case.chunk_size = 4
+    progress = use_case.execute(rows, on_rejected=rejected.append)
+
+    assert (progress.processed, progress.imported, progress.rejected) == (9, 3, 6)
+    assert [(r.line, r.reason) for r in rejected] == [
+        (2, "CPF inválido"),
+        (3, "Nome e e-mail são obrigatórios"),
+        (4, "Já existe uma conta com este CPF."),
+        (6, "CPF repetido no arquivo"),
+        (7, "Hash de senha não suportado (apenas bcrypt)"),
+        (9, "Password must be at least 6 characters"),
+    ]
+
+    customers = app_container.customer_repo()
+    assert customers.get_by_cpf(CPF(fresh)).password_hash.startswith("$2b$")
+    # Hash do sistema de origem gravado sem novo hash
+    assert customers.get_by_cpf(CPF(hashed)).password_hash == PASSWORD_HASH
+    assert customers.get_by_cpf(CPF(repeated)) is not None
+
+
+def test_cli_writes_rejected_report(app_container, tmp_path):
+    cpf = new_cpf()
+    source = tmp_path / "clientes.csv"
+    source.write_text(
+        "name,email,cpf,password_hash\n"
+        f"Ana,ana@example.com,{cpf},{PASSWORD_HASH}\n"
+        f"Bia,bia@example.com,{cpf},{PASSWORD_HASH}\n"
+        "Caio,caio@example.com\n",
+        encoding="utf-8",
+    )
+    report = tmp_path / "rejeitados.csv"
+
+    assert cli.main([str(source), "--rejected", str(report)]) == 0
+
+    with open(report, newline="", encoding="utf-8") as f:
+        lines = list(csv.reader(f))
+    assert lines[0] == ["line", "cpf", "reason"]
+    assert sorted(lines[1:]) == [
+        ["3", cpf, "CPF repetido no arquivo"],
+        ["4", "", "Número de colunas diferente do cabeçalho"],
+    ]
+    assert app_container.customer_repo().get_by_cpf(CPF(cpf)) is not None
@@ -0,0 +1,82 @@
+"""
+Valores monetários em centavos
+------------------------------
+
+Money converte a entrada uma única vez (arredondamento half-even) e
+opera sobre centavos inteiros; as operações vetorizadas de money_arrays
+dão os mesmos resultados, inclusive quando a soma não cabe em int64.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+import numpy as np
+import pytest
+
+from src.domain.value_objects.money import Money
+from src.shared.utils import money_arrays
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [
+        ("10.00", "10.00"),
+        ("0,10", "0.10"),
+        (0.1, "0.10"),
+        (7, "7.00"),
+        (Decimal("-3.5"), "-3.50"),
+        # Half-even, como Decimal.quantize
+        ("1.005", "1.00"),
+        ("1.015", "1.02"),
+        ("1.0051", "1.01"),
+    ],
+)
+def test_amount_is_rounded_to_cents(amount, expected):
+    money = Money(amount)
+
+    assert money.amount == Decimal(expected)
+    assert str(money.amount) == expected
+    assert money.cents == int(Decimal(expected) * 100)
+
+
+@pytest.mark.parametrize("amount", ["NaN", "Infinity", Decimal("-Infinity")])
+def test_non_finite_amount_is_rejected(amount):
+    with pytest.raises(InvalidOperation):
+        Money(amount)
+
+
+def test_arithmetic_is_exact():
+    # 0.1 + 0.2 em float não é 0.3; em centavos é
+    assert Money(0.1) + Money(0.2) == Money("0.30")
+    assert Money("0.30") - Money("0.10") == Money("0.20")
+    assert Money.total([Money("0.01")] * 1000) == Money("10.00")
+    assert Money("1.00") < Money("1.01") <= Money("1.01")
+    assert Money.from_cents(12345).amount == Decimal("123.45")
+    assert str(Money.from_cents(5).amount) == "0.05"
+    assert repr(Money("1234.5")) == "R$1234,50"
+
+
+def test_arrays_match_money_operations():
+    amounts = [Money("10.50"), "0,05", Decimal("1.005"), 3]
+    cents = money_arrays.to_cents(amounts)
+
+    assert cents.dtype == np.int64
+    assert cents.tolist() == [a.cents if isinstance(a, Money) else Money(a).cents for a in amounts]
+    assert money_arrays.total(cents) == Money.total(Money.from_cents(int(c)) for c in cents)
+    assert money_arrays.total(cents[:0]) == Money("0.00")
+
+    assert money_arrays.compare(cents, Money("3.00")).tolist() == [1, -1, -1, 0]
+    assert money_arrays.compare(cents, cents).tolist() == [0, 0, 0, 0]
+    assert money_arrays.exceeds(cents, Money("1.00")).tolist() == [True, False, False, True]
+
+    signed = np.array([1000, -250, 5], dtype=np.int64)
+    assert money_arrays.running_balance(Money("1.00"), signed).tolist() == [1100, 850, 855]
+
+
+def test_total_falls_back_to_python_ints_on_overflow():
+    big = np.iinfo(np.int64).max // 2 + 1
+    cents = np.array([big, big, big], dtype=np.int64)
+
+    # A soma em int64 daria a volta; o fallback é exato
+    assert int(cents.sum()) != 3 * big
+    assert money_arrays.total(cents).cents == 3 * big
+    assert money_arrays.total(-cents).cents == -3 * big
@@ -0,0 +1,113 @@
+"""
+Outbox e dispatcher
+-------------------
+
+Eventos gravados junto com a conta chegam aos sinks; cada mensagem é
+reivindicada por um único dispatcher até a concessão vencer; falhas
+liberam a concessão e contam tentativas até ``max_attempts``.
+"""
+
+from datetime import datetime
+from typing import List
+
+import pytest
+from sqlalchemy import update
+from sqlmodel import Session
+
+from src.application.ports.event_sink import IEventSink
+from src.application.ports.outbox_repository import OutboxMessage
+from src.infrastructure.database.models.outbox_model import OutboxModel
+from src.infrastructure.database.orm import engine
+from src.infrastructure.repositories.outbox_repo_sqlite import OutboxRepositorySQLite
+from src.infrastructure.services.outbox_dispatcher import OutboxDispatcher
+
+
+class RecordingSink(IEventSink):
+    """Sink de teste: guarda os lotes recebidos ou falha sob demanda."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches: List[List[OutboxMessage]] = []
+
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        if self.fail:
+            raise RuntimeError("sink indisponível")
+        self.batches.append(messages)
+
+    @property
+    def event_types(self) -> List[str]:
+        return [m.event_type for batch in self.batches for m in batch]
+
+
+@pytest.fixture
+def outbox(app_container):
+    """Outbox SQLite sem pendências deixadas por outros testes."""
+    with Session(engine) as session:
+        session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.dispatched_at.is_(None))
+            .values(dispatched_at=datetime.utcnow())
+        )
+        session.commit()
+    return OutboxRepositorySQLite()
+
+
+def test_dispatch_delivers_events_and_marks_them(outbox, open_account):
+    account_id = open_account("10.00")
+    sink = RecordingSink()
+    dispatcher = OutboxDispatcher(outbox, [sink])
+
+    assert dispatcher.dispatch_once() == 2
+    assert sink.event_types == ["account_opened", "deposit_made"]
+    assert {m.account_id for m in sink.batches[0]} == {account_id}
+
+    # Entregues não voltam a ser reivindicadas
+    assert dispatcher.dispatch_once() == 0
+    assert outbox.claim_pending("outro", 10, 10, 60) == []
+
+
+def test_claimed_messages_are_not_handed_to_another_dispatcher(outbox, open_account):
+    for _ in range(3):
+        open_account("1.00")
+
+    first = outbox.claim_pending("worker-a", 4, 10, 60)
+    second = outbox.claim_pending("worker-b", 10, 10, 60)
+
+    assert len(first) == 4 and len(second) == 2
+    assert not {m.id for m in first} & {m.id for m in second}
+    assert outbox.claim_pending("worker-c", 10, 10, 60) == []
+
+
+def test_expired_lease_can_be_claimed_again(outbox, open_account):
+    open_account()
+
+    claimed = outbox.claim_pending("worker-a", 10, 10, lease_seconds=-1)
+
+    # O dono sumiu sem marcar o lote: vencida a concessão, outro assume
+    reclaimed = outbox.claim_pending("worker-b", 10, 10, 60)
+    assert [m.id for m in reclaimed] == [m.id for m in claimed]
+
+
+def test_failure_releases_claim_and_counts_attempts(outbox, open_account):
+    open_account()
+    failing = OutboxDispatcher(outbox, [RecordingSink(fail=True)], max_attempts=2)
+
+    assert failing.dispatch_once() == 0
+    assert failing.dispatch_once() == 0
+    # Esgotadas as tentativas, a mensagem não é mais reivindicada
+    assert failing.dispatch_once() == 0
+    assert outbox.claim_pending("outro", 10, 2, 60) == []
+
+    with Session(engine) as session:
+        row = session.query(OutboxModel).filter(OutboxModel.dispatched_at.is_(None)).one()
+    assert row.attempts == 2
+    assert row.claimed_by is None and row.claimed_until is None
+
+    # Com um limite maior, a mesma mensagem volta a ser entregue
+    sink = RecordingSink()
+    assert OutboxDispatcher(outbox, [sink], max_attempts=3).dispatch_once() == 1
+    assert sink.event_types == ["account_opened"]
+
+
+def test_each_dispatcher_has_its_own_owner(outbox):
+    assert OutboxDispatcher(outbox, []).owner != OutboxDispatcher(outbox, []).owner
@@ -0,0 +1,49 @@
+"""
+Hash de senhas
+--------------
+
+O IPasswordHasher é o único caminho de hash e verificação: usa os rounds
+de Settings.bcrypt_rounds, roda no pool de processos e o domínio apenas
+carrega o hash pronto.
+"""
+
+import asyncio
+
+from src.config.settings import settings
+from src.domain.entities.customer import Customer
+from src.domain.value_objects import password
+
+
+def test_hash_uses_configured_rounds_and_verifies(app_container):
+    hasher = app_container.hasher()
+
+    hashed = hasher.hash("minhasenha123")
+
+    assert hashed.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert hasher.verify("minhasenha123", hashed)
+    assert not hasher.verify("outrasenha", hashed)
+
+
+def test_async_hash_and_verify(app_container):
+    hasher = app_container.hasher()
+
+    async def scenario():
+        hashed = await hasher.hash_async("minhasenha123")
+        return await hasher.verify_async("minhasenha123", hashed)
+
+    assert asyncio.run(scenario())
+
+
+def test_password_is_truncated_to_72_bytes(app_container):
+    hasher = app_container.hasher()
+    hashed = hasher.hash("a" * 72 + "ignorado")
+
+    assert hasher.verify("a" * 72, hashed)
+
+
+def test_domain_only_carries_the_hash():
+    customer = Customer.create("Maria", "maria@example.com", "52998224725", "$2b$04$hash")
+
+    assert customer.password_hash == "$2b$04$hash"
+    # Nenhum contexto bcrypt próprio no domínio
+    assert not hasattr(password, "pwd_context")
@@ -0,0 +1,101 @@
+"""
+Extrato paginado por cursor
+---------------------------
+
+Codificação do cursor, ordem das páginas (inclusive com lançamentos no
+mesmo instante) e a resposta da API a um cursor inválido.
+"""
+
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.application.ports.transaction_repository import InvalidCursor
+from src.domain.entities.transaction import DEPOSIT, Transaction
+from src.domain.value_objects.money import Money
+from src.infrastructure.repositories.transaction_repo_sqlite import (
+    TransactionRepositorySQLite,
+    decode_cursor,
+    encode_cursor,
+)
+from src.shared.utils.uuid_generator import new_id
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def test_cursor_round_trip():
+    position = (datetime(2026, 1, 2, 3, 4, 5, 678901), new_id())
+    assert decode_cursor(encode_cursor(*position)) == position
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "zzz",
+        "",
+        "não-é-base64",
+        _b64("sem separador"),
+        _b64(f"ontem|{new_id()}"),
+        _b64("2026-01-01T00:00:00|nao-e-um-id"),
+    ],
+)
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(InvalidCursor, match="Cursor de paginação inválido."):
+        decode_cursor(cursor)
+
+
+def test_pages_follow_chronological_order_with_ties(open_account):
+    account_id = open_account()
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    # Três lançamentos no mesmo instante: desempate pelo transaction_id
+    instants = [start, start + timedelta(seconds=1)] + [start + timedelta(seconds=2)] * 3 + [
+        start + timedelta(seconds=3),
+        start + timedelta(seconds=4),
+    ]
+    ledger = [
+        Transaction.record(account_id, DEPOSIT, Money("1.00"), occurred_at)
+        for occurred_at in reversed(instants)
+    ]
+    repo = TransactionRepositorySQLite()
+    repo.add_many(ledger)
+    expected = [
+        t.transaction_id for t in sorted(ledger, key=lambda t: (t.occurred_at, t.transaction_id))
+    ]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = repo.list_by_account(account_id, limit=3, cursor=cursor)
+        seen += [t.transaction_id for t in page.transactions]
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 3
+
+    # O caminho por tuplas usa o mesmo cursor e a mesma ordem
+    rows, cursor = [], None
+    while True:
+        page = repo.list_rows_by_account(account_id, limit=3, cursor=cursor)
+        rows += [row[0] for row in page.rows]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert rows == expected
+
+
+def test_statement_with_malformed_cursor_is_a_client_error(client, open_account, auth_headers):
+    account_id = open_account("10.00")
+
+    response = client.get(
+        f"/transactions/{account_id}/statement",
+        params={"cursor": "zzz"},
+        headers=auth_headers(account_id),
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cursor de paginação inválido."}
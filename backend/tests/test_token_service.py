@@ -0,0 +1,81 @@
+"""
+Tokens de sessão (HMAC)
+-----------------------
+
+Verificação, expiração, adulteração, rotação de chaves e a exigência do
+token nas rotas de transações.
+"""
+
+import pytest
+
+from src.application.ports.token_service import InvalidTokenError
+from src.infrastructure.services.token_service import HMACTokenService
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_issued_token_verifies_until_expiry():
+    clock = Clock()
+    service = HMACTokenService(["segredo"], ttl=60, clock=clock)
+    token = service.issue("conta-1")
+
+    claims = service.verify(token)
+    assert claims.subject == "conta-1"
+    assert claims.expires_at == clock.now + 60
+
+    clock.now += 59
+    assert service.verify(token).subject == "conta-1"
+    clock.now += 1
+    with pytest.raises(InvalidTokenError, match="expirado"):
+        service.verify(token)
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    [
+        lambda t: t[:-2] + ("AA" if not t.endswith("AA") else "BB"),  # assinatura
+        lambda t: t.replace("conta-1", "conta-2"),  # outra conta
+        lambda t: t.rsplit(".", 2)[0] + ".9999999999." + t.rsplit(".", 1)[1],  # expiração
+    ],
+)
+def test_tampered_token_is_rejected(tamper):
+    service = HMACTokenService(["segredo"], ttl=60)
+    with pytest.raises(InvalidTokenError, match="Assinatura"):
+        service.verify(tamper(service.issue("conta-1")))
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b", "kid.conta.nao-numero.sig"])
+def test_malformed_token_is_rejected(token):
+    with pytest.raises(InvalidTokenError):
+        HMACTokenService(["segredo"]).verify(token)
+
+
+def test_key_rotation_keeps_old_tokens_valid():
+    old = HMACTokenService(["antigo"], ttl=60)
+    token = old.issue("conta-1")
+
+    rotated = HMACTokenService(["novo", "antigo"], ttl=60)
+    assert rotated.verify(token).subject == "conta-1"
+    # Novos tokens são assinados pela primeira chave
+    assert old.issue("x").split(".")[0] != rotated.issue("x").split(".")[0]
+
+    retired = HMACTokenService(["novo"], ttl=60)
+    with pytest.raises(InvalidTokenError, match="chave desconhecida"):
+        retired.verify(token)
+
+
+def test_transaction_routes_require_owner_token(client, open_account, auth_headers):
+    account_id = open_account("10.00")
+    other_id = open_account()
+    url = f"/transactions/{account_id}/statement"
+
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers={"Authorization": "Bearer lixo"}).status_code == 401
+    assert client.get(url, headers=auth_headers(other_id)).status_code == 403
+    assert client.get(url, headers=auth_headers(account_id)).status_code == 200